@@ -69,8 +69,9 @@ CREATE INDEX IF NOT EXISTS idx_articles_category_name ON articles (category_name
 CREATE INDEX IF NOT EXISTS idx_news_sources_name ON news_sources (name);
 CREATE INDEX IF NOT EXISTS idx_news_sources_is_enabled ON news_sources (is_enabled);
 
-CREATE INDEX IF NOT EXISTS idx_browsing_history_article_id ON browsing_history (article_id);
 CREATE INDEX IF NOT EXISTS idx_browsing_history_view_time ON browsing_history (view_time);
+-- 每次浏览去重时按文章查最新一条历史 (WHERE article_id = ? ORDER BY view_time DESC LIMIT 1)；前导列也覆盖按 article_id 的查询
+CREATE INDEX IF NOT EXISTS idx_browsing_history_article_view_time ON browsing_history (article_id, view_time);
 
 CREATE INDEX IF NOT EXISTS idx_llm_analyses_timestamp ON llm_analyses (analysis_timestamp);
 CREATE INDEX IF NOT EXISTS idx_llm_analyses_type ON llm_analyses (analysis_type);
@@ -93,6 +93,9 @@ def main() -> NoReturn:
             "data_dir": os.path.join(project_root, "data"), # 添加数据目录路径
             "config": os.path.join(project_root, "config", "settings.ini") # 示例配置文件路径
         },
+        "llm": {
+            "min_analysis_chars": 40 # 正文+摘要少于该字符数的新闻不发送给 LLM 分析，0 表示不限制
+        },
         # 其他配置...
     })
     # logger.warning("使用了临时默认配置注入容器，请后续完善配置加载逻辑！") # Commented out warning
@@ -4,6 +4,8 @@
 提供默认的RSS新闻源列表，按标准类别组织。
 """
 
+from functools import lru_cache
+
 from .categories import STANDARD_CATEGORIES
 
 def get_default_rss_sources(): # 重命名函数
@@ -11,8 +13,14 @@ def get_default_rss_sources(): # 重命名函数
     获取默认的 RSS 新闻源列表
 
     Returns:
-        list: 包含预设 RSS 新闻源信息的字典列表
+        list: 包含预设 RSS 新闻源信息的字典列表 (每次返回新的字典副本，调用方可自由修改)
     """
+    return [dict(source) for source in _default_rss_source_table()]
+
+
+@lru_cache(maxsize=None)
+def _default_rss_source_table():
+    """预设源在运行期不变：只构造并过滤一次，结果以元组缓存"""
     # 只返回 RSS 源
     all_sources = [
         # 综合新闻
@@ -323,7 +331,7 @@ def get_default_rss_sources(): # 重命名函数
         # --- 东方财富 ---
     ]
     # 只返回 RSS 源
-    return [s for s in all_sources if s.get('type', 'rss') == 'rss']
+    return tuple(s for s in all_sources if s.get('type', 'rss') == 'rss')
 
 
 # 移除 initialize_sources 函数，因为 SourceManager 会直接使用 get_default_rss_sources
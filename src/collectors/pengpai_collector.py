@@ -28,6 +28,7 @@ import platform # 需要导入 platform
 import subprocess # 需要导入 subprocess
 from datetime import datetime, timedelta
 import threading # Add this import
+from collections import OrderedDict
 
 from src.models import NewsSource
 from src.collectors.pengpai import DEFAULT_PENGPAI_CONFIG # IMPORT ADDED
@@ -47,6 +48,12 @@ class PengpaiCollector(QObject): # 继承 QObject 以使用信号
     _is_webdriver_initialized = False
     _lock = threading.Lock()
 
+    # 详情页抓取结果的 LRU 缓存 (URL -> detail_data)。收集器每次刷新都会新建实例，
+    # 因此放在类上共享；已抓取过的文章再次出现在列表中时无需重新启动 Selenium 加载页面
+    DETAIL_CACHE_SIZE = 128
+    _detail_cache: "OrderedDict[str, Dict]" = OrderedDict()
+    _detail_cache_lock = threading.Lock()
+
     def __init__(self):
         super().__init__() # 调用父类构造函数
         self.logger = logging.getLogger('news_analyzer.collectors.pengpai')
@@ -262,16 +269,24 @@ class PengpaiCollector(QObject): # 继承 QObject 以使用信号
 
                     processed_links.add(link) # 添加到已处理集合
 
-                    # 获取详情页信息，传递选择器配置
-                    self.logger.info(f"准备为链接调用 _fetch_detail: {absolute_link}")
-                    detail_data = self._fetch_detail(absolute_link, source.custom_config if isinstance(source.custom_config, dict) else {}, source.name)
-                    self.logger.info(f"_fetch_detail 调用返回，内容长度: {len(detail_data.get('content', '')) if detail_data.get('content') else 'None'}") # 添加调用后日志
+                    # 获取详情页信息，传递选择器配置 (命中缓存时跳过 Selenium 抓取)
+                    detail_data = self._get_cached_detail(absolute_link)
+                    from_cache = detail_data is not None
+                    if from_cache:
+                        self.logger.debug(f"详情页缓存命中: {absolute_link}")
+                    else:
+                        self.logger.info(f"准备为链接调用 _fetch_detail: {absolute_link}")
+                        detail_data = self._fetch_detail(absolute_link, source.custom_config if isinstance(source.custom_config, dict) else {}, source.name)
+                        self.logger.info(f"_fetch_detail 调用返回，内容长度: {len(detail_data.get('content', '')) if detail_data.get('content') else 'None'}") # 添加调用后日志
 
                     # 如果获取详情失败（例如内容为空或出错），则跳过此条新闻
                     if not detail_data.get('content') or "失败" in detail_data.get('content', "") or "无效" in detail_data.get('content', ""):
                          self.logger.warning(f"获取详情页 {absolute_link} 失败或内容无效，将终止抓取澎湃新闻源 '{source.name}' 的本次剩余文章。错误信息: {detail_data.get('content')}")
                          break # 修改：不再继续尝试该源的其他文章
 
+                    if not from_cache:
+                        self._store_cached_detail(absolute_link, detail_data)
+
                     news_item = {
                         'title': title,
                         'link': absolute_link,
@@ -285,8 +300,9 @@ class PengpaiCollector(QObject): # 继承 QObject 以使用信号
                     news_items.append(news_item)
                     self.logger.debug(f"提取到新闻: Title='{title[:30]}...', Link='{absolute_link}', Date='{news_item['pub_date']}', Content Length={len(news_item['content']) if news_item['content'] else 0}")
 
-                    # 添加延时，避免请求过快
-                    time.sleep(0.5) # 休眠 0.5 秒
+                    # 添加延时，避免请求过快 (缓存命中没有发出请求，无需等待)
+                    if not from_cache:
+                        time.sleep(0.5) # 休眠 0.5 秒
 
                 except Exception as item_e:
                     self.logger.error(f"处理单个新闻链接时出错: {item_e}", exc_info=False)
@@ -300,6 +316,25 @@ class PengpaiCollector(QObject): # 继承 QObject 以使用信号
         self.logger.info(f"DEBUG - PengpaiCollector: collect 方法完成，最终返回 {len(news_items)} 条新闻。前 3 条: {news_items[:3]}") # DEBUG LOG
         return news_items
 
+    @classmethod
+    def _get_cached_detail(cls, url: str) -> Optional[Dict]:
+        """返回缓存的详情页数据副本，未命中返回 None"""
+        with cls._detail_cache_lock:
+            cached = cls._detail_cache.get(url)
+            if cached is None:
+                return None
+            cls._detail_cache.move_to_end(url)
+            return dict(cached)
+
+    @classmethod
+    def _store_cached_detail(cls, url: str, detail_data: Dict):
+        """缓存抓取成功的详情页数据，超出容量时淘汰最久未使用的条目"""
+        with cls._detail_cache_lock:
+            cls._detail_cache[url] = dict(detail_data)
+            cls._detail_cache.move_to_end(url)
+            while len(cls._detail_cache) > cls.DETAIL_CACHE_SIZE:
+                cls._detail_cache.popitem(last=False)
+
     def _fetch_detail(self, url: str, selector_config: Dict, source_name: str) -> Dict:
         """
         使用 Selenium 获取并解析新闻详情页，提取发布日期、正文等。
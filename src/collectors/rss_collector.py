@@ -9,6 +9,7 @@ import time
 import ssl
 import re
 import socket
+import threading
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 import xml.etree.ElementTree as ET
@@ -17,6 +18,7 @@ from src.models import NewsSource
 import feedparser
 from datetime import datetime, timezone, timedelta
 import requests
+import requests.adapters
 from dateutil import parser as dateutil_parser
 
 from .base_collector import BaseCollector
@@ -46,6 +48,45 @@ class RSSCollector(BaseCollector):
     """
     # 定义 User-Agent
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 NewsAnalyzer/1.0'
+    # (连接超时, 读取超时)，单位秒
+    REQUEST_TIMEOUT = (10, 30)
+    # 连接池大小，与 RefreshRunnable 的并发抓取线程数相当
+    POOL_MAXSIZE = 32
+
+    # 所有 RSSCollector 实例共享的 HTTP 会话 (keep-alive 连接复用)，首次使用时创建
+    _shared_session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """返回共享的 requests.Session，使并发刷新的各个源复用连接池"""
+        if cls._shared_session is None:
+            with cls._session_lock:
+                if cls._shared_session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=cls.POOL_MAXSIZE,
+                                                            pool_maxsize=cls.POOL_MAXSIZE)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers['User-Agent'] = cls.USER_AGENT
+                    cls._shared_session = session
+        return cls._shared_session
+
+    def _fetch_feed(self, url: str) -> feedparser.FeedParserDict:
+        """通过共享会话下载 feed 并交给 feedparser 解析。
+
+        网络错误时返回与 feedparser 自身抓取失败一致的结果 (bozo=1，无 status，无条目)。
+        """
+        try:
+            response = self._get_session().get(url, timeout=self.REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            self.logger.warning(f"请求 feed 失败 ({url}): {e}")
+            return feedparser.FeedParserDict(bozo=1, bozo_exception=e, entries=[])
+        feed_data = feedparser.parse(response.content, response_headers=dict(response.headers))
+        feed_data['status'] = response.status_code
+        feed_data['href'] = response.url
+        feed_data['headers'] = response.headers
+        return feed_data
 
     def __init__(self, config: Optional[Dict] = None):
         """初始化RSS收集器"""
@@ -88,7 +129,7 @@ class RSSCollector(BaseCollector):
             return result
 
         try:
-            feed_data = feedparser.parse(source.url, agent=self.USER_AGENT)
+            feed_data = self._fetch_feed(source.url)
 
             # Safely access 'status'
             status_code = feed_data.get('status')
@@ -140,7 +181,7 @@ class RSSCollector(BaseCollector):
 
         try:
             self.logger.debug(f"RSSCOLLECTOR_BEFORE_FEEDPARSER_PARSE: URL={source_url}") # MODIFIED: error -> debug
-            feed_data = feedparser.parse(source_url, agent=self.USER_AGENT)
+            feed_data = self._fetch_feed(source_url)
             
             # --- MODIFIED: Robust access to feed_data attributes ---
             feed_status = feed_data.get('status') # Use .get() for safer access
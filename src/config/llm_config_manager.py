@@ -89,7 +89,7 @@ class LLMConfigManager:
         Returns:
             Optional[Dict[str, Any]]: 包含配置信息的字典，如果找不到或配置为空，则返回 None。
                                       字典包含 'name', 'api_key', 'api_url', 'model',
-                                      'temperature', 'max_tokens', 'system_prompt', 'timeout' 等键。
+                                      'temperature', 'max_tokens', 'system_prompt', 'timeout', 'rpm', 'tpm' 等键。
         """
         """
         获取指定名称的配置详情。
@@ -122,6 +122,9 @@ class LLMConfigManager:
             "max_tokens": self.settings.value("max_tokens", 2048, type=int),
             "system_prompt": self.settings.value("system_prompt", "", type=str), # Kept for now, UI might re-add
             "timeout": self.settings.value("timeout", 60, type=int),
+            # 每分钟请求数 / token 数上限，0 表示不限流 (LLMService 据此创建 RateLimiter)
+            "rpm": self.settings.value("rpm", 0, type=int),
+            "tpm": self.settings.value("tpm", 0, type=int),
             "api_key": None, # Initialize API key as None
             "provider": None # Initialize provider as None
         }
@@ -1,5 +1,7 @@
 """依赖注入容器定义"""
 
+import os
+
 from dependency_injector import containers, providers
 
 # --- 导入配置和服务类 ---
@@ -10,6 +12,8 @@ from src.storage.news_storage import NewsStorage
 from src.llm.prompt_manager import PromptManager
 from src.utils.api_client import ApiClient
 from src.llm.llm_service import LLMService
+from src.llm.response_cache import ResponseCache
+from src.llm.semantic_cache import SemanticCache
 from src.core.source_manager import SourceManager
 from src.core.app_service import AppService
 from src.core.news_update_service import NewsUpdateService # Import NewsUpdateService
@@ -53,12 +57,25 @@ class Container(containers.DeclarativeContainer):
     # API 客户端: Singleton
     api_client = providers.Singleton(ApiClient)
 
+    # LLM 响应缓存: Singleton，持久化到数据目录；只缓存 temperature 为 0/未设置的确定性请求，
+    # 带随机性的分析 / 翻译每次重新生成
+    llm_response_cache = providers.Singleton(
+        ResponseCache,
+        db_path=providers.Callable(os.path.join, config.paths.data_dir, 'llm_response_cache.db')
+    )
+
+    # LLM 语义缓存: Singleton，仅在内存中保存，对不同信源的同一事件报道复用已有分析结果
+    llm_semantic_cache = providers.Singleton(SemanticCache)
+
     # LLM 服务: Singleton，注入其依赖项
     llm_service = providers.Singleton(
         LLMService,
         config_manager=llm_config_manager,
         prompt_manager=prompt_manager,
-        api_client=api_client
+        api_client=api_client,
+        response_cache=llm_response_cache,
+        semantic_cache=llm_semantic_cache,
+        min_analysis_chars=config.llm.min_analysis_chars  # 未配置时使用 LLMService 的默认阈值
         # override_* 参数可以在需要时通过 wiring 或直接调用 container.llm_service.override(...) 设置
     )
 
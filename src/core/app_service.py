@@ -8,6 +8,9 @@
 
 import logging
 import inspect
+import re
+from operator import itemgetter
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta, timezone # MODIFIED: Added timezone
 from dateutil import parser as dateutil_parser # Keep dateutil import for now
@@ -25,7 +28,6 @@ from src.storage.news_storage import NewsStorage
 from src.llm.llm_service import LLMService
 from src.core.source_manager import SourceManager # 导入 SourceManager (Use src. prefix for consistency)
 from src.config.llm_config_manager import LLMConfigManager # 修正文件名和类名
-from src.collectors.categories import get_category_name # Keep for category logic
 from src.core.news_update_service import NewsUpdateService # Import new service
 from src.core.analysis_service import AnalysisService # Import AnalysisService
 from src.core.history_service import HistoryService # Import HistoryService
@@ -37,6 +39,14 @@ from src.collectors.pengpai import DEFAULT_PENGPAI_CONFIG # Added for Pengpai co
 #     ...
 # --- End Helper Function ---
 
+# _convert_dict_to_article 读取的字段及其默认值 (顺序与 _ARTICLE_DICT_FIELDS 一致)
+_ARTICLE_DICT_DEFAULTS: Dict[str, Any] = {
+    'id': None, 'link': None, 'title': '无标题', 'source_name': '未知来源', 'publish_time': None,
+    'content': '', 'summary': '', 'image_url': None, 'author': None, 'language': 'unknown',
+    'category': '未分类', 'tags': None, 'created_at': None, 'updated_at': None,
+}
+_ARTICLE_DICT_FIELDS = itemgetter(*_ARTICLE_DICT_DEFAULTS)
+
 class AppService(QObject): # 继承 QObject 以便使用信号槽
     """应用程序服务层 (Refactored)
 
@@ -44,6 +54,15 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
     新闻刷新逻辑已移至 NewsUpdateService。
     """
 
+    # 日期解析快速路径：ISO 8601 (YYYY-MM-DD[T ]HH:MM:SS...) 与 RFC 822 (RSS pubDate)
+    _ISO_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
+    # RFC 822 只接受数字时区或 GMT/UT/UTC/Z：CST/EST 等具名时区在 email.utils 中按美国时区解释，
+    # 而中文信源的 "CST" 通常指 +08:00，这类字符串仍交给 dateutil (保持 naive，按本地时间处理)
+    _RFC822_DATETIME_RE = re.compile(
+        r'^[A-Za-z]{3}, \d{1,2} [A-Za-z]{3} \d{4} \d{2}:\d{2}(?::\d{2})? (?:[+-]\d{4}|GMT|UTC?|Z)$')
+    # 复用同一个 dateutil parser 实例，避免每次调用重新构建
+    _dateutil_parser = dateutil_parser.parser()
+
     # --- 信号定义 --- 
     # Signals related to data sources and general status
     sources_updated = pyqtSignal() # 新闻源列表发生变化
@@ -88,6 +107,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         # --- Attributes ---
         # self.news_sources: List[NewsSource] = [] # Managed by SourceManager
         self.news_cache: List[NewsArticle] = [] # --- 内存缓存 --- (Still maintained here)
+        self._cache_index_by_link: Dict[str, int] = {} # link -> news_cache 下标，随缓存增量维护
+        self._last_emitted_news_cache: Optional[List[NewsArticle]] = None # 上次经 news_cache_updated 发出的列表
         self.selected_article: Optional[NewsArticle] = None # +++ 新增属性，存储当前选中的文章 +++
         # self.collectors: Dict[str, object] = {} # Moved to NewsUpdateService
 
@@ -196,8 +217,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                         'source_name': updated_source_name,
                         'success': status == 'ok',
                         'status': status, # Pass the actual status string
-                        'message': error_message if status == 'error' else (source_obj.last_error if hasattr(source_obj, 'last_error') and source_obj.last_error else ''),
-                        'error_count': source_obj.consecutive_error_count if hasattr(source_obj, 'consecutive_error_count') else 0,
+                        'message': error_message if status == 'error' else (source_obj.last_error or ''),
+                        'error_count': source_obj.consecutive_error_count,
                         'check_time': last_checked_time.isoformat() if last_checked_time else None,
                         # Ensure all fields expected by _on_single_source_check_complete are present
                         # Original fields in _on_single_source_check_complete from result dict:
@@ -258,38 +279,34 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 self.logger.debug(f"加载并转换了 {len(initial_news_articles)} 条初始新闻")
 
                 # --- Assign categories based on source config ---
-                source_map = {source.name: source for source in self.source_manager.get_sources()}
+                # 分类名由 SourceManager 按来源缓存，避免对每篇文章重复调用 get_category_name
+                category_by_source = self.source_manager.get_category_name_map()
                 for article in initial_news_articles:
-                    source_config = source_map.get(article.source_name)
-                    if source_config:
-                        category_id = source_config.category
-                        article.category = get_category_name(category_id)
+                    if article.source_name in category_by_source:
+                        article.category = category_by_source[article.source_name]
                     else:
                         article.category = None
                         self.logger.warning(f"未找到来源 '{article.source_name}' 的配置，新闻 '{article.title[:20]}...' 将由后续逻辑进行分类。")
                 
-                # --- Load read status USING HistoryService ---
+                # --- Load read status USING HistoryService (one batched query) ---
+                read_links = set()
+                if self.history_service:
+                    read_links = self.history_service.get_read_links(
+                        [article.link for article in initial_news_articles if article.link])
                 read_count = 0
                 for article in initial_news_articles:
-                    try:
-                        if article.link:
-                            # Use HistoryService here!
-                            article.is_read = self.history_service.is_read(article.link)
-                            if article.is_read: read_count += 1
-                        else: article.is_read = False
-                    except Exception as read_e:
-                        self.logger.warning(f"检查已读状态失败 for '{article.title[:20]}...': {read_e}")
-                        article.is_read = False
+                    article.is_read = bool(article.link) and article.link in read_links
+                    if article.is_read: read_count += 1
                 self.logger.debug(f"已加载已读状态，其中 {read_count} 条标记为已读。")
                 # --- Update Cache and Emit Signal ---
-                self.news_cache = initial_news_articles # Update internal cache
+                self._set_news_cache(initial_news_articles) # Update internal cache
                 self.logger.debug(f"内存缓存已更新 (初始加载)，包含 {len(self.news_cache)} 条新闻")
                 self.logger.debug(f"_load_initial_news: Emitting news_cache_updated with {len(self.news_cache)} articles.")
                 self.news_cache_updated.emit(self.news_cache) # Emit the full cache
                 self.status_message_updated.emit(f"已加载 {len(self.news_cache)} 条历史新闻")
             else:
                 self.logger.debug("未找到历史新闻")
-                self.news_cache = [] # 确保缓存为空
+                self._set_news_cache([]) # 确保缓存为空
                 self.logger.debug(f"_load_initial_news: Emitting news_cache_updated with {len(self.news_cache)} articles (empty cache).")
                 self.news_cache_updated.emit(self.news_cache) # Emit empty cache
                 self.status_message_updated.emit("未找到历史新闻，请刷新")
@@ -303,6 +320,29 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.error(f"加载初始新闻失败: {e}", exc_info=True)
             self.status_message_updated.emit("加载历史新闻失败")
 
+    def _set_news_cache(self, articles: List[NewsArticle]):
+        """替换整个内存缓存，并同步重建 link -> 下标索引"""
+        self.news_cache = articles
+        self._cache_index_by_link = {article.link: i for i, article in enumerate(articles) if article.link}
+        self._last_emitted_news_cache = None # 缓存已整体替换，上次发出的列表不再可复用
+
+    def _get_cache_index(self) -> Dict[str, int]:
+        """返回 link -> 下标索引；若缓存被外部直接替换导致不一致，则重建"""
+        if len(self._cache_index_by_link) != len(self.news_cache):
+            self._set_news_cache(self.news_cache)
+        return self._cache_index_by_link
+
+    def _is_cached_unchanged(self, article: NewsArticle, cache_index: Dict[str, int]) -> bool:
+        """文章已在缓存中且标题、摘要、正文与缓存一致时返回 True (来源未提供的摘要/正文不视为变化)"""
+        idx = cache_index.get(article.link)
+        if idx is None:
+            return False
+        cached = self.news_cache[idx]
+        if article.title != cached.title:
+            return False
+        return all(new is None or new == old for new, old in ((article.summary, cached.summary),
+                                                               (article.content, cached.content)))
+
     def _handle_news_refreshed(self, source_name: str, news_items: List[Dict[str, Any]]):
         """处理从 NewsUpdateService.news_refreshed 信号传来的单个源的新闻条目。"""
         self.logger.info(f"--- AppService: _handle_news_refreshed 被调用！来源: '{source_name}', 条目数: {len(news_items)} ---") # +++ 新增日志 +++
@@ -313,13 +353,27 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
 
         self.logger.info(f"AppService: 从 '{source_name}' 接收到 {len(news_items)} 条新闻条目。准备处理...")
 
-        # +++ ADDED: Get source map for category lookup +++
-        source_map = {source.name: source for source in self.source_manager.get_sources()}
-        # +++ END ADDED +++
+        # 来源及其分类在整批条目中不变，循环外只查找一次
+        source_obj = self.source_manager.get_source_by_name(source_name)
+        if not source_obj:
+            self.logger.error(f"AppService [{source_name}]: Source object not found in SourceManager. Articles cannot be properly categorized.")
+            # Fallback category if source_obj is None, though this case should ideally not happen
+            # if sources are managed correctly.
+            article_category_for_db = "uncategorized"
+        else:
+            article_category_for_db = source_obj.category if source_obj.category and isinstance(source_obj.category, str) and source_obj.category.strip() else "uncategorized"
+
+        # 逐条日志只在 DEBUG 开启时格式化，避免大批量刷新时的 f-string 开销
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
         # 1. 转换原始字典为 NewsArticle 对象 (不含数据库 ID)
+        #    同一批次内按 link 去重，保留首次出现的条目，单次遍历完成
         articles_without_ids = []
+        seen_links = set()
         for item_dict in news_items:
+            item_link = item_dict.get('link')
+            if item_link in seen_links:
+                continue
             try:
                 # Ensure publish_time is correctly parsed to datetime if it's a string
                 # MODIFICATION START: Prioritize 'publish_time' (datetime object), then 'pub_date' (string)
@@ -330,25 +384,31 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 datetime_from_collector = item_dict.get('publish_time') # Expected to be a datetime object or None
                 date_str_from_collector = item_dict.get('pub_date')     # Expected to be a date string or None
 
-                self.logger.info(f"AppService [{source_name}]: Processing item '{article_title_for_log}...'. Link: {article_link_for_log}. Collector provided 'publish_time' (datetime): {datetime_from_collector} (type: {type(datetime_from_collector)}), 'pub_date' (str): {date_str_from_collector} (type: {type(date_str_from_collector)})")
+                if debug_enabled:
+                    self.logger.debug(f"AppService [{source_name}]: Processing item '{article_title_for_log}...'. Link: {article_link_for_log}. Collector provided 'publish_time' (datetime): {datetime_from_collector} (type: {type(datetime_from_collector)}), 'pub_date' (str): {date_str_from_collector} (type: {type(date_str_from_collector)})")
 
                 if isinstance(datetime_from_collector, datetime):
                     publish_time_dt = datetime_from_collector
-                    self.logger.info(f"AppService [{source_name}]: Using 'publish_time' (datetime object): {publish_time_dt} (tzinfo: {publish_time_dt.tzinfo}) for article '{article_title_for_log}...'")
+                    if debug_enabled:
+                        self.logger.debug(f"AppService [{source_name}]: Using 'publish_time' (datetime object): {publish_time_dt} (tzinfo: {publish_time_dt.tzinfo}) for article '{article_title_for_log}...'")
                     if publish_time_dt.tzinfo is None: # Ensure it's timezone-aware
                         publish_time_dt = publish_time_dt.replace(tzinfo=timezone.utc)
-                        self.logger.info(f"AppService [{source_name}]: Localized naive datetime object from 'publish_time' to UTC: {publish_time_dt} for '{article_title_for_log}...'")
+                        if debug_enabled:
+                            self.logger.debug(f"AppService [{source_name}]: Localized naive datetime object from 'publish_time' to UTC: {publish_time_dt} for '{article_title_for_log}...'")
                 
                 elif isinstance(date_str_from_collector, str) and date_str_from_collector.strip():
-                    self.logger.info(f"AppService [{source_name}]: 'publish_time' was not a datetime. Attempting to parse 'pub_date' string '{date_str_from_collector}' for article '{article_title_for_log}...'")
+                    if debug_enabled:
+                        self.logger.debug(f"AppService [{source_name}]: 'publish_time' was not a datetime. Attempting to parse 'pub_date' string '{date_str_from_collector}' for article '{article_title_for_log}...'")
                     try:
                         # Use dateutil_parser for robust parsing of various string formats
                         publish_time_dt = dateutil_parser.parse(date_str_from_collector, fuzzy=True) # fuzzy might help with slight variations
-                        self.logger.info(f"AppService [{source_name}]: Successfully parsed 'pub_date' string '{date_str_from_collector}' to datetime: {publish_time_dt} (type: {type(publish_time_dt)}) for '{article_title_for_log}...'")
+                        if debug_enabled:
+                            self.logger.debug(f"AppService [{source_name}]: Successfully parsed 'pub_date' string '{date_str_from_collector}' to datetime: {publish_time_dt} (type: {type(publish_time_dt)}) for '{article_title_for_log}...'")
 
                         if publish_time_dt and publish_time_dt.tzinfo is None:
                             publish_time_dt = publish_time_dt.replace(tzinfo=timezone.utc) # Assume UTC if naive
-                            self.logger.info(f"AppService [{source_name}]: Localized naive datetime from 'pub_date' string to UTC: {publish_time_dt} for '{article_title_for_log}...'")
+                            if debug_enabled:
+                                self.logger.debug(f"AppService [{source_name}]: Localized naive datetime from 'pub_date' string to UTC: {publish_time_dt} for '{article_title_for_log}...'")
 
                     except (ValueError, TypeError, OverflowError) as e_date_str_parse:
                         self.logger.warning(f"AppService [{source_name}]: Parsing 'pub_date' string '{date_str_from_collector}' FAILED for article '{article_title_for_log}...'. Error: {e_date_str_parse}. Setting publish_time_dt to None.")
@@ -361,17 +421,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 # MODIFICATION END
 
                 # 在创建 NewsArticle 对象前记录最终的 publish_time_dt
-                self.logger.info(f"AppService [{source_name}]: For article '{article_title_for_log}...', final publish_time_dt to be used for NewsArticle: {publish_time_dt} (type: {type(publish_time_dt)})")
-                
-                source_obj = self.source_manager.get_source_by_name(source_name)
-                
-                if not source_obj:
-                    self.logger.error(f"AppService [{source_name}]: Source object not found in SourceManager. Articles cannot be properly categorized.")
-                    # Fallback category if source_obj is None, though this case should ideally not happen
-                    # if sources are managed correctly.
-                    article_category_for_db = "uncategorized"
-                else:
-                    article_category_for_db = source_obj.category if source_obj.category and isinstance(source_obj.category, str) and source_obj.category.strip() else "uncategorized"
+                if debug_enabled:
+                    self.logger.debug(f"AppService [{source_name}]: For article '{article_title_for_log}...', final publish_time_dt to be used for NewsArticle: {publish_time_dt} (type: {type(publish_time_dt)})")
                 
                 # Convert to NewsArticle for cache and potential immediate use (though primarily we'll fetch from DB after this)
                 # The category used here is for the NewsArticle object instantiation.
@@ -389,6 +440,7 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 if not article.link: # Skip articles with no link
                     self.logger.warning(f"Skipping article with no link: {article.title}")
                     continue
+                seen_links.add(article.link)
                 articles_without_ids.append(article)
             except Exception as e_create:
                 self.logger.error(f"创建 NewsArticle 对象失败 for item: {item_dict.get('title', 'N/A')}. Error: {e_create}", exc_info=True)
@@ -399,6 +451,13 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self._emit_news_cache_updated_signal(source_name, 0)
             return
 
+        # 本批次文章均已在缓存中且标题/摘要/正文未变：跳过写库、回读与合并，直接复用上次发出的列表
+        cache_index = self._get_cache_index()
+        if all(self._is_cached_unchanged(art, cache_index) for art in articles_without_ids):
+            self.logger.info(f"来源 '{source_name}' 的 {len(articles_without_ids)} 条文章均已在缓存中且未变化，跳过保存与合并。")
+            self._emit_news_cache_updated_signal(source_name, 0, unchanged=True)
+            return
+
         # Convert NewsArticle objects to dictionaries for storage
         articles_to_store_as_dicts = []
         for article_obj in articles_without_ids:
@@ -425,63 +484,52 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         # 3. 从数据库根据链接重新获取这些文章，确保它们现在拥有数据库ID
         #    并过滤掉那些可能因为某种原因未成功插入或更新的文章
         links_of_processed_articles = [art.link for art in articles_without_ids if art.link]
-        articles_with_ids: List[NewsArticle] = []
+        articles_as_dicts_from_db: List[Dict[str, Any]] = []
         if links_of_processed_articles:
             try:
-                # NEW: Fetch as dicts then convert
+                # NEW: Fetch as dicts, converted while merging below
                 articles_as_dicts_from_db = self.storage.get_articles_by_links(links_of_processed_articles)
                 self.logger.info(f"AppService: 从数据库为来源 '{source_name}' 重新获取了 {len(articles_as_dicts_from_db)} 条文章 (字典格式)。")
-
-                converted_articles_with_ids: List[NewsArticle] = []
-                for db_dict in articles_as_dicts_from_db:
-                    article_obj = self._convert_dict_to_article(db_dict) # Use existing helper
-                    if article_obj:
-                        converted_articles_with_ids.append(article_obj)
-                    else:
-                        self.logger.warning(f"AppService: 未能将从数据库获取的字典转换为 NewsArticle 对象: {db_dict.get('link', 'N/A')}")
-                articles_with_ids = converted_articles_with_ids
-                self.logger.info(f"AppService: 成功将 {len(articles_with_ids)} 条数据库字典转换为 NewsArticle 对象。")
-
-                if len(articles_with_ids) != len(articles_without_ids): # This comparison might be less relevant now, more about successful conversion
-                    self.logger.warning(f"AppService: 数量不匹配！尝试 upsert {len(articles_without_ids)} 条，但重新获取到 {len(articles_with_ids)} 条带ID的文章 for '{source_name}'.")
-                    # Log missing links if any for debugging
-                    if len(articles_with_ids) < len(articles_without_ids):
-                        fetched_links = {art.link for art in articles_with_ids}
-                        missing_links = [link for link in links_of_processed_articles if link not in fetched_links]
-                        self.logger.warning(f"AppService: 未能从数据库取回以下链接的文章: {missing_links}")
-
             except Exception as e_db_fetch:
                 self.logger.error(f"AppService: 从数据库根据链接批量获取文章失败 for '{source_name}': {e_db_fetch}", exc_info=True)
-                # Proceed with empty list or potentially just the ones without IDs?
                 # For now, we will proceed and the cache update will reflect this issue.
-                articles_with_ids = [] # Fallback to empty to prevent further errors down the line if critical
-        
-        # 4. 更新内部缓存，并仅保留真正唯一的、带有ID的文章
+                articles_as_dicts_from_db = [] # Fallback to empty to prevent further errors down the line if critical
+
+        # 4. 转换并合并到内部缓存 (单次遍历：转换、判断新旧、计数在同一循环内完成)
         unique_new_articles_with_ids_count = 0
-        if articles_with_ids:
+        if articles_as_dicts_from_db:
             current_cache_size = len(self.news_cache)
-            # --- MODIFICATION START: Improved cache update logic ---
-            # Create a map of existing article links to their index in the cache for efficient lookup
-            cache_link_to_index_map = {cached_article.link: i for i, cached_article in enumerate(self.news_cache)}
-
-            for article_with_id in articles_with_ids:
-                if not article_with_id.link: # Should not happen if filtered earlier, but as a safeguard
+            # 使用持久维护的 link -> 下标索引做增量合并，无需每批重建整个映射
+            cache_link_to_index_map = self._get_cache_index()
+            merged_links = set()
+
+            for db_dict in articles_as_dicts_from_db:
+                article_with_id = self._convert_dict_to_article(db_dict) # Use existing helper
+                if not article_with_id:
+                    self.logger.warning(f"AppService: 未能将从数据库获取的字典转换为 NewsArticle 对象: {db_dict.get('link', 'N/A')}")
+                    continue
+                link = article_with_id.link
+                if not link: # Should not happen if filtered earlier, but as a safeguard
                     self.logger.warning(f"AppService: Article with ID {article_with_id.id} has no link, cannot process for cache update.")
                     continue
+                merged_links.add(link)
 
-                if article_with_id.link in cache_link_to_index_map:
+                existing_article_index = cache_link_to_index_map.get(link)
+                if existing_article_index is not None:
                     # Article already exists in cache, replace it with the potentially updated version
-                    existing_article_index = cache_link_to_index_map[article_with_id.link]
                     self.news_cache[existing_article_index] = article_with_id
-                    # self.logger.debug(f"AppService: Updated existing article in cache: {article_with_id.link}")
-                    # Not counted as "new" for the purpose of the signal count, but it is an update.
                 else:
                     # New article, add to cache
+                    cache_link_to_index_map[link] = len(self.news_cache)
                     self.news_cache.append(article_with_id)
-                    cache_link_to_index_map[article_with_id.link] = len(self.news_cache) - 1 # Update map for newly added item
                     unique_new_articles_with_ids_count += 1
-            # --- MODIFICATION END ---
-            
+
+            if len(merged_links) != len(articles_without_ids):
+                self.logger.warning(f"AppService: 数量不匹配！尝试 upsert {len(articles_without_ids)} 条，但合并了 {len(merged_links)} 条带ID的文章 for '{source_name}'.")
+                missing_links = [link for link in links_of_processed_articles if link not in merged_links]
+                if missing_links:
+                    self.logger.warning(f"AppService: 未能从数据库取回以下链接的文章: {missing_links}")
+
             self.logger.info(f"AppService: 为 '{source_name}' 将 {unique_new_articles_with_ids_count} 条唯一新文章（带ID）合并到缓存。缓存大小从 {current_cache_size} 变为 {len(self.news_cache)}.")
         else:
             self.logger.warning(f"AppService: 没有从数据库获取到带有ID的文章 for '{source_name}'，缓存未更新新条目。")
@@ -491,8 +539,12 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         self._emit_news_cache_updated_signal(source_name, unique_new_articles_with_ids_count)
         self.logger.info(f"AppService: 已为来源 '{source_name}' 发射 news_cache_updated 信号，新增文章数: {unique_new_articles_with_ids_count}")
 
-    def _emit_news_cache_updated_signal(self, source_name: str, count: int, error_message: Optional[str] = None):
-        """Helper method to emit news_cache_updated signal and log relevant info."""
+    def _emit_news_cache_updated_signal(self, source_name: str, count: int, error_message: Optional[str] = None, unchanged: bool = False):
+        """Helper method to emit news_cache_updated signal and log relevant info.
+
+        unchanged=True 表示缓存自上次发出后没有变化：重新发出同一个列表对象，
+        而不是复制出新列表，使下游可按对象身份跳过重建。
+        """
         if error_message:
             self.logger.error(f"Error during news processing for source '{source_name}': {error_message}. Emitting empty update.")
             # In case of error, we might still want to emit the current cache, 
@@ -503,7 +555,12 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.info(f"Emitting news_cache_updated for source '{source_name}'. New/updated articles from this source: {count}. Total cache size: {len(self.news_cache)}")
         
         # The news_cache_updated signal is defined to emit the ENTIRE cache list.
-        self.news_cache_updated.emit(list(self.news_cache)) # Ensure a copy is emitted
+        if unchanged and self._last_emitted_news_cache is not None \
+                and len(self._last_emitted_news_cache) == len(self.news_cache):
+            self.news_cache_updated.emit(self._last_emitted_news_cache)
+            return
+        self._last_emitted_news_cache = list(self.news_cache) # Ensure a copy is emitted
+        self.news_cache_updated.emit(self._last_emitted_news_cache)
 
     # --- News Refresh Methods (Delegated to NewsUpdateService) ---
     def refresh_all_sources(self):
@@ -528,22 +585,21 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.warning("_convert_dict_to_article: 输入的 item_dict 为空或非字典类型，跳过转换。")
             return None
 
-        article_id = item_dict.get('id')
-        link = item_dict.get('link')
-        title = item_dict.get('title', '无标题').strip()
-        source_name = item_dict.get('source_name', '未知来源')
-        
-        raw_publish_time_from_dict = item_dict.get('publish_time')
-        self.logger.debug(f"_convert_dict_to_article (来源: {source_name}, 标题: {title[:30]}...): 从字典获取的原始 'publish_time' 字段: '{raw_publish_time_from_dict}' (类型: {type(raw_publish_time_from_dict)})")
+        # 一次字典合并补齐默认值，再用 itemgetter 一次取出全部字段，代替逐个 .get
+        (article_id, link, title, source_name, raw_publish_time_from_dict, content, summary,
+         image_url, author, language, category, tags_str, created_at_str, updated_at_str) = \
+            _ARTICLE_DICT_FIELDS({**_ARTICLE_DICT_DEFAULTS, **item_dict})
+        title = title.strip()
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"_convert_dict_to_article (来源: {source_name}, 标题: {title[:30]}...): 从字典获取的原始 'publish_time' 字段: '{raw_publish_time_from_dict}' (类型: {type(raw_publish_time_from_dict)})")
 
         parsed_datetime = self._parse_datetime(raw_publish_time_from_dict) # 传递原始值给 _parse_datetime
 
-        content = item_dict.get('content', '')
         if not isinstance(content, str):
             self.logger.warning(f"Content for '{title}' is not a string ({type(content)}), setting to empty.")
             content = ''
         
-        summary = item_dict.get('summary', '')
         if not isinstance(summary, str): # 确保摘要是字符串
             self.logger.warning(f"Summary for '{title}' is not a string ({type(summary)}), setting to empty.")
             summary = ''
@@ -552,19 +608,12 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.warning(f"创建 NewsArticle 失败: 链接为空。字典: {item_dict}")
             return None
         
-        # 其他字段
-        image_url = item_dict.get('image_url')
-        author = item_dict.get('author')
-        language = item_dict.get('language', 'unknown') # 从字典获取或默认为 unknown
-        category = item_dict.get('category', '未分类') # 从字典获取或默认为 未分类
-        tags_str = item_dict.get('tags') # 假设 tags 在字典中是字符串
+        # 其他字段 (tags 在字典中是逗号分隔的字符串)
         tags = [tag.strip() for tag in tags_str.split(',')] if isinstance(tags_str, str) else []
         
         # 确保 created_at 和 updated_at 是 datetime 对象
-        created_at_str = item_dict.get('created_at')
         created_at = self._parse_datetime(created_at_str) if created_at_str else datetime.now(timezone.utc)
 
-        updated_at_str = item_dict.get('updated_at')
         updated_at = self._parse_datetime(updated_at_str) if updated_at_str else datetime.now(timezone.utc)
 
         try:
@@ -590,6 +639,23 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.error(f"在 _convert_dict_to_article 中创建 NewsArticle 对象失败: {e}. 字典: {item_dict}", exc_info=True)
             return None
 
+    def _fast_parse_datetime_string(self, date_string: str) -> Optional[datetime]:
+        """快速解析最常见的两种日期格式，无法识别时返回 None"""
+        if self._ISO_DATETIME_RE.match(date_string):
+            iso_string = date_string[:-1] + '+00:00' if date_string.endswith('Z') else date_string
+            try:
+                return datetime.fromisoformat(iso_string)
+            except ValueError:
+                return None
+        if self._RFC822_DATETIME_RE.match(date_string):
+            try:
+                dt = parsedate_to_datetime(date_string)
+            except (TypeError, ValueError):
+                return None
+            # 无时区 (或 -0000) 的情况交给 dateutil，保持原有的本地时区假设
+            return dt if dt.tzinfo is not None else None
+        return None
+
     def _parse_datetime(self, date_input: Optional[Any]) -> Optional[datetime]: # MODIFIED: Changed param name from date_string to date_input and type to Any
         # MODIFIED: Handle cases where date_input is already a datetime object
         if isinstance(date_input, datetime):
@@ -622,8 +688,10 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         date_string = date_input 
         self.logger.debug(f"_parse_datetime: 开始解析日期字符串: '{date_string}' (类型: {type(date_string)})")
         try:
-            # 尝试使用 dateutil.parser 进行智能解析 (优先)
-            dt = dateutil_parser.parse(date_string)
+            # 先走 ISO / RFC 822 快速路径，失败再交给 dateutil.parser 智能解析
+            dt = self._fast_parse_datetime_string(date_string)
+            if dt is None:
+                dt = self._dateutil_parser.parse(date_string)
             self.logger.debug(f"_parse_datetime: dateutil_parser.parse 成功，原始解析结果 dt: {dt} (时区: {dt.tzinfo})")
 
             # 标准化为 UTC 时间
@@ -764,7 +832,7 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 self.news_update_service.stop_all_operations()
 
 
-            if self.storage and hasattr(self.storage, 'close'):
+            if self.storage:
                 self.logger.info("正在关闭 NewsStorage...")
                 self.storage.close()
 
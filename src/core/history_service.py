@@ -6,7 +6,7 @@
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal as pyqtSignal
 from dataclasses import dataclass
@@ -42,8 +42,10 @@ class HistoryService(QObject):
             self.logger.warning("NewsStorage instance is None. HistoryService will run in degraded mode.")
         self.storage = storage
         self.logger.debug("HistoryService initialized.")
-        # Load read items on initialization (if needed, maybe handled elsewhere)
-        # self._read_items_links = set(self.storage.get_read_items_links())
+        # 已读链接的内存镜像：首次查询时从存储一次性加载，之后 is_read 只做集合查找
+        self._read_links: Optional[Set[str]] = None
+        # 文章 ID -> 最近一次浏览时间：重复浏览的去重判断只做字典查找，未命中时才查询存储
+        self._last_viewed: Dict[Any, datetime] = {}
 
     def mark_as_read(self, link: str):
         """
@@ -54,9 +56,16 @@ class HistoryService(QObject):
         """
         if not link or not self.storage:
             return
+        if self._read_links is not None and link in self._read_links:
+            # 已读文章再次打开时不再重复执行 UPDATE + commit
+            return
         try:
-            self.storage.add_read_item(link)
-            self.logger.debug(f"Marked item as read: {link}")
+            if not self.storage.add_read_item(link):
+                self.logger.warning("Failed to mark item as read: %s", link)
+                return
+            if self._read_links is not None:
+                self._read_links.add(link)
+            self.logger.debug("Marked item as read: %s", link)
         except Exception as e:
             self.logger.error(f"Error marking item as read ({link}): {e}", exc_info=True)
 
@@ -70,8 +79,12 @@ class HistoryService(QObject):
         if not link or not self.storage:
             return
         try:
-            self.storage.mark_item_as_unread(link)
-            self.logger.debug(f"Marked item as unread: {link}")
+            if not self.storage.mark_item_as_unread(link):
+                self.logger.warning("Failed to mark item as unread: %s", link)
+                return
+            if self._read_links is not None:
+                self._read_links.discard(link)
+            self.logger.debug("Marked item as unread: %s", link)
         except Exception as e:
             self.logger.error(f"Error marking item as unread ({link}): {e}", exc_info=True)
 
@@ -87,12 +100,49 @@ class HistoryService(QObject):
         """
         if not link or not self.storage:
             return False
+        read_links = self._get_read_link_set()
+        if read_links is not None:
+            return link in read_links
         try:
             return self.storage.is_item_read(link)
         except Exception as e:
             self.logger.error(f"Error checking read status for item ({link}): {e}", exc_info=True)
             return False
 
+    def get_read_links(self, links: List[str]) -> Set[str]:
+        """
+        批量检查已读状态，返回其中已读的链接集合。
+
+        Args:
+            links: 文章链接列表。
+
+        Returns:
+            已读文章链接的集合。
+        """
+        if not links or not self.storage:
+            return set()
+        read_links = self._get_read_link_set()
+        if read_links is not None:
+            return {link for link in links if link in read_links}
+        try:
+            return self.storage.get_read_links(links)
+        except Exception as e:
+            self.logger.error(f"Error checking read status for {len(links)} items: {e}", exc_info=True)
+            return set()
+
+    def _get_read_link_set(self) -> Optional[Set[str]]:
+        """返回已读链接集合，首次调用时从存储加载；加载失败返回 None，调用方退回逐条查询存储。"""
+        if self._read_links is None and self.storage:
+            try:
+                read_links = self.storage.get_all_read_links()
+                # 加载失败 (None) 时不缓存，下次调用重新尝试
+                if read_links is not None:
+                    self._read_links = set(read_links)
+                    self.logger.debug("Loaded %d read links into memory.", len(self._read_links))
+            except Exception as e:
+                self.logger.error(f"Error loading read links: {e}", exc_info=True)
+        return self._read_links
+
     def add_history_item(self, news_article: NewsArticle):
         """添加浏览历史记录。
 
@@ -111,13 +161,17 @@ class HistoryService(QObject):
 
             # 检查是否已存在相同的历史记录（避免短时间内重复添加）
             # 可以根据需要调整检查逻辑，例如只检查最近几分钟的记录
-            existing_record = self.storage.get_latest_history_by_article_id(article_id)
-            if existing_record and (timestamp - existing_record['view_time']).total_seconds() < 60: # 60秒内不重复添加
+            last_viewed = self._last_viewed.get(article_id)
+            if last_viewed is None:
+                existing_record = self.storage.get_latest_history_by_article_id(article_id)
+                last_viewed = existing_record['view_time'] if existing_record else None
+            if last_viewed and (timestamp - last_viewed).total_seconds() < 60: # 60秒内不重复添加
                 self.logger.debug(f"最近已记录过 Article ID: {article_id} 的浏览历史，跳过重复添加。")
                 return
 
             # 插入新的历史记录
-            self.storage.add_browsing_history(article_id, timestamp)
+            if self.storage.add_browsing_history(article_id, timestamp) is not None:
+                self._last_viewed[article_id] = timestamp
             self.logger.info(f"成功添加浏览历史记录: Article ID: {article_id}, Link: {news_article.link}")
 
             # 发射信号通知历史记录已更新
@@ -142,6 +196,7 @@ class HistoryService(QObject):
         """Clears all browsing history."""
         try:
             self.storage.clear_browsing_history()
+            self._last_viewed.clear()
             self.logger.info("Cleared all browsing history.")
             self.history_updated.emit() # Emit signal after clearing
         except Exception as e:
@@ -192,6 +247,7 @@ class HistoryService(QObject):
         try:
             db_id = int(history_item_id)
             self.storage.delete_browsing_history_item(history_id=db_id)
+            self._last_viewed.clear()
             self.logger.info(f"History item with ID '{history_item_id}' removed.")
             self.browsing_history_updated.emit()
         except ValueError:
@@ -211,6 +267,7 @@ class HistoryService(QObject):
         self.logger.debug("Attempting to clear all history items.")
         try:
             self.storage.clear_all_browsing_history()
+            self._last_viewed.clear()
             self.logger.info("All browsing history items have been cleared.")
             self.browsing_history_updated.emit()
         except Exception as e:
@@ -371,6 +371,11 @@ class NewsUpdateService(QObject):
 
 class RefreshRunnable(QRunnable):
     """QRunnable to handle the concurrent fetching of news sources."""
+    # 抓取为 I/O 密集型任务，线程数可以明显多于 CPU 核数
+    MAX_FETCH_WORKERS = 16
+    # 两次进度信号之间的最小间隔 (秒)，最后一个源完成时总会发射
+    PROGRESS_EMIT_INTERVAL = 0.1
+
     def __init__(self, collector_factory, sources_to_refresh, cancel_flag,
                  news_refreshed_signal, refresh_complete_signal,
                  status_message_updated_signal, source_refresh_progress_signal, # +++ ADD progress_signal PARAM +++
@@ -413,8 +418,8 @@ class RefreshRunnable(QRunnable):
         # For IO bound tasks, more threads can be beneficial.
         # Max workers should not exceed number of sources for this specific task.
         num_sources = len(self.sources_to_refresh)
-        # Max 8 workers, but no more than number of sources, and at least 1.
-        max_workers = min(max(1, num_sources), 8) # Limit to 8, or fewer if not many sources.
+        # Max MAX_FETCH_WORKERS workers, but no more than number of sources, and at least 1.
+        max_workers = min(max(1, num_sources), self.MAX_FETCH_WORKERS)
 
         try:
             self.logger.info(f"RefreshRunnable: 使用 {max_workers} 个工作线程进行并发获取。")
@@ -471,19 +476,23 @@ class RefreshRunnable(QRunnable):
                 self.logger.info(f"RefreshRunnable: 已提交 {len(futures)} 个任务，等待完成...")
                 processed_sources_count = 0
                 total_sources_to_process = len(futures) # Only count those successfully submitted
+                last_progress_emit_ts = 0.0
 
                 for future in as_completed(futures):
                     source_config = futures[future]
                     source_name = source_config.name
                     processed_sources_count += 1
                     
-                    # Emit progress to main UI or AppService
-                    current_progress_percentage = int((processed_sources_count / total_sources_to_process) * 100) if total_sources_to_process > 0 else 0
-                    if self.source_refresh_progress: # +++ CHECK IF SIGNAL EXISTS +++
-                        self.logger.debug(f"RefreshRunnable: Emitting source_refresh_progress for \'{source_name}\': {current_progress_percentage}%, processed {processed_sources_count}/{total_sources_to_process}")
-                        self.source_refresh_progress.emit(source_name, current_progress_percentage, total_sources_to_process, processed_sources_count)
-                    
-                    self.status_message_updated.emit(f"正在刷新: {source_name} ({processed_sources_count}/{total_sources_to_process})...")
+                    # Emit progress to main UI or AppService (节流：避免短时间内大量唤醒 GUI 线程)
+                    now_ts = time.monotonic()
+                    if processed_sources_count == total_sources_to_process or now_ts - last_progress_emit_ts >= self.PROGRESS_EMIT_INTERVAL:
+                        last_progress_emit_ts = now_ts
+                        current_progress_percentage = int((processed_sources_count / total_sources_to_process) * 100) if total_sources_to_process > 0 else 0
+                        if self.source_refresh_progress: # +++ CHECK IF SIGNAL EXISTS +++
+                            self.logger.debug(f"RefreshRunnable: Emitting source_refresh_progress for \'{source_name}\': {current_progress_percentage}%, processed {processed_sources_count}/{total_sources_to_process}")
+                            self.source_refresh_progress.emit(source_name, current_progress_percentage, total_sources_to_process, processed_sources_count)
+
+                        self.status_message_updated.emit(f"正在刷新: {source_name} ({processed_sources_count}/{total_sources_to_process})...")
 
 
                     if self._check_if_cancelled(f"处理结果 for {source_name}"):
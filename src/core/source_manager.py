@@ -1,6 +1,7 @@
 # src/core/source_manager.py
 import logging
 import json # 导入 json 模块
+import bisect
 from typing import List, Dict, Optional, Any # Added Any
 from datetime import datetime # 添加 datetime 导入
 # from PySide6.QtCore import QObject, Signal as pyqtSignal, QSettings, Qt # QSettings and Qt might be removable if not used elsewhere
@@ -10,6 +11,7 @@ from PySide6.QtCore import QObject, Signal as pyqtSignal, Qt # QSettings removed
 from src.models import NewsSource
 # 导入预设源获取函数
 from src.collectors.default_sources import get_default_rss_sources
+from src.collectors.categories import get_category_name
 from src.storage.news_storage import NewsStorage # Import NewsStorage
 
 logger = logging.getLogger('news_analyzer.core.source_manager')
@@ -34,6 +36,15 @@ class SourceManager(QObject):
         # self.settings = QSettings("NewsAnalyzer", "NewsAggregator") # QSettings might be removed
         self.storage = storage # Store NewsStorage instance
         self.news_sources: List[NewsSource] = []
+        # 源名称 -> 分类显示名 的缓存，源列表变化时失效
+        self._category_name_cache: Optional[Dict[str, str]] = None
+        self.sources_updated.connect(self._invalidate_category_names)
+        # 名称 / ID / URL -> 源 的查找索引，news_sources 被替换或增删后按需重建
+        self._indexed_sources: Optional[List[NewsSource]] = None
+        self._indexed_source_count: int = 0
+        self._sources_by_name: Dict[str, NewsSource] = {}
+        self._sources_by_id: Dict[int, NewsSource] = {}
+        self._sources_by_url: Dict[str, NewsSource] = {}
         
         self._load_sources_from_db() # Load sources first
         
@@ -110,6 +121,8 @@ class SourceManager(QObject):
             source_dicts_from_db = self.storage.get_all_news_sources()
             
             temp_sources_list: List[NewsSource] = []
+            # 预设源列表每次调用都会重新构造，这里每次加载只取一次并转成 (名称, URL) 集合 (数据库为空时无需读取)
+            default_rss_keys = {(ds['name'], ds['url']) for ds in get_default_rss_sources()} if source_dicts_from_db else set()
             for s_dict in source_dicts_from_db:
                 source_obj = self._create_news_source_from_dict(s_dict)
                 if source_obj:
@@ -118,15 +131,12 @@ class SourceManager(QObject):
                     # A more robust way would be a dedicated column in DB or a clear naming convention.
                     # Simple check for now:
                     is_default_pengpai = source_obj.name == self.PENGPAI_NAME and source_obj.type == self.PENGPAI_TYPE
-                    is_default_rss = any(
-                        ds['name'] == source_obj.name and ds['url'] == source_obj.url 
-                        for ds in get_default_rss_sources()
-                    )
+                    is_default_rss = (source_obj.name, source_obj.url) in default_rss_keys
                     source_obj.is_user_added = not (is_default_pengpai or is_default_rss)
                     temp_sources_list.append(source_obj)
             
             self.news_sources = temp_sources_list
-            self.news_sources.sort(key=lambda s: (s.type, s.name)) # Keep sorting
+            self.news_sources.sort(key=self._source_sort_key) # Keep sorting
 
             logger.debug(f"SourceManager: Loaded {len(self.news_sources)} news sources from database.")
 
@@ -176,7 +186,7 @@ class SourceManager(QObject):
         
         # If defaults were added, re-sort and emit
         if hasattr(self, '_defaults_added_flag') and self._defaults_added_flag:
-            self.news_sources.sort(key=lambda s: (s.type, s.name))
+            self.news_sources.sort(key=self._source_sort_key)
             self.sources_updated.emit() # Emit once after all potential additions
             del self._defaults_added_flag
 
@@ -184,11 +194,8 @@ class SourceManager(QObject):
                                       last_error: Optional[str], 
                                       last_checked_time: datetime):
         """Updates the status of a specific source in the memory cache and emits sources_updated."""
-        found_source = None
-        for src in self.news_sources:
-            if src.id == source_id:
-                found_source = src
-                break
+        self._ensure_source_index()
+        found_source = self._sources_by_id.get(source_id)
         
         if found_source:
             self.logger.debug(f"SourceManager: update_source_status_in_cache for ID {source_id} ('{found_source.name}'). Incoming status: '{status}', last_error: '{last_error}', last_checked: {last_checked_time}")
@@ -205,6 +212,45 @@ class SourceManager(QObject):
         """获取所有新闻源的列表。"""
         return self.news_sources
 
+    def get_category_name_map(self) -> Dict[str, str]:
+        """获取 源名称 -> 分类显示名 的映射 (缓存，源列表变化后重新计算)。"""
+        if self._category_name_cache is None:
+            self._category_name_cache = {source.name: get_category_name(source.category)
+                                         for source in self.news_sources}
+        return self._category_name_cache
+
+    def _invalidate_category_names(self):
+        """源列表或源配置变化时清除分类名缓存。"""
+        self._category_name_cache = None
+
+    def _ensure_source_index(self):
+        """news_sources 被替换、增删或标记失效后重建 名称/ID/URL 索引 (重复键以首次出现为准，与线性查找一致)。"""
+        if self._indexed_sources is self.news_sources and self._indexed_source_count == len(self.news_sources):
+            return
+        by_name: Dict[str, NewsSource] = {}
+        by_id: Dict[int, NewsSource] = {}
+        by_url: Dict[str, NewsSource] = {}
+        for source in self.news_sources:
+            by_name.setdefault(source.name, source)
+            if source.id is not None:
+                by_id.setdefault(source.id, source)
+            if source.url:
+                by_url.setdefault(source.url, source)
+        self._sources_by_name = by_name
+        self._sources_by_id = by_id
+        self._sources_by_url = by_url
+        self._indexed_sources = self.news_sources
+        self._indexed_source_count = len(self.news_sources)
+
+    @staticmethod
+    def _source_sort_key(source: NewsSource):
+        """news_sources 的排序键：先按类型，再按名称。"""
+        return (source.type, source.name)
+
+    def _invalidate_source_index(self):
+        """源的名称/ID/URL 被原地修改时，强制下次查找重建索引。"""
+        self._indexed_sources = None
+
     def add_source(self, source: NewsSource, _is_default_addition: bool = False): # Added internal flag
         """添加一个新的新闻源到数据库和内存列表。"""
         logger.debug(f"SourceManager: Attempting to add source '{source.name}'")
@@ -213,7 +259,8 @@ class SourceManager(QObject):
             return None
 
         # Check for duplicates by name before adding to DB
-        if any(s.name == source.name for s in self.news_sources):
+        self._ensure_source_index()
+        if source.name in self._sources_by_name:
             logger.warning(f"SourceManager: Source with name '{source.name}' already exists. Add operation cancelled.")
             # Optionally, could update if it's an attempt to re-add a default.
             # For user-added, this prevents duplicates.
@@ -230,10 +277,14 @@ class SourceManager(QObject):
             # --- CORRECTED LOGIC: Only add to memory list IF DB add was successful --- 
             if new_id is not None:
                 source.id = new_id # Update the model with the ID from DB
-                self.news_sources.append(source) # Add to memory list only on success
-                
                 if not _is_default_addition: # Avoid multiple sorts/emits if called from _ensure_defaults
-                    self.news_sources.sort(key=lambda s: (s.type, s.name))
+                    # 列表保持按 (type, name) 有序，二分插入即可，无需整体重新排序
+                    bisect.insort(self.news_sources, source, key=self._source_sort_key)
+                else:
+                    self.news_sources.append(source) # _ensure_default_sources_exist 会在批量添加后统一排序
+                self._invalidate_source_index()
+                
+                if not _is_default_addition:
                     self.sources_updated.emit()
                     logger.info(f"SourceManager: Successfully added source '{source.name}' with ID {new_id}.")
                 else:
@@ -258,6 +309,7 @@ class SourceManager(QObject):
                 success = self.storage.delete_news_source(source_to_remove.id)
                 if success:
                     self.news_sources.remove(source_to_remove)
+                    self._invalidate_source_index()
                     self.sources_updated.emit()
                     logger.info(f"SourceManager: Successfully removed source '{source_name}' (ID: {source_to_remove.id}).")
                 else:
@@ -267,6 +319,7 @@ class SourceManager(QObject):
         elif source_to_remove:
             logger.warning(f"SourceManager: Source '{source_name}' found in memory but has no ID. Cannot remove from DB. Removing from memory only.")
             self.news_sources.remove(source_to_remove) # Remove from memory if it has no ID (should not happen with DB backend)
+            self._invalidate_source_index()
             self.sources_updated.emit()
         else:
             logger.warning(f"SourceManager: Source with name '{source_name}' not found for removal.")
@@ -276,6 +329,8 @@ class SourceManager(QObject):
         source_to_update = self.get_source_by_name(source_name)
 
         if source_to_update and source_to_update.id is not None:
+            # emit_signal=False 时不会触发 sources_updated，这里直接让分类名缓存失效
+            self._invalidate_category_names()
             try:
                 processed_data = updated_data.copy()
 
@@ -289,10 +344,8 @@ class SourceManager(QObject):
                     # Check for conflict
                     conflict_exists = False
                     if is_different_name:
-                        for s_iter in self.news_sources:
-                            if s_iter is not source_to_update and s_iter.name == new_name_candidate:
-                                conflict_exists = True
-                                break
+                        existing = self._sources_by_name.get(new_name_candidate)
+                        conflict_exists = existing is not None and existing is not source_to_update
                     
                     if is_different_name and conflict_exists:
                         # 使用 f-string 构造更详细的错误信息
@@ -330,7 +383,8 @@ class SourceManager(QObject):
                         if not new_url_candidate: # Explicitly set to empty
                             raise ValueError("RSS 源的 URL 不能为空") # Target
                         # Check for URL conflict only if URL is actually changing to a new, non-empty value        
-                        if new_url_candidate != original_url and any(s.url == new_url_candidate and s is not source_to_update for s in self.news_sources if hasattr(s, 'url') and s.url):
+                        url_owner = self._sources_by_url.get(new_url_candidate)
+                        if new_url_candidate != original_url and url_owner is not None and url_owner is not source_to_update:
                             error_message = f"URL '{new_url_candidate}' 已被其他 RSS 源使用"
                             raise ValueError(error_message) # Target
                     elif not original_url: # URL was not in processed_data, and original URL is empty for this RSS source
@@ -355,6 +409,7 @@ class SourceManager(QObject):
                             del processed_data['custom_config']
 
                 # Apply updates to the NewsSource object in memory only if they cause a change
+                original_sort_key = self._source_sort_key(source_to_update)
                 has_changed = False
                 for key, value in processed_data.items():
                     if hasattr(source_to_update, key):
@@ -379,6 +434,8 @@ class SourceManager(QObject):
                         if old_value != value_to_set:
                             setattr(source_to_update, key, value_to_set)
                             has_changed = True
+                            if key in ('name', 'url', 'id'):
+                                self._invalidate_source_index()
                     else:
                         logger.warning(f"SourceManager: Attempted to update non-existent attribute '{key}' on source '{source_name}'")
                 
@@ -386,6 +443,11 @@ class SourceManager(QObject):
                     logger.debug(f"SourceManager: No actual changes for source '{source_name}'. Update skipped.")
                     return
 
+                # 名称或类型变化会改变排序键：只移动这一个源到新位置
+                if self._source_sort_key(source_to_update) != original_sort_key:
+                    self.news_sources.remove(source_to_update)
+                    bisect.insort(self.news_sources, source_to_update, key=self._source_sort_key)
+
                 # Now prepare the dictionary for storage
                 storage_dict = source_to_update.to_storage_dict()
                 # NewsStorage.update_news_source expects only the fields to be updated.
@@ -416,24 +478,24 @@ class SourceManager(QObject):
 
     def get_source_by_name(self, name: str) -> Optional[NewsSource]:
         """按名称获取新闻源。"""
-        for source in self.news_sources:
-            if source.name == name:
-                return source
-        return None
+        self._ensure_source_index()
+        return self._sources_by_name.get(name)
 
     def get_source_by_id(self, source_id: int) -> Optional[NewsSource]:
         """按 ID 获取新闻源。"""
         if source_id is None: # 防御性检查
             self.logger.warning("SourceManager.get_source_by_id called with None ID.")
             return None
-        for source in self.news_sources:
-            if source.id == source_id:
-                return source
+        self._ensure_source_index()
+        source = self._sources_by_id.get(source_id)
+        if source is not None:
+            return source
         self.logger.warning(f"SourceManager.get_source_by_id: Source with ID {source_id} not found in cache.")
         return None
 
     def _load_sources_from_storage(self):
         self.news_sources.clear()
+        self._invalidate_source_index()
         try:
             sources_data = self.storage.get_all_news_sources()
             for data in sources_data:
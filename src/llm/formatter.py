@@ -13,6 +13,21 @@ class LLMResponseFormatter:
     
     logger = logging.getLogger('news_analyzer.llm.formatter')
 
+    # 预编译的正则，避免每次格式化都经过 re 模块的缓存查找
+    _DUPLICATE_H2_RE = re.compile(r'(?P<h><h2\b[^>]*>.*?</h2>)\s*(?P=h)', flags=re.DOTALL)
+    _LEADING_MD_HEADINGS_RE = re.compile(r'^(?:\s*#+[^\n]*\n)+')
+    _TITLE_PREFIX_RE = re.compile(r'^(?:新闻摘要|深度分析|关键观点|事实核查)(?:\s*[（(]\d+字以内[)）])?\s*[:：]?\s*')
+    _HTML_TITLE_RE = re.compile(
+        r'<h[1-6][^>]*>(?:新闻摘要|深度分析|关键观点|事实核查)(?:\s*[（(]\d+字以内[)）])?\s*<\/h[1-6]>')
+    _PARAGRAPH_GAP_RE = re.compile(r'<\/p>\s*<p>')
+    # 列表与代码标签的内联样式，一次替换完成，不再逐个 replace 生成整份新字符串
+    _STYLED_TAGS = {
+        '<ul>': '<ul style="margin: 10px 0; padding-left: 20px;">',
+        '<ol>': '<ol style="margin: 10px 0; padding-left: 20px;">',
+        '<code>': '<code style="background-color: #f8f9fa; padding: 2px 4px; border-radius: 4px; font-family: Consolas, monospace;">',
+    }
+    _STYLED_TAGS_RE = re.compile('|'.join(map(re.escape, _STYLED_TAGS)))
+
     @staticmethod
     def format_analysis_result(content: str, analysis_type: str) -> str:
         """格式化分析结果为HTML
@@ -35,12 +50,7 @@ class LLMResponseFormatter:
             html = template.replace("{content}", formatted_content)
             # 移除可能出现的重复标题（同一个<h2>标签连续出现两次）
             try:
-                html = re.sub(
-                    r'(?P<h><h2\b[^>]*>.*?</h2>)\s*(?P=h)',
-                    r'\1',
-                    html,
-                    flags=re.DOTALL
-                )
+                html = LLMResponseFormatter._DUPLICATE_H2_RE.sub(r'\1', html)
             except Exception:
                 pass
             return html
@@ -63,13 +73,9 @@ class LLMResponseFormatter:
             
         try:
             # 去除开头可能的Markdown标题行
-            content = re.sub(r'^(?:\s*#+[^\n]*\n)+', '', content)
+            content = LLMResponseFormatter._LEADING_MD_HEADINGS_RE.sub('', content)
             # 移除可能存在的标题前缀（包括全角或半角括号内的字数说明）
-            content = re.sub(
-                r'^(?:新闻摘要|深度分析|关键观点|事实核查)(?:\s*[（(]\d+字以内[)）])?\s*[:：]?\s*',
-                '',
-                content.strip()
-            )
+            content = LLMResponseFormatter._TITLE_PREFIX_RE.sub('', content.strip())
             
             # 使用markdown2进行基础转换
             extras = {
@@ -82,20 +88,15 @@ class LLMResponseFormatter:
             content = markdown2.markdown(content, extras=extras)
             
             # 移除可能存在的HTML标题标签，防止重复显示
-            content = re.sub(
-                r'<h[1-6][^>]*>(?:新闻摘要|深度分析|关键观点|事实核查)(?:\s*[（(]\d+字以内[)）])?\s*<\/h[1-6]>',
-                '', content)
+            content = LLMResponseFormatter._HTML_TITLE_RE.sub('', content)
             
             # 自定义后处理
             # 1. 处理连续的换行，确保段落间距一致
-            content = re.sub(r'<\/p>\s*<p>', '</p><p>', content)
-            
-            # 2. 优化列表样式
-            content = content.replace('<ul>', '<ul style="margin: 10px 0; padding-left: 20px;">')
-            content = content.replace('<ol>', '<ol style="margin: 10px 0; padding-left: 20px;">')
+            content = LLMResponseFormatter._PARAGRAPH_GAP_RE.sub('</p><p>', content)
             
-            # 3. 优化代码块样式
-            content = content.replace('<code>', '<code style="background-color: #f8f9fa; padding: 2px 4px; border-radius: 4px; font-family: Consolas, monospace;">')
+            # 2. 优化列表样式 / 3. 优化代码块样式 (单次扫描完成)
+            styled_tags = LLMResponseFormatter._STYLED_TAGS
+            content = LLMResponseFormatter._STYLED_TAGS_RE.sub(lambda m: styled_tags[m.group()], content)
             
             # 4. 确保内容被正确包装
             if not content.startswith('<p>') and not content.startswith('<h'):
@@ -252,6 +253,32 @@ class LLMResponseFormatter:
          </div>
         '''
 
+    @staticmethod
+    def format_notice_html(message: str, title: str = "未进行分析") -> str:
+        """格式化提示消息为HTML (如内容过短而跳过分析)，样式区别于分析结果和错误
+
+        Args:
+            message: 提示消息
+            title: 提示标题
+
+        Returns:
+            格式化后的HTML字符串
+        """
+        return f'''
+            <div style="
+                font-family: 'Microsoft YaHei', sans-serif;
+                color: #555555;
+                background-color: #f4f6f8;
+                padding: 20px;
+                border-radius: 8px;
+                border-left: 4px solid #95a5a6;
+                margin: 10px 0;
+            ">
+                <h3 style="margin-top: 0; color: #7f8c8d;">{title}</h3>
+                <p style="margin-bottom: 0;">{message}</p>
+         </div>
+        '''
+
     @staticmethod
     def mock_analysis(news_item: Dict[str, Any], analysis_type: str) -> str:
         """生成模拟分析结果的HTML
@@ -6,14 +6,17 @@ LLM客户端 (重构为 LLMService)
 
 import os
 import json
+import hashlib
 import logging
+import threading
 import requests
 import time
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Union, Any, Tuple
 import dataclasses # Import dataclasses
 import requests # <-- 新增导入
-from PySide6.QtCore import QObject, Signal as pyqtSignal
+from PySide6.QtCore import QObject, Signal as pyqtSignal, QRunnable, QThreadPool
  
 # --- 导入内部模块 ---
 from src.config.llm_config_manager import LLMConfigManager
@@ -25,12 +28,95 @@ from .providers.ollama import OllamaProvider
 from .providers.google import GeminiProvider # <-- Import new provider
 from .formatter import LLMResponseFormatter
 from src.utils.api_client import ApiClient # <-- 新增导入
+from src.utils.rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
 # Import ChatMessage for type checking during conversion
 from src.models import ChatMessage, NewsArticle
 # --- FIX: Import LLMError --- Added
 from .exception import LLMError
 
 
+# Provider 通用参数的默认值
+DEFAULT_TEMPERATURE = 0.7
+DEFAULT_MAX_TOKENS = 2048
+DEFAULT_TIMEOUT = 60
+
+
+def _coalesce(*values, default=None):
+    """返回第一个不为 None 的值，全部为 None 时返回 default。"""
+    for value in values:
+        if value is not None:
+            return value
+    return default
+
+
+def _provider_config_args(config: Dict[str, Any]) -> Dict[str, Any]:
+    """从配置字典提取实例化 Provider 所需的通用参数 (显式的 None 也回落到默认值)。"""
+    return {
+        'temperature': _coalesce(config.get('temperature'), default=DEFAULT_TEMPERATURE),
+        'max_tokens': _coalesce(config.get('max_tokens'), default=DEFAULT_MAX_TOKENS),
+        'timeout': _coalesce(config.get('timeout'), default=DEFAULT_TIMEOUT),
+    }
+
+
+# 正文 + 摘要少于该字符数的新闻 (如只有标题的 RSS 条目) 默认不发送给 LLM，可通过 min_analysis_chars 调整
+DEFAULT_MIN_ANALYSIS_CHARS = 40
+_TOO_SHORT_TO_ANALYZE = "内容过短，无法分析。"
+
+
+def _analysis_body_length(news_item) -> int:
+    """返回新闻正文与摘要的总字符数 (str 视为正文)。"""
+    if isinstance(news_item, str):
+        return len(news_item)
+    get = news_item.get if isinstance(news_item, dict) else (lambda key: getattr(news_item, key, None))
+    return len(get('content') or '') + len(get('summary') or '')
+
+
+# Provider 类型识别规则：(关键字, 类型)，按顺序匹配，首个命中者生效 (如 "deepseek" 归入 volcengine_ark)
+# 名称规则作用于小写后的配置名 ("火山方舟" 无大小写，可直接放在表中)
+_PROVIDER_NAME_RULES: Tuple[Tuple[str, str], ...] = (
+    ("openai", "openai"),
+    ("anthropic", "anthropic"),
+    ("google", "google"), ("gemini", "google"),
+    ("mistral", "mistral"),
+    ("fireworks", "fireworks"),
+    ("ollama", "ollama"),
+    ("bailian", "bailian"),
+    ("dashscope", "dashscope"),
+    ("zhipu", "zhipu"),
+    ("xai", "xai"), ("grok", "xai"),
+    ("volcengine", "volcengine_ark"), ("ark", "volcengine_ark"),
+    ("火山方舟", "volcengine_ark"), ("deepseek", "volcengine_ark"),
+)
+# URL 规则作用于小写后的 api_url，仅在名称规则未命中时使用
+_PROVIDER_URL_RULES: Tuple[Tuple[str, str], ...] = (
+    ("openai.com", "openai"),
+    ("anthropic.com", "anthropic"),
+    ("googleapis.com", "google"),
+    ("mistral.ai", "mistral"),
+    ("fireworks.ai", "fireworks"),
+    ("localhost", "ollama"), ("127.0.0.1", "ollama"),
+    ("bailian.aliyuncs.com", "bailian"),
+    ("dashscope.aliyuncs.com", "dashscope"),
+    ("bigmodel.cn", "zhipu"),
+    ("api.x.ai", "xai"),
+    ("volces.com", "volcengine_ark"),
+)
+
+
+class StreamChatRunnable(QRunnable):
+    """在 QThreadPool 工作线程中执行一次流式聊天请求 (结果通过 LLMService 的信号发出)。"""
+    def __init__(self, target: Callable[[List[Dict[str, str]]], None], messages: List[Dict[str, str]]):
+        super().__init__()
+        self.target = target
+        self.messages = messages
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.target(self.messages)
+
+
 class LLMService(QObject):
     """
     LLM 服务类，协调配置、提示和 Provider 实现。
@@ -51,19 +137,32 @@ class LLMService(QObject):
                  override_temperature: Optional[float] = None,
                  override_max_tokens: Optional[int] = None,
                  override_timeout: Optional[int] = None,
-                 override_provider_name: Optional[str] = None
+                 override_provider_name: Optional[str] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 min_analysis_chars: Optional[int] = None
                  ):
         """
         初始化 LLM 服务。
         使用注入的管理器和客户端，加载配置，选择并实例化合适的 Provider。
+        response_cache 可选；注入后 analyze_news / translate_text 的相同请求直接返回缓存结果。
+        semantic_cache 可选；注入后 analyze_news 对内容高度相似的新闻复用 Provider、模型、模板和分析类型
+        都相同的已有结果；切换配置或修改提示模板后清空。
+        min_analysis_chars 可选；正文 + 摘要少于该字符数时 analyze_news 不发送请求，直接返回提示
+        (未设置时为 DEFAULT_MIN_ANALYSIS_CHARS，0 表示不跳过)。中文信息密度较高，可按需调低。
         """
         super().__init__()
         self.logger = logging.getLogger('news_analyzer.llm.service') # Renamed logger
         self.config_manager = config_manager
         self.prompt_manager = prompt_manager
         self.api_client = api_client
+        self.response_cache = response_cache
+        self.semantic_cache = semantic_cache
+        if semantic_cache is not None:
+            self.prompt_manager.add_change_listener(self._clear_semantic_cache)
+        self.min_analysis_chars = _coalesce(min_analysis_chars, default=DEFAULT_MIN_ANALYSIS_CHARS)
         self._cancel_requested = False # 添加停止标志
-        self._current_stream_thread: threading.Thread | None = None # Track the stream thread
+        self._current_stream_task: StreamChatRunnable | None = None # Track the running stream task
         self._emitted_final_for_stream = False # Add new flag
 
         # --- Load initial configuration and instantiate provider --- Modified
@@ -74,6 +173,7 @@ class LLMService(QObject):
         )
         
         self.provider: Optional[LLMProviderInterface] = None # Ensure provider is initialized
+        self._rate_limiter: Optional[RateLimiter] = None  # 按当前配置 rpm/tpm 创建的限流器
         if initial_config:
             self._initialize_provider(initial_config)
         else:
@@ -86,7 +186,7 @@ class LLMService(QObject):
                              override_provider_name) -> Optional[Dict[str, Any]]:
         """Loads configuration, prioritizing overrides, then manager's active config."""
         self.logger.debug("Loading initial LLM configuration...")
-        config_source = "override" if any([override_api_key, override_api_url, override_model]) else "manager"
+        config_source = "override" if (override_api_key or override_api_url or override_model) else "manager"
 
         loaded_api_key: Optional[Union[str, List[str]]] = None # Can be list for Gemini
         loaded_api_url: Optional[str] = None
@@ -94,6 +194,8 @@ class LLMService(QObject):
         loaded_temperature: Optional[float] = None
         loaded_max_tokens: Optional[int] = None
         loaded_timeout: Optional[int] = None
+        loaded_rpm: Optional[float] = None
+        loaded_tpm: Optional[float] = None
         active_name: Optional[str] = None
 
         if config_source == "manager":
@@ -102,20 +204,22 @@ class LLMService(QObject):
                 loaded_api_key = active_config_dict.get('api_key')
                 loaded_api_url = active_config_dict.get('api_url')
                 loaded_model = active_config_dict.get('model')
-                loaded_temperature = active_config_dict.get('temperature', 0.7)
-                loaded_max_tokens = active_config_dict.get('max_tokens', 2048)
-                loaded_timeout = active_config_dict.get('timeout', 60)
+                loaded_temperature = active_config_dict.get('temperature')
+                loaded_max_tokens = active_config_dict.get('max_tokens')
+                loaded_timeout = active_config_dict.get('timeout')
+                loaded_rpm = active_config_dict.get('rpm')
+                loaded_tpm = active_config_dict.get('tpm')
                 active_name = self.config_manager.get_active_config_name()
             else:
                  self.logger.warning("No active LLM configuration found via manager during init.")
 
         # Apply overrides
-        final_api_key = override_api_key if override_api_key is not None else loaded_api_key
-        final_api_url = override_api_url if override_api_url is not None else loaded_api_url
-        final_model = override_model if override_model is not None else loaded_model
-        final_temperature = override_temperature if override_temperature is not None else (loaded_temperature if loaded_temperature is not None else 0.7)
-        final_max_tokens = override_max_tokens if override_max_tokens is not None else (loaded_max_tokens if loaded_max_tokens is not None else 2048)
-        final_timeout = override_timeout if override_timeout is not None else (loaded_timeout if loaded_timeout is not None else 60)
+        final_api_key = _coalesce(override_api_key, loaded_api_key)
+        final_api_url = _coalesce(override_api_url, loaded_api_url)
+        final_model = _coalesce(override_model, loaded_model)
+        final_temperature = _coalesce(override_temperature, loaded_temperature, default=DEFAULT_TEMPERATURE)
+        final_max_tokens = _coalesce(override_max_tokens, loaded_max_tokens, default=DEFAULT_MAX_TOKENS)
+        final_timeout = _coalesce(override_timeout, loaded_timeout, default=DEFAULT_TIMEOUT)
         final_name = override_provider_name if override_provider_name else active_name # Use override name if provided, else active name
         
         if not final_api_url or not final_model:
@@ -131,34 +235,32 @@ class LLMService(QObject):
             'temperature': final_temperature,
             'max_tokens': final_max_tokens,
             'timeout': final_timeout,
+            'rpm': loaded_rpm,
+            'tpm': loaded_tpm,
             '_source': config_source # Keep track of where it came from for logging
         }
 
-    def _initialize_provider(self, config: Dict[str, Any]) -> bool:
-        """Instantiates the LLM provider based on the given configuration dict."""
-        self.logger.info(f"--- LLMService._initialize_provider: Received config for initialization: {config}")
-        self.logger.info(f"Attempting to initialize LLM provider with config: {config.get('name', 'N/A')}")
+    def _build_provider(self, config: Dict[str, Any], provider_type_str: str,
+                        connection_test: bool = False) -> Optional[LLMProviderInterface]:
+        """按配置和类型字符串实例化 Provider，失败时返回 None (错误已记录日志)。
+
+        connection_test=True 时 (test_connection_with_config) 放宽限制：允许未填写 API key
+        (如无需鉴权的本地兼容服务，由测试请求的结果决定成败)，并接受配置中指定的
+        azure / moonshot / baidu 类型 (按 OpenAI 兼容接口测试)。
+        """
         _api_key = config.get('api_key')
         _api_url = config.get('api_url')
         _model = config.get('model')
-        _name = config.get('name') # Get name from config dict
-
-        if not _api_url or not _model:
-             self.logger.error("Cannot initialize provider: API URL or Model missing in config.")
-             self.provider = None
-             return False
-
-        provider_type_str = self._determine_provider_type_string(_name, _api_url)
-        self.provider_type_string = provider_type_str # <-- Ensure this line is present
+        _name = config.get('name')
         
         # Create provider config dict for instantiation
         # Ensure keys match ProviderConfig definition if strict type checking occurs later
-        provider_config_args = {
-            'temperature': config.get('temperature', 0.7),
-            'max_tokens': config.get('max_tokens', 2048),
-            'timeout': config.get('timeout', 60)
-            # Add other potential config args here if base provider uses them
-        }
+        provider_config_args = _provider_config_args(config)
+        if connection_test and provider_type_str != "google" and _api_key is not None and not isinstance(_api_key, str):
+            self.logger.warning(f"Provider '{provider_type_str}' expected API key as string, got {type(_api_key)}. Converting.")
+            _api_key = str(_api_key)
+        if connection_test and not _api_key and provider_type_str not in ("google", "ollama"):
+            self.logger.warning(f"API key not provided for '{provider_type_str}' test config '{_name}'. Test may fail if required.")
         # Convert to dataclass if providers expect it? For now, pass dict.
         # provider_config_obj = ProviderConfig(**provider_config_args) 
 
@@ -166,7 +268,7 @@ class LLMService(QObject):
         # try: <--- Remove this line
         new_provider: Optional[LLMProviderInterface] = None
         if provider_type_str == "anthropic":
-            if not _api_key or not isinstance(_api_key, str):
+            if not connection_test and (not _api_key or not isinstance(_api_key, str)):
                 self.logger.error("Anthropic provider requires a single string API key.")
             else:
                 self.logger.debug(f"Attempting to initialize AnthropicProvider for '{_name}'. Config params: {provider_config_args}")
@@ -194,10 +296,14 @@ class LLMService(QObject):
             self.logger.debug(f"Attempting to initialize OllamaProvider for '{_name}'. API URL: {_api_url}, Model: {_model}, Config params: {ollama_config}")
             new_provider = OllamaProvider(api_url=_api_url, model=_model, api_key=None, config=ollama_config)
         # --- FIX: Correct indentation --- Modified
-        elif provider_type_str in ["openai", "xai", "mistral", "fireworks", "volcengine_ark", "generic"]:
-            if not _api_key or not isinstance(_api_key, str):
+        elif provider_type_str in ["openai", "xai", "mistral", "fireworks", "volcengine_ark", "generic"] or \
+                (connection_test and provider_type_str in ["azure", "moonshot", "baidu"]):
+            if not connection_test and (not _api_key or not isinstance(_api_key, str)):
                  self.logger.error(f"{provider_type_str.capitalize()} provider requires a single string API key.")
             else:
+                 if provider_type_str == "azure":
+                     # Azure 可能需要额外参数 (如 api_version、deployment_id)，由配置的 azure_config 提供
+                     provider_config_args.update(config.get('azure_config') or {})
                  # Ensure provider_config_args doesn't contain keys OpenAIProvider doesn't expect
                  self.logger.debug(f"Attempting to initialize OpenAIProvider (compatible) for '{_name}'. Config params: {provider_config_args}")
                  new_provider = OpenAIProvider(
@@ -209,6 +315,29 @@ class LLMService(QObject):
         else:
             self.logger.error(f"No specific provider implementation found for type '{provider_type_str}'. Cannot initialize.")
 
+        return new_provider
+
+    def _initialize_provider(self, config: Dict[str, Any]) -> bool:
+        """Instantiates the LLM provider based on the given configuration dict."""
+        self.logger.info(f"--- LLMService._initialize_provider: Received config for initialization: {config}")
+        self.logger.info(f"Attempting to initialize LLM provider with config: {config.get('name', 'N/A')}")
+        _api_key = config.get('api_key')
+        _api_url = config.get('api_url')
+        _model = config.get('model')
+        _name = config.get('name') # Get name from config dict
+
+        if not _api_url or not _model:
+             self.logger.error("Cannot initialize provider: API URL or Model missing in config.")
+             self.provider = None
+             return False
+
+        provider_type_str = self._determine_provider_type_string(_name, _api_url)
+        self.provider_type_string = provider_type_str # <-- Ensure this line is present
+        new_provider = self._build_provider(config, provider_type_str)
+
+        # 限流器跟随当前配置重建，未设置 rpm / tpm 时为 None
+        self._rate_limiter = RateLimiter.from_config(config) if new_provider else None
+
         # --- Catch exceptions around the whole block --- Added try...except
         try:
             if new_provider:
@@ -217,6 +346,7 @@ class LLMService(QObject):
                 log_key = '***' if _api_key else 'None'
                 if isinstance(_api_key, list): log_key = f'List[{len(_api_key)}]'
                 self.logger.info(f"LLM Provider Initialized/Reloaded: Name='{_name}', Provider='{provider_id}', Key={log_key}, URL='{_api_url}', Model='{_model}'")
+                self._warm_up_connection(_api_url)
                 return True # Initialization successful
             else:
                  # Logged specific error inside the if/elif block already
@@ -228,6 +358,13 @@ class LLMService(QObject):
             self.provider = None
             return False # Initialization failed
 
+    def _warm_up_connection(self, api_url: str):
+        """在后台线程预先建立到 api_url 的连接，使第一次真正的请求复用已完成的 TLS 握手。"""
+        if not isinstance(self.api_client, ApiClient):
+            return
+        threading.Thread(target=self.api_client.warm_up, args=(api_url,),
+                         name="LLMConnectionWarmUp", daemon=True).start()
+
     def reload_active_config(self) -> bool:
         """Reloads the active configuration from the manager and re-initializes the provider."""
         self.logger.info("Reloading active LLM configuration...")
@@ -237,6 +374,7 @@ class LLMService(QObject):
             active_name = self.config_manager.get_active_config_name()
             active_config['name'] = active_name
             active_config['_source'] = 'manager (reloaded)'
+            self._clear_semantic_cache()
             return self._initialize_provider(active_config)
         else:
             self.logger.warning("Could not find active configuration to reload. LLMService provider remains unchanged.")
@@ -244,39 +382,26 @@ class LLMService(QObject):
 
    # 将 _determine_provider_type_string 改为静态方法，以便新方法调用
     @staticmethod
+    @lru_cache(maxsize=256)
     def _determine_provider_type_string(config_name: Optional[str], api_url: Optional[str]) -> str:
-        """根据配置名称和URL确定用于选择Provider的类型字符串 (静态方法)"""
+        """根据配置名称和URL确定用于选择Provider的类型字符串 (静态方法)
+
+        纯函数，且同一个活动配置会反复传入相同参数，因此按 (config_name, api_url) 缓存结果。
+        """
         if not config_name and not api_url:
             return "generic"
 
         if config_name:
             name_lower = config_name.lower()
-            if "openai" in name_lower: return "openai"
-            if "anthropic" in name_lower: return "anthropic"
-            if "google" in name_lower or "gemini" in name_lower: return "google"
-            if "mistral" in name_lower: return "mistral"
-            if "fireworks" in name_lower: return "fireworks"
-            if "ollama" in name_lower: return "ollama"
-            if "bailian" in name_lower: return "bailian"
-            if "dashscope" in name_lower: return "dashscope"
-            if "zhipu" in name_lower: return "zhipu"
-            if "xai" in name_lower or "grok" in name_lower: return "xai"
-            if "volcengine" in name_lower or "ark" in name_lower or "火山方舟" in config_name or "deepseek" in name_lower:
-                 return "volcengine_ark"
+            for keyword, provider_type in _PROVIDER_NAME_RULES:
+                if keyword in name_lower:
+                    return provider_type
 
         if api_url:
             url_lower = api_url.lower()
-            if "openai.com" in url_lower: return "openai"
-            if "anthropic.com" in url_lower: return "anthropic"
-            if "googleapis.com" in url_lower: return "google"
-            if "mistral.ai" in url_lower: return "mistral"
-            if "fireworks.ai" in url_lower: return "fireworks"
-            if "localhost" in url_lower or "127.0.0.1" in url_lower: return "ollama"
-            if "bailian.aliyuncs.com" in url_lower: return "bailian"
-            if "dashscope.aliyuncs.com" in url_lower: return "dashscope"
-            if "bigmodel.cn" in url_lower: return "zhipu"
-            if "api.x.ai" in url_lower: return "xai"
-            if "volces.com" in url_lower: return "volcengine_ark"
+            for keyword, provider_type in _PROVIDER_URL_RULES:
+                if keyword in url_lower:
+                    return provider_type
 
         return "generic"
 
@@ -291,8 +416,15 @@ class LLMService(QObject):
         prompt_data: Dict[str, Any]
 
         if isinstance(article_content, NewsArticle):
-            # Convert NewsArticle object to a dictionary
-            prompt_data = article_content.to_dict() if hasattr(article_content, 'to_dict') else vars(article_content)
+            # 只取提示模板用到的字段 (title/source/pub_date/content)，不做完整的 to_dict() 转换
+            publish_time = article_content.publish_time
+            prompt_data = {
+                'title': article_content.title,
+                'source_name': article_content.source_name,
+                'content': article_content.content or article_content.summary,
+                'summary': article_content.summary,
+                'publish_time': publish_time.isoformat() if publish_time else None,
+            }
         elif isinstance(article_content, dict):
             prompt_data = article_content.copy()
         elif isinstance(article_content, str): # Handle plain string content if needed
@@ -363,6 +495,18 @@ class LLMService(QObject):
             news_item_dict = news_item.to_dict() if hasattr(news_item, 'to_dict') else {}
             return LLMResponseFormatter.mock_analysis(news_item_dict, analysis_type)
 
+        if _analysis_body_length(news_item) < self.min_analysis_chars:
+            self.logger.debug(f"Skipping LLM analysis (type: {analysis_type}): content shorter than {self.min_analysis_chars} chars.")
+            return LLMResponseFormatter.format_notice_html(_TOO_SHORT_TO_ANALYZE)
+
+        semantic_text = self._semantic_cache_text(news_item)
+        semantic_scope = self._semantic_cache_scope(analysis_type) if semantic_text is not None else None
+        if semantic_scope is not None:
+            cached_html = self.semantic_cache.lookup(semantic_text, semantic_scope)
+            if cached_html:
+                self.logger.info(f"LLM analysis (type: {analysis_type}) served from semantic cache.")
+                return cached_html
+
         try:
             # --- MODIFIED: Call the new helper method ---
             # The 'article_content' parameter of _prepare_messages_for_analysis is news_item here
@@ -372,8 +516,13 @@ class LLMService(QObject):
             self.logger.info(f"Sending analysis request (type: {analysis_type}) via provider: {self.provider.get_identifier()}")
 
             # --- MODIFIED SECTION (from previous step, ensuring it's in the correct analyze_news) ---
-            if isinstance(self.provider, GeminiProvider):
+            cache_key = self._response_cache_key(messages)
+            analysis_result = self.response_cache.get(cache_key) if cache_key else None
+            if analysis_result:
+                self.logger.info("LLM analysis served from response cache.")
+            elif isinstance(self.provider, GeminiProvider):
                 self.logger.debug("Using GeminiProvider._send_chat_request for analysis.")
+                self._throttle(messages)
                 raw_response_data = self.provider._send_chat_request(self.api_client, messages)
                 analysis_result = self.provider.parse_response(raw_response_data)
                 self.logger.info(f"LLM analysis successful via GeminiProvider. Result length: {len(analysis_result)}")
@@ -387,6 +536,7 @@ class LLMService(QObject):
                     request_url = self.provider.CHAT_URL_TEMPLATE.format(
                         api_url=self.provider.api_url.rstrip('/'), model=self.provider.model, api_key=current_key
                     )
+                self._throttle(messages)
                 raw_response_data = self.api_client.post(
                     url=request_url,
                     headers=self.provider.get_headers(),
@@ -395,6 +545,8 @@ class LLMService(QObject):
                 )
                 analysis_result = self.provider.parse_response(raw_response_data)
                 self.logger.info(f"LLM analysis successful via direct ApiClient.post. Result length: {len(analysis_result)}")
+            if cache_key and analysis_result:
+                self.response_cache.put(cache_key, analysis_result)
             # --- END MODIFIED SECTION ---
 
             if not analysis_result: # Check if result is empty
@@ -402,6 +554,8 @@ class LLMService(QObject):
                 return LLMResponseFormatter.format_error_html("API 返回的内容为空或无法解析。")
 
             formatted_html_output = LLMResponseFormatter.format_analysis_result(analysis_result, analysis_type)
+            if semantic_scope is not None:
+                self.semantic_cache.add(semantic_text, semantic_scope, formatted_html_output)
             return formatted_html_output
 
         except LLMError as e:
@@ -414,6 +568,45 @@ class LLMService(QObject):
             self.logger.error(f"Unexpected error during news analysis: {e}", exc_info=True)
             return LLMResponseFormatter.format_error_html(f"分析过程中发生意外错误: {e}")
 
+    def _semantic_cache_text(self, news_item) -> Optional[str]:
+        """返回用于语义缓存的新闻文本；未注入语义缓存时返回 None。"""
+        if self.semantic_cache is None:
+            return None
+        return SemanticCache.text_for_news(news_item)
+
+    def _semantic_cache_scope(self, analysis_type: str) -> Optional[str]:
+        """返回语义缓存的查找范围 (Provider、模型、模板、分析类型)；temperature 不允许缓存时返回 None。"""
+        if not self.provider:
+            return None
+        temperature = self.provider._get_config_value('temperature')
+        cacheable = self.response_cache.is_cacheable(temperature) if self.response_cache is not None else not temperature
+        if not cacheable:
+            return None
+        template_name = PromptManager.ANALYSIS_TEMPLATE_MAP.get(analysis_type, '')
+        return f"{self.provider.get_identifier()}|{self.provider.model}|{template_name}|{analysis_type}"
+
+    def _clear_semantic_cache(self, template_name: Optional[str] = None):
+        """配置切换或提示模板变化后，已缓存的分析结果不再对应当前请求，整体清空。"""
+        if self.semantic_cache is not None and len(self.semantic_cache):
+            self.logger.info("Clearing semantic cache after LLM config or prompt template change.")
+            self.semantic_cache.clear()
+
+    def _response_cache_key(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """返回当前 Provider 下该请求的缓存键；未注入缓存或 temperature 不允许缓存时返回 None。"""
+        if self.response_cache is None or not self.provider:
+            return None
+        temperature = self.provider._get_config_value('temperature')
+        if not self.response_cache.is_cacheable(temperature):
+            return None
+        return ResponseCache.make_key(self.provider.get_identifier(), self.provider.api_url,
+                                      self.provider.model, temperature,
+                                      self.provider._get_config_value('max_tokens'), messages)
+
+    def _throttle(self, messages: List[Dict[str, str]]):
+        """按当前配置的 rpm / tpm 限流，必要时阻塞到允许发送。"""
+        if self._rate_limiter:
+            self._rate_limiter.acquire(RateLimiter.estimate_tokens(messages))
+
     def analyze_news_similarity(self, news_items: List[Dict], analysis_type='新闻相似度分析'):
         """分析多篇新闻的相似度
         
@@ -434,7 +627,9 @@ class LLMService(QObject):
         # 准备新闻数据文本
         news_text_list = []
         for i, news in enumerate(news_items):
-            if hasattr(news, '__dict__'):
+            if isinstance(news, NewsArticle):
+                news_dict = news.to_dict()
+            elif hasattr(news, '__dict__'):
                 news_dict = vars(news)
             elif isinstance(news, dict):
                 news_dict = news
@@ -528,18 +723,41 @@ class LLMService(QObject):
             error_html = LLMResponseFormatter.format_error_html(f"分析时发生意外错误: {e}")
             return error_html
 
-    def chat(self, messages: List[Union[Dict[str, str], ChatMessage]], context: str = "", stream: bool = True) -> Optional[Union[str, threading.Thread]]:
+    def _build_chat_system_content(self, caller_system_parts: List[str], context: str) -> str:
+        """拼接聊天的 system 前缀：固定模板在前，调用方 system 内容其次，最易变化的 context 在最后。
+
+        只做确定性的拼接 (不插入时间戳等每次变化的内容)，同一会话的多轮请求前缀逐字节一致，
+        以命中 OpenAI / Anthropic / Gemini 的服务端前缀缓存。
+        """
+        system_prompt_template = self.prompt_manager.load_template('chat_system') or "你是一个专业的新闻分析助手。"
+        # 每个片段只在这里 strip 一次；无 context 时不追加标题，无上下文的会话前缀保持不变
+        parts = [system_prompt_template.strip()]
+        parts.extend(part for part in caller_system_parts if part not in parts)
+        context = (context or "").strip()
+        if context:
+            parts.append(f"相关新闻信息:\n{context}")
+        system_content = "\n\n".join(part for part in parts if part)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # 多轮对话中该哈希应保持不变；若变化则前缀缓存会失效
+            self.logger.debug("Chat system prefix sha256=%s (len=%d)",
+                              hashlib.sha256(system_content.encode('utf-8')).hexdigest()[:16], len(system_content))
+        return system_content
+
+    def chat(self, messages: List[Union[Dict[str, str], ChatMessage]], context: str = "", stream: bool = True) -> Optional[str]:
         """
-        与 LLM 进行聊天交互。(强制非流式)
+        与 LLM 进行聊天交互。
+
+        流式模式下在工作线程中请求，每个增量片段通过 chat_chunk_received 发出，
+        结束时 chat_finished 发出完整内容；volcengine_ark / google 强制非流式。
 
         Args:
             messages: 聊天历史消息列表 (可以是 ChatMessage 对象或字典)。
             context: 额外上下文。
-            stream: 是否启用流式响应 (此参数在此版本中被忽略，强制非流式)。
+            stream: 是否启用流式响应。
 
         Returns:
-            - 返回响应字符串或错误 HTML。
-            - 如果 LLM 未配置，返回错误信息。
+            - 结果通过信号发出，正常情况下返回 None。
+            - 如果 LLM 未配置，返回错误信息 HTML。
         """
         self.logger.info(f"Executing chat method. Current provider type string: '{self.provider_type_string}'") # <-- Add logging
         self._cancel_requested = False # 重置停止标志
@@ -551,19 +769,26 @@ class LLMService(QObject):
             return error_html # 非流式直接返回错误
 
         # 准备消息列表 (确保转换为字典)
+        # 调用方自带的 system 消息合并进唯一的一条前置 system 消息，其余按原顺序保留
         processed_messages = []
-        system_prompt_template = self.prompt_manager.load_template('chat_system') or "你是一个专业的新闻分析助手。"
-        system_content = f"{system_prompt_template}\n\n相关新闻信息:\n{context}" if context else system_prompt_template
-        if system_content.strip():
-            processed_messages.append({'role': 'system', 'content': system_content.strip()})
-
+        caller_system_parts = []
         for msg in messages:
             if isinstance(msg, ChatMessage):
-                processed_messages.append({'role': msg.role, 'content': msg.content})
+                role, content = msg.role, msg.content
             elif isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-                 processed_messages.append({'role': msg['role'], 'content': msg['content']})
+                role, content = msg['role'], msg['content']
+            else:
+                self.logger.warning(f"Skipping invalid message format in chat history: {msg}")
+                continue
+            if role == 'system':
+                if content and content.strip():
+                    caller_system_parts.append(content.strip())
             else:
-                 self.logger.warning(f"Skipping invalid message format in chat history: {msg}")
+                processed_messages.append({'role': role, 'content': content})
+
+        system_content = self._build_chat_system_content(caller_system_parts, context)
+        if system_content:
+            processed_messages.insert(0, {'role': 'system', 'content': system_content})
 
         # --- Decide whether to stream based on provider type --- ADDED BLOCK
         should_stream = stream # Start with the requested mode
@@ -580,6 +805,7 @@ class LLMService(QObject):
             self.logger.info("Executing non-streaming chat request.")
             # --- FIX: Correct indentation and structure for try/except/finally --- Modified
             try:
+                self._throttle(processed_messages)
                 # --- FIX: Use provider specific method if available, else generic --- Modified
                 if hasattr(self.provider, '_send_chat_request') and callable(getattr(self.provider, '_send_chat_request')):
                     self.logger.info(f"Calling self.provider._send_chat_request for non-stream... Provider: {type(self.provider)}")
@@ -592,7 +818,8 @@ class LLMService(QObject):
                     request_url = self.provider.api_url # Assuming api_url is the correct endpoint
                     headers = self.provider.get_headers()
                     payload = self.provider.prepare_request_payload(processed_messages, stream=False)
-                    self.logger.debug(f"Generic Non-Stream Payload for {request_url}: {json.dumps(payload, indent=2, ensure_ascii=False)}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Generic Non-Stream Payload for {request_url}: {json.dumps(payload, indent=2, ensure_ascii=False)}")
                     response_data = self.api_client.post(
                         url=request_url,
                         headers=headers,
@@ -635,19 +862,16 @@ class LLMService(QObject):
             #     self.logger.error("Streaming requires a callback function.")
             #     raise ValueError("Streaming requires a callback function.")
 
-            self._cancel_requested = False
-            self._current_stream_thread = threading.Thread(
-                target=self._stream_chat_response_thread_target,
-                args=(processed_messages,), # Removed callback from args
-                daemon=True
-            )
-            self._current_stream_thread.start()
-            return self._current_stream_thread # Return the thread
+            # 复用全局线程池中的工作线程，而不是每次聊天新建一个线程
+            self._current_stream_task = StreamChatRunnable(self._stream_chat_response_thread_target, processed_messages)
+            QThreadPool.globalInstance().start(self._current_stream_task)
+            return None # Results are delivered via chat_chunk_received / chat_finished / chat_error
 
     def _stream_chat_response_thread_target(self, messages: List[Dict[str, str]]): 
         """包装流式请求以捕获和报告错误 (使用信号) (后台线程)""" 
         self.logger.info(f"--- Stream Thread STARTED for provider: {self.provider.get_identifier() if self.provider else 'N/A'} ---")
-        self._cancel_requested = False
+        # 不在此处重置 _cancel_requested：chat() 提交任务前已重置，
+        # 若在线程启动前用户已点击停止，这里重置会丢失该取消请求
         self._emitted_final_for_stream = False # Reset flag for new stream
 
         full_response_content = ""
@@ -672,8 +896,10 @@ class LLMService(QObject):
                 raise LLMError("Provider not available for streaming.")
 
             self.logger.debug(f"Streaming from URL: {target_url}")
-            self.logger.debug(f"Request payload: {json.dumps(request_payload, indent=2, ensure_ascii=False)}")
+            if self.logger.isEnabledFor(logging.DEBUG): # 避免在未开启 DEBUG 时也序列化整个请求体
+                self.logger.debug(f"Request payload: {json.dumps(request_payload, indent=2, ensure_ascii=False)}")
 
+            self._throttle(messages)
             line_iterator = self.api_client.stream_post(
                 url=target_url,
                 headers=self.provider.get_headers(),
@@ -689,13 +915,15 @@ class LLMService(QObject):
                 try:
                     processed_chunk, is_final_chunk = self.provider.process_stream_line(line)
                     
-                    if processed_chunk is not None: # Ensure there's content to process/emit
+                    if processed_chunk: # 只把本次增量 (非空) 交给 UI，由 UI 追加显示
                         full_response_content += processed_chunk
                         self.chat_chunk_received.emit(processed_chunk)
                         
-                        if is_final_chunk:
-                            stream_ended_naturally_via_final_chunk_signal = True
-                            self.logger.info("Final chunk processed from stream (is_final_chunk=True received).") # Clarified log
+                    # 结束信号 (如 OpenAI 的 [DONE]) 本身不带内容，需独立于内容判断
+                    if is_final_chunk:
+                        stream_ended_naturally_via_final_chunk_signal = True
+                        self.logger.info("Final chunk processed from stream (is_final_chunk=True received).") # Clarified log
+                        break
 
                 except LLMError as e: # MODIFIED: Catch LLMError instead of undefined LLMProcessingError
                     self.logger.error(f"LLMError while processing stream line for {self.provider.get_identifier()}: {e}", exc_info=True)
@@ -723,6 +951,10 @@ class LLMService(QObject):
                     generic_error_details_str = f"Provider: {self.provider.get_identifier()}, Type: StreamProcessingError, Details: A generic error occurred while processing a chunk: {str(e)}"
                     error_message_html = LLMResponseFormatter.format_error_html(generic_error_details_str)
                     break 
+            else:
+                # 迭代器自然耗尽 (服务端关闭连接) 而未收到显式结束信号，同样视为正常结束
+                if not self._cancel_requested:
+                    stream_ended_naturally_via_final_chunk_signal = True
             
             # --- ADDED: Handle natural stream completion ---
             if not error_occurred and not self._cancel_requested and stream_ended_naturally_via_final_chunk_signal:
@@ -775,9 +1007,8 @@ class LLMService(QObject):
                 self.chat_error.emit(error_message_html)
                 self._emitted_final_for_stream = True
         finally:
-            self.logger.info(f"--- Stream Thread ENDED for provider: {self.provider.get_identifier() if self.provider else 'N/A'} --- Resetting _current_stream_thread.")
-            self._current_stream_thread = None
-            self.logger.info(f"--- Stream ENDED for provider: {self.provider.get_identifier() if self.provider else 'N/A'} --- Resetting _current_stream_thread.")
+            self.logger.info(f"--- Stream ENDED for provider: {self.provider.get_identifier() if self.provider else 'N/A'} --- Resetting _current_stream_task.")
+            self._current_stream_task = None
 
     def _send_chat_request(self, messages: List[Dict[str, str]]) -> str:
         """发送非流式聊天请求 (使用 Provider)"""
@@ -786,7 +1017,14 @@ class LLMService(QObject):
 
         messages_as_dicts = messages
 
+        cache_key = self._response_cache_key(messages_as_dicts)
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        if cached:
+            self.logger.info("[_send_chat_request] Served from response cache.")
+            return cached
+
         # --- Log before the API call --- Added
+        self._throttle(messages_as_dicts)
         self.logger.info(f"[_send_chat_request] Attempting non-stream POST to {self.provider.api_url}...")
         try:
             result_json = self.api_client.post(
@@ -806,7 +1044,10 @@ class LLMService(QObject):
         self.logger.debug(f"Raw non-stream response JSON: {result_json}")
         # --- End Revert ---
             
-        return self.provider.parse_response(result_json)
+        content = self.provider.parse_response(result_json)
+        if cache_key and content:
+            self.response_cache.put(cache_key, content)
+        return content
             
     # This entire method definition replaces the old one, explicitly removing the problematic comment
     def analyze_with_custom_prompt(self, data: Dict[str, Any], custom_prompt: str, template_name: Optional[str] = None):
@@ -890,7 +1131,7 @@ class LLMService(QObject):
     # --- Stream Control ---
     def cancel_stream(self):
         """Sets the cancel flag for the current streaming operation."""
-        if self._current_stream_thread and self._current_stream_thread.is_alive():
+        if self._current_stream_task is not None:
             self.logger.info("Stream cancellation requested.")
             self._cancel_requested = True
         else:
@@ -913,7 +1154,6 @@ class LLMService(QObject):
 
         config_name = config.get('name')
         api_url = config.get('api_url')
-        api_key_from_config = config.get('api_key') # This could be a string or list for Gemini
         model = config.get('model')
         
         # Determine provider type string
@@ -936,95 +1176,22 @@ class LLMService(QObject):
             logger.debug(f"Model not explicitly provided for '{config_name}'. Provider's test logic will proceed.")
 
 
-        # --- Instantiate temporary Provider ---
+        # --- Instantiate temporary Provider (与初始化共用 _build_provider) ---
         try:
-            # Create a temporary config for provider initialization
-            # This primarily passes through settings like temperature, max_tokens, timeout
-            # The core api_url, api_key, model are handled directly by the provider
-            provider_init_kwargs = {
-                'temperature': config.get('temperature', 0.7),
-                'max_tokens': config.get('max_tokens', 2048),
-                'timeout': config.get('timeout', 60) 
-            }
-            
-            # Note: The LLMProviderInterface's __init__ expects (api_key, api_url, model, **config),
-            # but specific implementations might vary slightly or handle api_key differently (e.g., Gemini with list).
-            
-            if provider_type_str == "google": # Gemini
-                # GeminiProvider expects api_keys (plural) as List[str]
-                # The api_key_from_config for Gemini should ideally be a list from the UI/ViewModel.
-                # If it's a single string (e.g. from older storage or direct input), wrap it.
-                keys_for_gemini = api_key_from_config
-                if isinstance(api_key_from_config, str):
-                    keys_for_gemini = [api_key_from_config]
-                elif not isinstance(api_key_from_config, list) and api_key_from_config is not None: # Handle other unexpected types
-                    logger.warning(f"Gemini test expected API key as list or string, got {type(api_key_from_config)}. Converting to list of string.")
-                    keys_for_gemini = [str(api_key_from_config)]
-                elif api_key_from_config is None: # No key provided
-                     keys_for_gemini = []
-
-
-                if not keys_for_gemini:
-                     logger.warning(f"No API key(s) provided for Gemini test config '{config_name}'. Test will likely fail if key is required by endpoint.")
-                
-                # GeminiProvider's __init__ takes api_keys: List[str]
-                # We pass the list here. The test logic inside GeminiProvider or this method might iterate.
-                temp_provider = GeminiProvider(api_keys=keys_for_gemini, api_url=api_url, model=model, config=provider_init_kwargs)
-
-            elif provider_type_str == "volcengine_ark":
-                # VolcengineProvider expects api_key as a dict {'access_key': '...', 'secret_key': '...'} or a single string API Token
-                # This instantiation might need to be specific if VolcengineProvider has a unique __init__
-                # For testing, if its __init__ is compatible with OpenAIProvider or LLMProviderInterface base:
-                logger.debug(f"Instantiating temporary provider for Volcengine (likely OpenAI compatible for test structure): {config_name}")
-                temp_provider = OpenAIProvider(api_key=str(api_key_from_config) if api_key_from_config else None, api_url=api_url, model=model, config=provider_init_kwargs)
-
-            elif provider_type_str == "ollama":
-                logger.debug(f"Instantiating temporary OllamaProvider for test: {config_name}")
-                # OllamaProvider's __init__ is (self, api_url: str, model: str, config: Optional[Dict[str, Any]] = None)
-                temp_provider = OllamaProvider(api_url=api_url, model=model, config=provider_init_kwargs)
-            
-            elif provider_type_str in ["openai", "anthropic", "azure", "xai", "mistral", "fireworks", "moonshot", "baidu", "generic"]:
-                logger.debug(f"Instantiating temporary provider {provider_type_str} (or OpenAI compatible) for test: {config_name}")
-                # These providers generally expect a single string API key.
-                if not isinstance(api_key_from_config, str) and api_key_from_config is not None:
-                    logger.warning(f"Provider '{provider_type_str}' expected API key as string, got {type(api_key_from_config)}. Converting.")
-                    api_key_for_provider = str(api_key_from_config)
-                else:
-                    api_key_for_provider = api_key_from_config
-
-                if not api_key_for_provider and provider_type_str not in ["generic", "ollama"]: # Generic/Ollama might not need key
-                    logger.warning(f"API key not provided for '{provider_type_str}' test config '{config_name}'. Test may fail if required.")
-
-                if provider_type_str == "openai":
-                    temp_provider = OpenAIProvider(api_key=api_key_for_provider, api_url=api_url, model=model, config=provider_init_kwargs)
-                elif provider_type_str == "anthropic":
-                    temp_provider = AnthropicProvider(api_key=api_key_for_provider, api_url=api_url, model=model, config=provider_init_kwargs)
-                elif provider_type_str == "azure":
-                    # Azure might need more specific config like api_base, api_version, deployment_id
-                    # These should be part of the 'config' dictionary if needed by AzureProvider
-                    # For now, basic instantiation:
-                    azure_specific_config = config.get('azure_config', {}) # Example
-                    provider_init_kwargs.update(azure_specific_config)
-                    temp_provider = OpenAIProvider(api_key=api_key_for_provider, api_url=api_url, model=model, config=provider_init_kwargs)
-                # Add other specific provider instantiations here if they differ significantly
-                # ... XAI, Mistral, Fireworks, Moonshot, Baidu ...
-                else: # Fallback to OpenAIProvider for generic compatible ones if not explicitly handled
-                    logger.debug(f"Using OpenAIProvider as a base for testing '{provider_type_str}'")
-                    temp_provider = OpenAIProvider(api_key=api_key_for_provider, api_url=api_url, model=model, config=provider_init_kwargs)
-            else:
-                msg = f"Unsupported provider type for testing: '{provider_type_str}'"
-                logger.error(msg)
-                return False, msg
-
+            temp_provider = self._build_provider(config, provider_type_str, connection_test=True)
         except Exception as e:
             msg = f"Failed to instantiate provider '{provider_type_str}' for testing: {e}"
             logger.error(msg, exc_info=True)
             return False, msg
 
-        if not temp_provider: # Double check
-             return False, f"Provider instance for '{provider_type_str}' could not be created."
+        if not temp_provider:
+            return False, f"无法为 '{config_name}' 创建 Provider 实例 (类型: {provider_type_str})，请检查 API Key 和 URL 配置。"
 
-        # --- Perform Test ---
+        return self._run_connection_test(temp_provider, config_name)
+
+    def _run_connection_test(self, temp_provider: LLMProviderInterface, config_name: Optional[str]) -> Tuple[bool, str]:
+        """向已实例化的 Provider 发送一次测试请求并返回 (是否成功, 消息)。"""
+        logger = self.logger
         test_timeout = temp_provider._get_config_value('timeout', 60) # Use provider's configured timeout for the test call itself, or a general test timeout
 
         try:
@@ -1075,6 +1242,13 @@ class LLMService(QObject):
             logger.error(f"Unexpected error during test connection for '{config_name}': {e}", exc_info=True)
             return False, f"测试连接时发生意外错误: {e}"
 
+    def test_all_configs(self, configs: List[Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """并发测试多个配置的连接 (共享 ApiClient 的连接池)，结果顺序与输入一致。"""
+        if not configs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(configs), 8), thread_name_prefix="LLMConfigTest") as executor:
+            return list(executor.map(self.test_connection_with_config, configs))
+
     def analyze_multiple_news(self, news_items: list, analysis_type: str = "多角度整合") -> str:
         """分析多条新闻，支持多种分析类型
         
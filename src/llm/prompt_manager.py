@@ -1,13 +1,35 @@
 import os
 import logging
 import json
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, Any, List, Mapping, Tuple
+
+def _first(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """Returns the value of the first key in data that is present and not None."""
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
+
 
 class PromptManager:
     """
     Manages loading and formatting of LLM prompt templates, including category metadata.
     """
     METADATA_FILENAME = "prompts_metadata.json"
+    # 分析类型 -> 模板名 (未显式指定模板时使用)
+    ANALYSIS_TEMPLATE_MAP: Mapping[str, str] = MappingProxyType({
+        '摘要': 'summary', '深度分析': 'deep_analysis',
+        '关键观点': 'key_points', '事实核查': 'fact_check',
+        '重要程度和立场分析': 'importance_stance',
+        '新闻相似度分析': 'news_similarity_enhanced', '多角度整合': 'news_similarity_enhanced',
+        '对比分析': 'news_similarity_enhanced', '时间线梳理': 'news_similarity_enhanced',
+        '信源多样性分析': 'news_similarity_enhanced'
+        # Add other mappings as needed
+    })
+    # 没有对应模板时使用的通用提示
+    GENERIC_PROMPT_TEMPLATE = "请对以下新闻进行{analysis_type}。\n\n新闻标题: {title}\n新闻来源: {source}\n发布日期: {pub_date}\n新闻内容:\n{content}"
 
     def __init__(self, base_dir: Optional[str] = None):
         """
@@ -28,6 +50,11 @@ class PromptManager:
             self.prompts_dir = os.path.join(os.path.dirname(current_dir), 'prompts')
 
         self.metadata_path = os.path.join(self.prompts_dir, self.METADATA_FILENAME)
+        # 模板内容缓存 ((prompts_dir, 调用方传入的模板名) -> (文件路径, 内容)，未找到时内容为 None)
+        # 命中时无需再拼接路径；经本类保存/删除时自动失效
+        self._template_cache: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+        # 模板保存/删除/重新加载后的回调 (参数为模板名，全部失效时为 None)
+        self._change_listeners: List[Callable[[Optional[str]], None]] = []
         self.metadata: Dict[str, Any] = self._load_metadata()
         # Ensure top-level keys for templates and defined categories exist
         if "_templates" not in self.metadata:
@@ -39,8 +66,21 @@ class PromptManager:
              self.logger.warning(f"Prompts directory does not exist or is not a directory: {self.prompts_dir}")
         else:
              self.logger.info(f"PromptManager initialized. Prompts directory: {self.prompts_dir}")
+             self._preload_templates()
         self.logger.info(f"Metadata will be loaded from/saved to: {self.metadata_path}")
 
+    def _preload_templates(self):
+        """一次扫描目录并读入所有模板，首次分析时不再有磁盘读取。"""
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                names = [entry.name[:-4] for entry in entries if entry.name.endswith('.txt') and entry.is_file()]
+        except OSError as e:
+            self.logger.warning(f"Failed to scan prompts directory {self.prompts_dir}: {e}")
+            return
+        for name in names:
+            self.load_template(name)
+        self.logger.debug(f"Preloaded {len(names)} prompt templates.")
+
     def _load_metadata(self) -> Dict[str, Any]:
         """Loads metadata from the JSON file. Returns structured dict if not found or error."""
         if not os.path.exists(self.metadata_path):
@@ -213,20 +253,49 @@ class PromptManager:
         self.logger.warning(f"Attempted to remove metadata for non-existent template: '{template_filename}'.")
         return False # Or True if not finding it is also considered a success for removal
 
-    def load_template(self, template_name: str) -> Optional[str]:
-        """Loads the content of a specific prompt template file."""
+    def _template_path(self, template_name: str) -> str:
         # Ensure template name doesn't have extension
         template_name = os.path.splitext(template_name)[0]
-        file_path = os.path.join(self.prompts_dir, f"{template_name}.txt")
+        return os.path.join(self.prompts_dir, f"{template_name}.txt")
+
+    def load_template(self, template_name: str) -> Optional[str]:
+        """Loads the content of a specific prompt template file (cached after the first read)."""
+        cache_key = (self.prompts_dir, template_name)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            return cached[1]
+        file_path = self._template_path(template_name)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            with open(file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
+            # 二进制读取跳过文本模式的逐字符换行转换；Windows 上保存的模板可能含 \r\n，仅在需要时统一
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
         except FileNotFoundError:
             self.logger.error(f"Prompt template file not found: {file_path}")
-            return None
+            content = None
         except Exception as e:
+            # 读取出错 (如权限问题) 不缓存，下次调用重试
             self.logger.error(f"Failed to read prompt template file: {file_path} - {e}", exc_info=True)
             return None
+        self._template_cache[cache_key] = (file_path, content)
+        return content
+
+    def add_change_listener(self, callback: Callable[[Optional[str]], None]):
+        """注册模板变化后的回调，例如让依赖模板的结果缓存随之失效。"""
+        self._change_listeners.append(callback)
+
+    def invalidate(self, template_name: Optional[str] = None):
+        """清除模板缓存 (template_name 为 None 时清除全部)，用于模板文件在外部被修改后重新读取。"""
+        if template_name is None:
+            self._template_cache.clear()
+        else:
+            # 同一文件可能以不同写法 ('summary' / 'summary.txt') 被缓存，按文件路径清除
+            file_path = self._template_path(template_name)
+            for key in [k for k, (path, _) in self._template_cache.items() if path == file_path]:
+                del self._template_cache[key]
+        for callback in self._change_listeners:
+            callback(template_name)
 
     def get_formatted_prompt(self, template_name: Optional[str], data: Dict[str, Any], analysis_type: Optional[str] = None) -> str:
         """
@@ -237,36 +306,20 @@ class PromptManager:
 
         # Map analysis type to template name if template_name is not provided
         if analysis_type and not effective_template_name:
-             template_name_map = {
-                 '摘要': 'summary', '深度分析': 'deep_analysis',
-                 '关键观点': 'key_points', '事实核查': 'fact_check',
-                 '重要程度和立场分析': 'importance_stance',
-                 '新闻相似度分析': 'news_similarity_enhanced', '多角度整合': 'news_similarity_enhanced',
-                 '对比分析': 'news_similarity_enhanced', '时间线梳理': 'news_similarity_enhanced',
-                 '信源多样性分析': 'news_similarity_enhanced'
-                 # Add other mappings as needed
-             }
-             effective_template_name = template_name_map.get(analysis_type)
+             effective_template_name = self.ANALYSIS_TEMPLATE_MAP.get(analysis_type)
 
         if effective_template_name:
             template = self.load_template(effective_template_name)
             if template:
                 try:
-                    # Ensure all necessary keys are present in data for formatting
-                    # Extract data safely using .get with defaults
-                    format_data = {
-                        'title': data.get('title', '无标题'),
-                        'source': data.get('source_name', data.get('source', '未知来源')), # Allow 'source' as fallback
-                        'pub_date': str(data.get('pub_date', data.get('publish_time', '未知日期'))), # Ensure pub_date is string
-                        'content': data.get('content', data.get('summary', data.get('description', '无内容'))), # Flexible content source
-                        'news_items': data.get('news_items', '') # 添加对news_items占位符的支持
-                    }
+                    format_data = self._prompt_fields(data)
                     
                     # 特殊处理news_similarity模板，确保news_items存在
                     if (effective_template_name == 'news_similarity' or effective_template_name == 'news_similarity_enhanced') and 'news_items' not in data:
                         self.logger.warning(f"Missing 'news_items' key for {effective_template_name} template, using empty string")
                         # 已经在format_data中设置了默认值，不需要额外处理
-                    return template.format(**format_data)
+                    # format_map 直接使用 format_data，省去 ** 解包生成新字典
+                    return template.format_map(format_data)
                 except KeyError as e:
                     self.logger.error(f"Missing key in prompt template '{effective_template_name}' for data: {e}")
                     error_type = analysis_type or effective_template_name
@@ -278,13 +331,20 @@ class PromptManager:
         else:
             # Fallback to generic prompt if no specific template found or requested
             self.logger.warning(f"No specific prompt template found for analysis type: '{analysis_type}'. Using generic prompt.")
-            # Extract data safely for generic prompt
-            title = data.get('title', '无标题')
-            source = data.get('source_name', data.get('source', '未知来源'))
-            pub_date = str(data.get('pub_date', data.get('publish_time', '未知日期')))
-            content = data.get('content', data.get('summary', data.get('description', '无内容')))
-            effective_analysis_type = analysis_type or "分析" # Use "分析" if type is None
-            return f"请对以下新闻进行{effective_analysis_type}。\n\n新闻标题: {title}\n新闻来源: {source}\n发布日期: {pub_date}\n新闻内容:\n{content}"
+            format_data = self._prompt_fields(data)
+            format_data['analysis_type'] = analysis_type or "分析" # Use "分析" if type is None
+            return self.GENERIC_PROMPT_TEMPLATE.format_map(format_data)
+
+    @staticmethod
+    def _prompt_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extracts the template placeholders from data, trying fallback keys in order."""
+        return {
+            'title': _first(data, 'title', default='无标题'),
+            'source': _first(data, 'source_name', 'source', default='未知来源'), # Allow 'source' as fallback
+            'pub_date': str(_first(data, 'pub_date', 'publish_time', default='未知日期')), # Ensure pub_date is string
+            'content': _first(data, 'content', 'summary', 'description', default='无内容'), # Flexible content source
+            'news_items': _first(data, 'news_items', default=''), # 添加对news_items占位符的支持
+        }
 
     def save_prompt_content(self, template_name: str, content: str) -> bool:
         """Saves the content of a specific prompt template file."""
@@ -296,6 +356,7 @@ class PromptManager:
                  self.logger.info(f"Prompts directory created: {self.prompts_dir} before saving {template_filename}")
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            self.invalidate(template_name)
             self.logger.info(f"Saved prompt content for '{template_filename}' to {file_path}")
             return True
         except Exception as e:
@@ -309,6 +370,7 @@ class PromptManager:
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
+                self.invalidate(template_name)
                 self.logger.info(f"Deleted prompt file: {file_path}")
                 return True
             else:
@@ -3,6 +3,7 @@ import logging
 from typing import List, Dict, Optional, Union, Any
 
 from .base import LLMProviderInterface, ProviderConfig
+from src.utils import json_utils
 
 logger = logging.getLogger('news_analyzer.llm.provider.anthropic')
 
@@ -20,22 +21,32 @@ class AnthropicProvider(LLMProviderInterface):
         """Returns headers for Anthropic API."""
         if not self.api_key:
             raise ValueError(f"API key is required for provider '{self.get_identifier()}'.")
-        return {
-            'Content-Type': 'application/json',
-            'x-api-key': self.api_key,
-            'anthropic-version': self._get_config_value('anthropic_version', '2023-06-01') # Allow overriding version
-        }
+        # 每次请求都会调用；按 (api_key, version) 缓存，任一变化时自动重建
+        version = self._get_config_value('anthropic_version', self.DEFAULT_API_VERSION) # Allow overriding version
+        cached = getattr(self, '_cached_headers', None)
+        if cached is None or cached[0] != (self.api_key, version):
+            cached = ((self.api_key, version), {
+                'Content-Type': 'application/json',
+                'x-api-key': self.api_key,
+                'anthropic-version': version
+            })
+            self._cached_headers = cached
+        return cached[1]
 
     def prepare_request_payload(self, messages: List[Dict[str, str]], stream: bool, **kwargs) -> Dict[str, Any]:
         """Prepares the JSON payload for Anthropic API."""
         # Anthropic doesn't use 'system' role directly in messages, it uses a system parameter
-        system_prompt = ""
-        user_assistant_messages = []
-        for msg in messages:
-            if msg['role'] == 'system':
-                system_prompt = msg['content'] # Extract system prompt
-            else:
-                user_assistant_messages.append(msg)
+        if messages and messages[0]['role'] == 'system':
+            # 快速路径：LLMService 总是把唯一的 system 消息放在首位 (chat() 会合并调用方的 system 消息)
+            system_prompt, user_assistant_messages = messages[0]['content'], messages[1:]
+        else:
+            system_prompt = ""
+            user_assistant_messages = []
+            for msg in messages:
+                if msg['role'] == 'system':
+                    system_prompt = msg['content'] # Extract system prompt
+                else:
+                    user_assistant_messages.append(msg)
 
         payload = {
             'model': self.model,
@@ -43,60 +54,65 @@ class AnthropicProvider(LLMProviderInterface):
             'stream': stream
         }
         if system_prompt:
-            payload['system'] = system_prompt
+            if self._get_config_value('prompt_caching', True):
+                # 标记 system 块可被服务端缓存：同一会话内 system 提示 (模板+上下文) 不变，后续请求按缓存价计费
+                payload['system'] = [{'type': 'text', 'text': system_prompt,
+                                      'cache_control': {'type': 'ephemeral'}}]
+            else:
+                payload['system'] = system_prompt
 
         # Add optional parameters
-        temperature = self._get_config_value('temperature')
+        temperature = self._temperature
         if temperature is not None:
             payload['temperature'] = temperature
 
         # Anthropic uses 'max_tokens' directly in the root
-        max_tokens = self._get_config_value('max_tokens')
+        max_tokens = self._max_tokens
         if max_tokens is not None:
             payload['max_tokens'] = max_tokens # Note: Anthropic calls this max_tokens_to_sample in older versions
 
-        payload.update(kwargs)
+        if kwargs:
+            payload.update(kwargs)
         return payload
 
     def parse_response(self, response_data: Dict[str, Any]) -> str:
         """Parses the content from a non-streaming Anthropic response."""
         try:
             # Content is a list of blocks, usually one text block
-            content_blocks = response_data.get('content', [])
-            text_content = ""
-            for block in content_blocks:
-                if block.get('type') == 'text':
-                    text_content += block.get('text', '')
-            return text_content.strip()
+            content_blocks = response_data.get('content') or ()
+            return "".join(block.get('text', '') for block in content_blocks
+                           if block.get('type') == 'text').strip()
         except (IndexError, KeyError, TypeError) as e:
             logger.error(f"Failed to extract content from '{self.get_identifier()}' response: {e}. Response: {response_data}", exc_info=True)
             return ""
 
     def process_stream_line(self, chunk_data: Union[str, bytes]) -> tuple[Optional[str], bool]:
-        """Parses a single data payload from an Anthropic SSE stream event.
+        """Parses a single line from an Anthropic SSE stream.
 
-        Assumes chunk_data is the JSON string from the 'data' field of an SSE event.
-        The LLMService is responsible for identifying the event type (e.g., content_block_delta, message_stop).
-        This method will only be called by LLMService for events that might contain text delta.
+        Accepts raw SSE lines ('event: ...', 'data: {...}') or the bare JSON payload of a 'data' field.
+        'event:' lines are ignored since every data payload carries its own 'type'.
 
         Returns:
-            A tuple containing the text content (if any) and a boolean (always False for Anthropic,
-            as end-of-stream is determined by LLMService via 'message_stop' event).
+            A tuple containing the text content (if any) and a boolean that is True on the 'message_stop' event.
         """
-        if isinstance(chunk_data, bytes):
-            try:
-                decoded_chunk = chunk_data.decode('utf-8').strip()
-            except UnicodeDecodeError:
-                logger.warning(f"Failed to decode stream chunk as UTF-8: {chunk_data!r}")
-                return None, False
-        else:
-            decoded_chunk = chunk_data.strip()
+        # bytes 直接交给 json_utils.loads (orjson 原生解析 UTF-8 bytes)，不再先 decode
+        decoded_chunk = chunk_data.strip()
 
         if not decoded_chunk:
             return None, False
 
+        is_bytes = isinstance(decoded_chunk, bytes)
+        data_prefix, event_prefix = (b'data:', b'event:') if is_bytes else ('data:', 'event:')
+        if decoded_chunk.startswith(event_prefix):
+            return None, False
+        # 快速路径：大部分事件 (ping / message_start / content_block_start 等) 不含文本，子串检查后直接跳过 JSON 解析
+        if (b'content_block_delta' if is_bytes else 'content_block_delta') not in decoded_chunk:
+            return None, (b'"message_stop"' if is_bytes else '"message_stop"') in decoded_chunk
+        if decoded_chunk.startswith(data_prefix):
+            decoded_chunk = decoded_chunk[len(data_prefix):].strip()
+
         try:
-            data = json.loads(decoded_chunk)
+            data = json_utils.loads(decoded_chunk)
             event_type = data.get('type')
 
             if event_type == 'content_block_delta':
@@ -108,13 +124,13 @@ class AnthropicProvider(LLMProviderInterface):
                 # If there was content here, we'd process it.
                 # For now, we don't expect text content directly in message_delta events of interest for chunk processing.
                 pass # No direct text content to return from this event for now
-            # Other event types like 'message_start', 'content_block_start', 'content_block_stop', 'message_stop'
+            # Other event types like 'message_start', 'content_block_start', 'content_block_stop'
             # are handled by LLMService or don't yield immediate text chunks for the main content stream.
             # 'ping' events are also handled by the SSE client usually.
 
             return None, False # No text content extracted from this specific chunk_data
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning(f"Error parsing '{self.get_identifier()}' SSE data: {e}. Data: {decoded_chunk}")
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Error parsing '{self.get_identifier()}' SSE data: {e}. Data: {decoded_chunk!r}")
             return None, False
 
     def get_stream_stop_signal(self) -> Optional[str]:
@@ -132,7 +148,7 @@ class AnthropicProvider(LLMProviderInterface):
             'max_tokens': 5 # Use max_tokens for consistency with API
         }
         # Add temperature if configured
-        temperature = self._get_config_value('temperature')
+        temperature = self._temperature
         if temperature is not None:
              payload['temperature'] = temperature
         return payload
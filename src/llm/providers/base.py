@@ -26,6 +26,9 @@ class LLMProviderInterface(abc.ABC):
         self.api_url = api_url
         self.model = model
         self.config: ProviderConfig = config if config is not None else {}
+        # 每次构造请求都会读取的参数在此解析一次 (配置在 Provider 生命周期内不变，变更时会重建 Provider)
+        self._temperature = self.config.get('temperature')
+        self._max_tokens = self.config.get('max_tokens')
         if kwargs: # Log if any unexpected kwargs are passed due to old call signatures
             import logging # Local import for safety
             logger = logging.getLogger('news_analyzer.llm.provider.base')
@@ -112,6 +115,13 @@ class LLMProviderInterface(abc.ABC):
         """
         pass
 
+    def get_stream_url(self) -> str:
+        """
+        Returns the full URL used for streaming chat requests.
+        Defaults to the base api_url; providers with a dedicated streaming endpoint can override this.
+        """
+        return self.api_url
+
     def get_test_connection_url(self) -> str:
         """
         Returns the full URL to be used for a test connection request.
@@ -9,6 +9,7 @@ import time # Import time for potential backoff in retries (optional)
 import requests # Ensure requests is imported
 
 from .base import LLMProviderInterface, ProviderConfig
+from src.utils import json_utils
 from src.utils.api_client import ApiClient # Assuming ApiClient is needed
 from src.llm.formatter import LLMResponseFormatter # For error formatting
 from src.llm.exception import LLMError # Only import base error
@@ -200,7 +201,7 @@ class GeminiProvider(LLMProviderInterface):
             return None, False # Not an error, but no content and not final.
 
         try:
-            data = json.loads(actual_json_str)
+            data = json_utils.loads(actual_json_str)
             logger.debug(f"Parsed Gemini stream JSON: {data}")
             
             text_content: Optional[str] = None
@@ -3,6 +3,7 @@ import logging
 from typing import List, Dict, Optional, Union, Any
 
 from .base import LLMProviderInterface
+from src.utils import json_utils
 
 logger = logging.getLogger('news_analyzer.llm.provider.ollama')
 
@@ -37,7 +38,7 @@ class OllamaProvider(LLMProviderInterface):
 
         # Add optional parameters under 'options'
         options = {}
-        temperature = self._get_config_value('temperature')
+        temperature = self._temperature
         if temperature is not None:
             options['temperature'] = temperature
 
@@ -45,7 +46,7 @@ class OllamaProvider(LLMProviderInterface):
         # but it might be ignored or behave differently in streaming.
         # We include it based on the original code's logic for non-streaming.
         if not stream:
-            max_tokens = self._get_config_value('max_tokens')
+            max_tokens = self._max_tokens
             if max_tokens is not None:
                 # Ollama calls it num_predict
                 options['num_predict'] = max_tokens
@@ -54,7 +55,8 @@ class OllamaProvider(LLMProviderInterface):
             payload['options'] = options
 
         # Allow overriding via kwargs
-        payload.update(kwargs)
+        if kwargs:
+            payload.update(kwargs)
         return payload
 
     def parse_response(self, response_data: Dict[str, Any]) -> str:
@@ -73,20 +75,14 @@ class OllamaProvider(LLMProviderInterface):
     def process_stream_line(self, chunk_data: Union[str, bytes]) -> tuple[Optional[str], bool]:
         """Parses a single chunk from an Ollama stream (/api/chat) and indicates if it's the final chunk."""
         # Ollama stream returns JSON objects line by line
-        if isinstance(chunk_data, bytes):
-            try:
-                decoded_chunk = chunk_data.decode('utf-8').strip()
-            except UnicodeDecodeError:
-                logger.warning(f"Failed to decode stream chunk as UTF-8: {chunk_data!r}")
-                return None, False # Not final if error occurs mid-stream typically
-        else:
-            decoded_chunk = chunk_data.strip()
+        # bytes 直接交给 json_utils.loads (orjson 原生解析 UTF-8 bytes)，不再先 decode
+        decoded_chunk = chunk_data.strip()
 
         if not decoded_chunk:
             return None, False # Empty line, not final
 
         try:
-            data = json.loads(decoded_chunk)
+            data = json_utils.loads(decoded_chunk)
             is_done = data.get('done', False)
             
             # Extract content from message.content
@@ -107,8 +103,8 @@ class OllamaProvider(LLMProviderInterface):
                 # If not done, return the content (or empty string if no content key but not done)
                 return (content if content is not None else ""), False
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning(f"Error parsing '{self.get_identifier()}' stream chunk: {e}. Data: {decoded_chunk}")
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Error parsing '{self.get_identifier()}' stream chunk: {e}. Data: {decoded_chunk!r}")
             return None, False # Error parsing, assume not final
 
     def get_stream_stop_signal(self) -> Optional[str]:
@@ -3,6 +3,7 @@ import logging
 from typing import List, Dict, Optional, Union, Any
 
 from .base import LLMProviderInterface, ProviderConfig
+from src.utils import json_utils
 
 logger = logging.getLogger('news_analyzer.llm.provider.openai')
 
@@ -12,9 +13,17 @@ class OpenAIProvider(LLMProviderInterface):
     (e.g., X-AI, Mistral, Fireworks, Generic OpenAI-like endpoints).
     """
     PROVIDER_NAME = "openai_compatible"
+    # 除 data 以外的 SSE 字段名 (str 与 bytes 两种形式)，对 OpenAI 流不携带内容
+    _SSE_OTHER_FIELDS = frozenset({"event", "id", "retry", b"event", b"id", b"retry"})
+    _STOP_SIGNAL = "[DONE]"
+    # 按行类型预先准备好的 (结束信号, data 前缀, 注释前缀)，避免每行调用 get_stream_stop_signal() 并 encode
+    _SSE_TOKENS = {
+        str: (_STOP_SIGNAL, "data:", ":"),
+        bytes: (_STOP_SIGNAL.encode(), b"data:", b":"),
+    }
 
     def __init__(self, api_key: str, api_url: str, model: str, config: Optional[Dict[str, Any]] = None):
-        super().__init__(api_key, api_url, model)
+        super().__init__(api_key, api_url, model, config)
 
     def get_identifier(self) -> str:
         # Use a generic identifier as this class handles multiple OpenAI-like APIs
@@ -28,10 +37,15 @@ class OpenAIProvider(LLMProviderInterface):
         if not self.api_key:
             logger.warning(f"API key is missing for provider '{self.get_identifier()}'. Request might fail.")
             return {'Content-Type': 'application/json'}
-        return {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}'
-        }
+        # 每次请求都会调用；按 api_key 缓存，key 变化时自动重建
+        cached = getattr(self, '_cached_headers', None)
+        if cached is None or cached[0] != self.api_key:
+            cached = (self.api_key, {
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {self.api_key}'
+            })
+            self._cached_headers = cached
+        return cached[1]
 
     def prepare_request_payload(self, messages: List[Dict[str, str]], stream: bool, **kwargs) -> Dict[str, Any]:
         """Prepares the JSON payload for OpenAI-compatible APIs."""
@@ -41,16 +55,17 @@ class OpenAIProvider(LLMProviderInterface):
             'stream': stream
         }
         # Add optional parameters from config if they exist
-        temperature = self._get_config_value('temperature')
+        temperature = self._temperature
         if temperature is not None:
             payload['temperature'] = temperature
 
-        max_tokens = self._get_config_value('max_tokens')
+        max_tokens = self._max_tokens
         if max_tokens is not None:
             payload['max_tokens'] = max_tokens
 
         # Allow overriding specific parameters via kwargs if needed
-        payload.update(kwargs)
+        if kwargs:
+            payload.update(kwargs)
 
         return payload
 
@@ -67,53 +82,77 @@ class OpenAIProvider(LLMProviderInterface):
             return ""
 
     def process_stream_line(self, chunk_data: Union[str, bytes]) -> tuple[Optional[str], bool]:
-        """Parses a single line from an OpenAI-compatible SSE stream.
+        """Parses a chunk from an OpenAI-compatible SSE stream.
+
+        The chunk is normally a single line, but a transport that buffers several
+        events into one read may hand over multiple lines at once; their deltas are
+        concatenated so none are dropped.
 
         Returns:
             A tuple containing the text content (if any) and a boolean indicating if this is the final chunk.
         """
-        if isinstance(chunk_data, bytes):
-            try:
-                decoded_chunk = chunk_data.decode('utf-8').strip()
-            except UnicodeDecodeError:
-                logger.warning(f"Failed to decode stream chunk as UTF-8: {chunk_data!r}")
-                return None, False
-        else:
-            decoded_chunk = chunk_data.strip()
+        # bytes 直接交给 json_utils.loads (orjson 原生解析 UTF-8 bytes)，不再先 decode
+        decoded_chunk = chunk_data.strip()
 
         if not decoded_chunk:  # Ignore empty lines
             return None, False
 
-        if decoded_chunk == self.get_stream_stop_signal():
+        newline = b"\n" if isinstance(decoded_chunk, bytes) else "\n"
+        if newline not in decoded_chunk:
+            return self._process_sse_line(decoded_chunk)
+
+        # 一次读取到多个事件 (以空行分隔)：逐行解析并拼接增量
+        contents = []
+        for line in decoded_chunk.split(newline):
+            content, is_final = self._process_sse_line(line.strip())
+            if content:
+                contents.append(content)
+            if is_final:
+                return "".join(contents) or None, True
+        return ("".join(contents) if contents else None), False
+
+    def _process_sse_line(self, line: Union[str, bytes]) -> tuple[Optional[str], bool]:
+        """Parses one stripped SSE line (``data:`` field, comment or other field)."""
+        if not line:
+            return None, False
+
+        stop_signal, data_prefix, comment_prefix = self._SSE_TOKENS[type(line)]
+
+        if line == stop_signal:
             logger.debug("Received SSE stop signal [DONE].")
             return None, True # Final chunk signal
 
-        if decoded_chunk.startswith("data: "):
-            json_str = decoded_chunk[len("data: "):].strip()
-            if json_str == self.get_stream_stop_signal(): # Should be caught above, but defensive
+        if line.startswith(data_prefix):
+            # SSE 规范中 "data:" 后的空格是可选的
+            json_str = line[5:].strip()
+            if json_str == stop_signal: # Should be caught above, but defensive
                 logger.debug("Received SSE stop signal [DONE] after data prefix.")
                 return None, True # Final chunk signal
+        elif line.startswith(comment_prefix):
+            return None, False # SSE comment / keep-alive
+        elif line.partition(comment_prefix)[0] in self._SSE_OTHER_FIELDS:
+            return None, False # event: / id: / retry: carry no content for OpenAI streams
         else:
-            logger.warning(f"Received unexpected SSE chunk format (not [DONE] and no 'data:' prefix): {decoded_chunk!r}")
+            # debug 而非 warning：默认 INFO 级别下不在每个 token 上格式化 repr
+            logger.debug("Received unexpected SSE chunk format (not [DONE] and no 'data:' prefix): %r", line)
             return None, False # Invalid chunk, not final
 
         if not json_str:
             # logger.debug("Received empty data chunk after prefix removal.")
             return "", False # Empty delta, not final
 
-        logger.debug(f"Attempting to parse JSON string: {json_str!r}")
         try:
-            data = json.loads(json_str)
+            data = json_utils.loads(json_str)
             delta = data.get('choices', [{}])[0].get('delta', {})
             content = delta.get('content')
             return content if content is not None else "", False # Return content or empty string, not final
-        except (json.JSONDecodeError, IndexError, KeyError, TypeError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError, IndexError, KeyError, TypeError) as e:
             logger.warning(f"Error parsing '{self.get_identifier()}' SSE JSON: {e}. JSON String: {json_str!r}")
             return None, False # Error, not final
 
     def get_stream_stop_signal(self) -> Optional[str]:
         """Returns the stop signal for OpenAI SSE streams."""
-        return "[DONE]"
+        return self._STOP_SIGNAL
 
     def test_connection_payload(self) -> Dict[str, Any]:
         """Returns a minimal payload for testing OpenAI-compatible connections."""
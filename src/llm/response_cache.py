@@ -0,0 +1,126 @@
+"""
+LLM 响应缓存
+
+按 (provider, api_url, model, temperature, max_tokens, messages) 精确匹配缓存非流式请求的解析结果，
+内存中为 LRU，可选地持久化到 SQLite 以便跨进程重启复用 (表中只保留最近写入的 max_db_entries 条)。
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from src.utils import json_utils
+
+logger = logging.getLogger('news_analyzer.llm.response_cache')
+
+
+class ResponseCache:
+    """精确匹配的 LLM 响应缓存 (内存 LRU + 可选 SQLite)。"""
+
+    def __init__(self, max_entries: int = 512, db_path: Optional[str] = None,
+                 allow_nonzero_temperature: bool = False, max_db_entries: int = 5000):
+        """
+        Args:
+            max_entries: 内存中保留的最大条目数。
+            db_path: SQLite 文件路径；为 None 时只使用内存缓存。
+            allow_nonzero_temperature: temperature > 0 时结果本身带随机性，默认不缓存。
+            max_db_entries: SQLite 中保留的最大条目数，超出时删除最早写入的行。
+        """
+        self.max_entries = max_entries
+        self.max_db_entries = max_db_entries
+        self.allow_nonzero_temperature = allow_nonzero_temperature
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                self._conn.execute("PRAGMA synchronous = NORMAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_response_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+                self._conn.commit()
+            except (sqlite3.Error, OSError) as e:
+                logger.error(f"无法打开 LLM 响应缓存数据库 {db_path}，仅使用内存缓存: {e}")
+                self._conn = None
+
+    @staticmethod
+    def make_key(provider_id: str, api_url: Optional[str], model: Optional[str],
+                 temperature: Optional[float], max_tokens: Optional[int],
+                 messages: List[Dict[str, Any]]) -> str:
+        """计算请求的稳定缓存键 (消息只取 role / content，其余字段不影响命中)。"""
+        raw = json_utils.dumps_canonical({'pid': provider_id, 'url': api_url, 'model': model,
+                                          'temp': temperature, 'max_tokens': max_tokens,
+                                          'msgs': [{'role': m.get('role'), 'content': m.get('content')}
+                                                   for m in messages]})
+        return hashlib.blake2b(raw, digest_size=20).hexdigest()
+
+    def is_cacheable(self, temperature: Optional[float]) -> bool:
+        """temperature 为 0/未设置，或显式允许时才缓存。"""
+        return self.allow_nonzero_temperature or not temperature
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"读取 LLM 响应缓存失败: {e}")
+                return None
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, key: str, value: str):
+        if not value:
+            return
+        with self._lock:
+            self._remember(key, value)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO llm_response_cache (key, value) VALUES (?, ?)", (key, value)
+                    )
+                    # INSERT OR REPLACE 总是分配新的 rowid，rowid 越小写入越早
+                    self._conn.execute(
+                        "DELETE FROM llm_response_cache WHERE rowid NOT IN "
+                        "(SELECT rowid FROM llm_response_cache ORDER BY rowid DESC LIMIT ?)",
+                        (self.max_db_entries,)
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"写入 LLM 响应缓存失败: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM llm_response_cache")
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"清空 LLM 响应缓存失败: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, value: str):
+        """写入内存 LRU (调用方需持有锁)。"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
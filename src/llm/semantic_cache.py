@@ -0,0 +1,117 @@
+"""
+LLM 语义缓存
+
+不同信源对同一事件的报道措辞不同，精确匹配的 ResponseCache 无法命中。
+这里把新闻标题+摘要编码为向量，与已缓存的分析结果做余弦相似度比较，
+相似度超过阈值且查找范围 (调用方给出的分区键，如 Provider + 模型 + 模板 + 分析类型) 相同时
+直接复用之前的分析结果。
+"""
+
+import logging
+import threading
+import zlib
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger('news_analyzer.llm.semantic_cache')
+
+Embedder = Callable[[str], np.ndarray]
+
+
+def hashed_ngram_embedding(text: str, dim: int = 512) -> np.ndarray:
+    """默认的本地嵌入：字符 bigram 哈希到 dim 维并做 L2 归一化。
+
+    不依赖任何模型文件，对中英文都适用；措辞略有差异的同一条新闻仍会得到很高的相似度。
+    """
+    vec = np.zeros(dim, dtype=np.float32)
+    text = (text or "").lower()
+    for i in range(len(text) - 1):
+        vec[zlib.crc32(text[i:i + 2].encode('utf-8')) % dim] += 1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm > 0 else vec
+
+
+class SemanticCache:
+    """按 (嵌入相似度, 查找范围) 命中的 LLM 分析结果缓存，条目数有上限 (FIFO 淘汰)。"""
+
+    def __init__(self, embedder: Optional[Embedder] = None, threshold: float = 0.92,
+                 max_entries: int = 10000):
+        """
+        Args:
+            embedder: 文本 -> 一维向量的函数；默认使用 hashed_ngram_embedding。
+            threshold: 判定为同一内容的最小余弦相似度。
+            max_entries: 缓存的最大条目数，超出后覆盖最早的条目。
+        """
+        self.embedder = embedder or hashed_ngram_embedding
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None     # (max_entries, dim)，每行已归一化
+        self._type_ids = np.full(max_entries, -1, dtype=np.int32)
+        self._results: List[Optional[str]] = [None] * max_entries
+        self._type_index: Dict[str, int] = {}
+        self._size = 0
+        self._next = 0
+
+    @staticmethod
+    def text_for_news(news_item) -> str:
+        """用于嵌入的新闻文本：标题 + 摘要 (或正文) 前 512 字符。"""
+        if isinstance(news_item, str):
+            return news_item[:1024]
+        get = news_item.get if isinstance(news_item, dict) else (lambda key: getattr(news_item, key, None))
+        title = get('title') or ''
+        body = get('summary') or get('content') or ''
+        return f"{title}\n{body[:512]}"
+
+    def _embed(self, text: str) -> np.ndarray:
+        vec = np.asarray(self.embedder(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def lookup(self, text: str, scope: str) -> Optional[str]:
+        """返回同一查找范围内最相似且超过阈值的分析结果，未命中返回 None。"""
+        with self._lock:
+            type_id = self._type_index.get(scope)
+            if type_id is None or self._size == 0:
+                return None
+            query = self._embed(text)
+            sims = self._matrix[:self._size] @ query
+            sims[self._type_ids[:self._size] != type_id] = -1.0
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            logger.debug("Semantic cache hit (similarity %.3f, scope %s)", sims[best], scope)
+            return self._results[best]
+
+    def add(self, text: str, scope: str, result: str):
+        if not result:
+            return
+        with self._lock:
+            vec = self._embed(text)
+            if self._matrix is None or self._matrix.shape[1] != vec.shape[0]:
+                # 首次写入 (或嵌入维度变化) 时按向量维度分配矩阵
+                self._matrix = np.zeros((self.max_entries, vec.shape[0]), dtype=np.float32)
+                self._type_ids.fill(-1)
+                self._results = [None] * self.max_entries
+                self._size = 0
+                self._next = 0
+            type_id = self._type_index.setdefault(scope, len(self._type_index))
+            slot = self._next
+            self._matrix[slot] = vec
+            self._type_ids[slot] = type_id
+            self._results[slot] = result
+            self._next = (slot + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+    def clear(self):
+        with self._lock:
+            self._matrix = None
+            self._type_ids.fill(-1)
+            self._results = [None] * self.max_entries
+            self._type_index.clear()
+            self._size = 0
+            self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
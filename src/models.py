@@ -45,9 +45,9 @@ class NewsSource:
             "custom_config": json.dumps(self.custom_config) if self.custom_config is not None else None
         }
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
-    """新闻文章数据模型"""
+    """新闻文章数据模型 (使用 __slots__，缓存中大量实例时节省内存)"""
     # Non-default fields first
     title: str
     link: str
@@ -92,7 +92,7 @@ class NewsArticle:
         # data['raw_data'] = self.raw_data
         return data
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem(NewsArticle):
     """包含状态信息的新闻条目"""
     is_new: bool = False # 标记是否为本次刷新中新增
@@ -10,26 +10,25 @@ import logging
 import shutil
 import sqlite3
 import threading
-from typing import List, Dict, Optional, Any, Tuple, Union
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Tuple, Union, Set, Iterator
+from datetime import datetime, timedelta, date
 from src.models import NewsArticle # Commented out, will handle data as dicts for now
+from src.utils import json_utils
 
 
-def convert_datetime_to_iso(obj):
-    """递归转换数据结构中的 datetime 对象为 ISO 格式字符串"""
-    if isinstance(obj, datetime):
+def _json_default(obj):
+    """json.dumps 的 default 钩子：由 C 编码器在遇到 datetime/date 时回调，无需预先递归遍历整个结构"""
+    if isinstance(obj, (datetime, date)):
         return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: convert_datetime_to_iso(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetime_to_iso(item) for item in obj]
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class NewsStorage:
     """新闻数据存储类 - 使用 SQLite"""
 
     DB_FILE_NAME = "news_data.db"
+    # 单条 IN (...) 查询的最大参数数量，低于 SQLite 默认的 999 变量上限
+    SQL_IN_CHUNK_SIZE = 500
     # HISTORY_FILE_NAME = "browsing_history.json" # Removed
     # READ_STATUS_FILE_NAME = "read_status.json" # Removed
     # MAX_HISTORY_ITEMS = 1000 # Removed, DB will handle limits if necessary via queries
@@ -111,6 +110,14 @@ class NewsStorage:
                     except sqlite3.Error as e_generic: # Catch other potential SQLite errors
                          self.logger.error(f"尝试添加列 '{col_name}' 时发生 SQLite 错误: {e_generic}", exc_info=True)
 
+                # 浏览去重查询 (WHERE article_id = ? ORDER BY view_time DESC LIMIT 1) 使用的复合索引；
+                # 其前导列已覆盖 article_id 单列查询，旧的单列索引一并删除
+                try:
+                    self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_browsing_history_article_view_time ON browsing_history (article_id, view_time)")
+                    self.cursor.execute("DROP INDEX IF EXISTS idx_browsing_history_article_id")
+                except sqlite3.Error as e_index:
+                    self.logger.error(f"为 browsing_history 创建复合索引时出错: {e_index}", exc_info=True)
+
                 try:
                     self.conn.commit() # Commit the ALTER TABLE statements if any succeeded
                 except sqlite3.Error as e_commit:
@@ -161,6 +168,9 @@ class NewsStorage:
             self.conn = sqlite3.connect(self.db_path)
             self.conn.row_factory = sqlite3.Row # Access columns by name
             self.conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
+            # WAL + synchronous=NORMAL：已读状态 / 浏览历史等单行写入的 commit 只追加到 WAL，不再每次同步重写主库页
+            self.conn.execute("PRAGMA journal_mode = WAL;")
+            self.conn.execute("PRAGMA synchronous = NORMAL;")
             self.cursor = self.conn.cursor()
             self.logger.debug(f"成功连接到 SQLite 数据库: {self.db_path}")
         except sqlite3.Error as e:
@@ -352,7 +362,7 @@ class NewsStorage:
                 retrieval_time=excluded.retrieval_time, 
                 category_name=excluded.category_name,
                 image_url=excluded.image_url,
-                is_read=excluded.is_read, 
+                is_read=MAX(articles.is_read, excluded.is_read), -- 已读状态只升不降，重新抓取不会把已读文章重置为未读
                 llm_summary=excluded.llm_summary
             RETURNING id; 
         """
@@ -415,7 +425,7 @@ class NewsStorage:
                 retrieval_time=excluded.retrieval_time,
                 category_name=excluded.category_name,
                 image_url=excluded.image_url,
-                is_read=excluded.is_read,
+                is_read=MAX(articles.is_read, excluded.is_read), -- 已读状态只升不降，重新抓取不会把已读文章重置为未读
                 llm_summary=excluded.llm_summary;
         """
         
@@ -535,22 +545,19 @@ class NewsStorage:
         # self.logger.debug(f"get_articles_by_links: 返回 {len(articles_dicts)} 个文章字典。") # 减少日志冗余
         return articles_dicts
 
-    def get_all_articles(self, 
-                         limit: Optional[int] = None, 
-                         offset: Optional[int] = None,
-                         sort_by: str = "publish_time", 
-                         sort_desc: bool = True,
-                         filter_is_read: Optional[bool] = None,
-                         filter_category: Optional[str] = None,
-                         search_term: Optional[str] = None,
-                         search_fields: Optional[List[str]] = None,
-                         ids: Optional[List[int]] = None, # Added ids filter
-                         with_content: bool = True # Added with_content
-                         ) -> List[Dict[str, Any]]:
-        if not self.conn or not self.cursor:
-            self.logger.error("数据库未连接，无法获取文章")
-            return []
-
+    def _build_articles_query(self,
+                              limit: Optional[int] = None,
+                              offset: Optional[int] = None,
+                              sort_by: str = "publish_time",
+                              sort_desc: bool = True,
+                              filter_is_read: Optional[bool] = None,
+                              filter_category: Optional[str] = None,
+                              search_term: Optional[str] = None,
+                              search_fields: Optional[List[str]] = None,
+                              ids: Optional[List[int]] = None,
+                              with_content: bool = True
+                              ) -> Tuple[str, List[Any]]:
+        """构建 get_all_articles / iter_articles 共用的 SELECT 语句与参数。"""
         select_columns = "*" if with_content else "id, title, link, source_name, source_url, publish_time, retrieval_time, category_name, image_url, is_read, llm_summary"
         base_query = f"SELECT {select_columns} FROM articles"
         
@@ -599,7 +606,27 @@ class NewsStorage:
         if offset is not None:
             base_query += " OFFSET ?"
             params.append(offset)
-            
+
+        return base_query, params
+
+    def get_all_articles(self, 
+                         limit: Optional[int] = None, 
+                         offset: Optional[int] = None,
+                         sort_by: str = "publish_time", 
+                         sort_desc: bool = True,
+                         filter_is_read: Optional[bool] = None,
+                         filter_category: Optional[str] = None,
+                         search_term: Optional[str] = None,
+                         search_fields: Optional[List[str]] = None,
+                         ids: Optional[List[int]] = None, # Added ids filter
+                         with_content: bool = True # Added with_content
+                         ) -> List[Dict[str, Any]]:
+        if not self.conn or not self.cursor:
+            self.logger.error("数据库未连接，无法获取文章")
+            return []
+
+        base_query, params = self._build_articles_query(limit, offset, sort_by, sort_desc, filter_is_read, filter_category,
+                                                          search_term, search_fields, ids, with_content)
         try:
             self.cursor.execute(base_query, params)
             rows = self.cursor.fetchall()
@@ -608,6 +635,48 @@ class NewsStorage:
             self.logger.error(f"获取所有文章时出错: {e} (Query: {base_query}, Params: {params})", exc_info=True)
             return []
 
+    def iter_articles(self,
+                      limit: Optional[int] = None,
+                      offset: Optional[int] = None,
+                      sort_by: str = "publish_time",
+                      sort_desc: bool = True,
+                      filter_is_read: Optional[bool] = None,
+                      filter_category: Optional[str] = None,
+                      search_term: Optional[str] = None,
+                      search_fields: Optional[List[str]] = None,
+                      ids: Optional[List[int]] = None,
+                      with_content: bool = True,
+                      batch_size: int = 500
+                      ) -> Iterator[Dict[str, Any]]:
+        """按 get_all_articles 的条件逐批 (fetchmany) 读取文章，避免一次性把全部行物化到内存。
+
+        使用独立游标，迭代过程中调用其他存储方法不会打断本次读取；调用方可随时停止迭代。
+        """
+        if not self.conn:
+            self.logger.error("数据库未连接，无法获取文章")
+            return
+
+        base_query, params = self._build_articles_query(limit, offset, sort_by, sort_desc, filter_is_read, filter_category,
+                                                          search_term, search_fields, ids, with_content)
+        try:
+            cursor = self.conn.execute(base_query, params)
+        except sqlite3.Error as e:
+            self.logger.error(f"迭代文章时出错: {e} (Query: {base_query}, Params: {params})", exc_info=True)
+            return
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    article = self._article_from_row(row)
+                    if article:
+                        yield article
+        except sqlite3.Error as e:
+            self.logger.error(f"迭代文章时出错: {e}", exc_info=True)
+        finally:
+            cursor.close()
+
     def set_article_read_status(self, link: str, is_read: bool) -> bool:
         """Sets the is_read status for an article identified by its link."""
         if not self.conn or not self.cursor:
@@ -691,13 +760,49 @@ class NewsStorage:
             return bool(article.get("is_read", False))
         return False # Return False if article not found
 
-    def add_read_item(self, item_link: str):
-        """Marks an article with the given link as read in the database."""
+    def get_read_links(self, links: List[str]) -> Set[str]:
+        """Returns the subset of the given links whose articles are marked as read.
+
+        Uses one IN query per SQL_IN_CHUNK_SIZE links instead of one query per link.
+        """
+        read_links: Set[str] = set()
+        unique_links = list(dict.fromkeys(link for link in links if link))
+        if not unique_links:
+            return read_links
+        with self.lock:
+            if not self.conn or not self.cursor:
+                self.logger.error("get_read_links: 数据库未连接。")
+                return read_links
+            try:
+                for start in range(0, len(unique_links), self.SQL_IN_CHUNK_SIZE):
+                    chunk = unique_links[start:start + self.SQL_IN_CHUNK_SIZE]
+                    placeholders = ",".join(["?"] * len(chunk))
+                    self.cursor.execute(f"SELECT link FROM articles WHERE is_read = 1 AND link IN ({placeholders})", chunk)
+                    read_links.update(row[0] for row in self.cursor.fetchall())
+            except sqlite3.Error as e:
+                self.logger.error(f"get_read_links: 查询已读状态时出错: {e}", exc_info=True)
+        return read_links
+
+    def get_all_read_links(self) -> Optional[Set[str]]:
+        """Returns the links of all articles marked as read, or None if they could not be loaded."""
+        with self.lock:
+            if not self.conn or not self.cursor:
+                self.logger.error("get_all_read_links: 数据库未连接。")
+                return None
+            try:
+                self.cursor.execute("SELECT link FROM articles WHERE is_read = 1")
+                return {row[0] for row in self.cursor.fetchall()}
+            except sqlite3.Error as e:
+                self.logger.error(f"get_all_read_links: 查询已读链接时出错: {e}", exc_info=True)
+                return None
+
+    def add_read_item(self, item_link: str) -> bool:
+        """Marks an article with the given link as read in the database. Returns True on success."""
         if item_link:
             self.logger.info(f"Marking item as read: {item_link}")
-            self.set_article_read_status(item_link, True)
-        else:
-            self.logger.warning("Attempted to mark an item with an empty link as read.")
+            return self.set_article_read_status(item_link, True)
+        self.logger.warning("Attempted to mark an item with an empty link as read.")
+        return False
 
     def clear_all_read_status(self):
         """Marks all articles in the database as unread."""
@@ -774,13 +879,7 @@ class NewsStorage:
         view_time_iso = view_time.isoformat()
 
         try:
-            # First, check if the article_id exists in the articles table
-            self.cursor.execute("SELECT id FROM articles WHERE id = ?", (article_id,))
-            article_exists = self.cursor.fetchone()
-            if not article_exists:
-                self.logger.warning(f"尝试添加浏览历史失败: 文章 ID {article_id} 不存在于 articles 表中。")
-                return None
-
+            # 文章是否存在由外键约束 (PRAGMA foreign_keys = ON) 检查，不再每次浏览先 SELECT 一次
             self.cursor.execute(
                 "INSERT INTO browsing_history (article_id, view_time) VALUES (?, ?)",
                 (article_id, view_time_iso)
@@ -790,8 +889,10 @@ class NewsStorage:
             self.logger.info(f"已添加浏览历史，文章ID: {article_id}, 历史ID: {history_id}")
             return history_id
         except sqlite3.IntegrityError as ie:
-             self.logger.error(f"添加浏览历史时发生完整性错误 (文章ID: {article_id}): {ie}. 可能article_id不存在或约束冲突。", exc_info=True)
-             return None
+            self.logger.warning(f"尝试添加浏览历史失败: 文章 ID {article_id} 不存在于 articles 表中或约束冲突: {ie}")
+            try: self.conn.rollback()
+            except sqlite3.Error as re: self.logger.error(f"Rollback failed: {re}", exc_info=True)
+            return None
         except sqlite3.Error as e:
             self.logger.error(f"添加浏览历史时出错 (文章ID: {article_id}): {e}", exc_info=True)
             return None
@@ -1111,7 +1212,7 @@ class NewsStorage:
         # Deserialize custom_config if it's a JSON string
         if source_dict.get("custom_config") and isinstance(source_dict["custom_config"], str):
             try:
-                source_dict["custom_config"] = json.loads(source_dict["custom_config"])
+                source_dict["custom_config"] = json_utils.loads(source_dict["custom_config"])
             except json.JSONDecodeError:
                 self.logger.warning(f"解析 custom_config JSON 失败 for source ID {source_dict.get('id')}: {source_dict['custom_config']}")
                 source_dict["custom_config"] = None # Or an empty dict {}
@@ -1149,7 +1250,7 @@ class NewsStorage:
         for field in json_fields:
             if analysis_dict.get(field) and isinstance(analysis_dict[field], str):
                 try:
-                    analysis_dict[field] = json.loads(analysis_dict[field])
+                    analysis_dict[field] = json_utils.loads(analysis_dict[field])
                 except json.JSONDecodeError:
                     self.logger.warning(f"解析 JSON 字段 '{field}' 失败 for analysis ID {analysis_dict.get('id')}: {analysis_dict[field]}")
                     analysis_dict[field] = None # Or appropriate default (e.g., [], {})
@@ -1189,7 +1290,7 @@ class NewsStorage:
             value = analysis_data.get(field)
             if value is not None:
                 try:
-                    db_analysis_data[field] = json.dumps(value)
+                    db_analysis_data[field] = json.dumps(value, default=_json_default)
                 except TypeError:
                     self.logger.error(f"序列化元数据字段 '{field}' 失败: {value}", exc_info=True)
                     db_analysis_data[field] = None # Or handle error appropriately
@@ -1219,7 +1320,7 @@ class NewsStorage:
                 original_value = analysis_data.get(field)
                 if field in meta_fields_to_serialize and original_value is not None and not isinstance(original_value, str):
                     try:
-                        final_insert_data[field] = json.dumps(original_value)
+                        final_insert_data[field] = json.dumps(original_value, default=_json_default)
                     except TypeError:
                         self.logger.error(f"Fallback serialization for '{field}' failed.", exc_info=True)
                         final_insert_data[field] = None
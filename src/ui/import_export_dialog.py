@@ -188,17 +188,16 @@ class ImportExportDialog(QDialog):
                  self.export_combo.addItem(f"错误：路径不是目录")
                  return
 
-            # --- 添加日志：列出目录内容（如果文件不多） ---
+            # scandir 一次遍历完成筛选：is_file() 直接使用目录项类型，不再对每个文件单独 stat
             try:
-                 all_entries = os.listdir(self.news_dir)
-                 self.logger.debug(f"目录 '{self.news_dir}' 中的所有条目 ({len(all_entries)}): {all_entries[:20]}") # 最多显示前20个
-            except Exception as list_err:
+                 with os.scandir(self.news_dir) as entries:
+                     files = [entry.name for entry in entries
+                              if entry.name.endswith('.json') and '.corrupted_' not in entry.name
+                              and not entry.name.startswith('.') and entry.is_file()]
+            except OSError as list_err:
                  self.logger.error(f"无法列出目录 '{self.news_dir}' 的内容: {list_err}")
                  self.export_combo.addItem("错误：无法读取目录")
                  return
-            # --- 日志结束 ---
-
-            files = [f for f in all_entries if f.endswith('.json') and os.path.isfile(os.path.join(self.news_dir, f)) and '.corrupted_' not in f]
             self.logger.info(f"在 '{self.news_dir}' 中找到 {len(files)} 个符合条件的 .json 文件") # 改为 info 级别
             if not files:
                  self.logger.info("未找到任何历史批次文件。")
@@ -148,6 +148,12 @@ class LLMSettingsDialog(QDialog):
         add_form_row(edit_form_layout, "最大Token数 (Max Tokens):", self.max_tokens_edit)
         self.timeout_edit = QLineEdit("60")
         add_form_row(edit_form_layout, "超时 (Timeout, 秒):", self.timeout_edit)
+        self.rpm_edit = QLineEdit()
+        self.rpm_edit.setPlaceholderText("不限")
+        add_form_row(edit_form_layout, "每分钟请求数上限 (RPM):", self.rpm_edit)
+        self.tpm_edit = QLineEdit()
+        self.tpm_edit.setPlaceholderText("不限")
+        add_form_row(edit_form_layout, "每分钟Token上限 (TPM):", self.tpm_edit)
 
         self.edit_group.setLayout(edit_form_layout)
         right_layout.addWidget(self.edit_group)
@@ -221,6 +227,12 @@ class LLMSettingsDialog(QDialog):
         self.timeout_edit.textChanged.connect(
             lambda text: self.view_model.update_current_config_field('timeout', text)
         )
+        self.rpm_edit.textChanged.connect(
+            lambda text: self.view_model.update_current_config_field('rpm', text)
+        )
+        self.tpm_edit.textChanged.connect(
+            lambda text: self.view_model.update_current_config_field('tpm', text)
+        )
         # The api_key_edit_for_test does not affect the dirty state for saving permanent config. (REMOVED COMMENT AS FIELD IS REMOVED)
         self.logger.debug("Dirty signals connected.")
 
@@ -316,6 +328,8 @@ class LLMSettingsDialog(QDialog):
         self.temperature_edit.blockSignals(True)
         self.max_tokens_edit.blockSignals(True)
         self.timeout_edit.blockSignals(True)
+        self.rpm_edit.blockSignals(True)
+        self.tpm_edit.blockSignals(True)
         # --- END ADDED ---
 
         try:
@@ -364,6 +378,8 @@ class LLMSettingsDialog(QDialog):
             
             self.max_tokens_edit.setText(str(config_data.get('max_tokens', 2048)))
             self.timeout_edit.setText(str(config_data.get('timeout', 60)))
+            self.rpm_edit.setText(str(config_data.get('rpm') or ''))
+            self.tpm_edit.setText(str(config_data.get('tpm') or ''))
 
             self._current_provider_type = provider_type
             self.logger.debug(f"Set _current_provider_type to: {self._current_provider_type}")
@@ -388,6 +404,8 @@ class LLMSettingsDialog(QDialog):
             self.temperature_edit.blockSignals(False)
             self.max_tokens_edit.blockSignals(False)
             self.timeout_edit.blockSignals(False)
+            self.rpm_edit.blockSignals(False)
+            self.tpm_edit.blockSignals(False)
             # --- END ADDED ---
             self.is_loading_config = False
 
@@ -430,6 +448,8 @@ class LLMSettingsDialog(QDialog):
             'temperature': self.temperature_edit.text().strip(),
             'max_tokens': self.max_tokens_edit.text().strip(),
             'timeout': self.timeout_edit.text().strip(),
+            'rpm': self.rpm_edit.text().strip(),
+            'tpm': self.tpm_edit.text().strip(),
             'provider': provider_type_to_save # Ensure this is set when a config is loaded or provider changed
         }
         self.logger.debug(f"_get_form_data collected: {data}")
@@ -591,6 +611,8 @@ class LLMSettingsDialog(QDialog):
         self.temperature_edit.blockSignals(True)
         self.max_tokens_edit.blockSignals(True)
         self.timeout_edit.blockSignals(True)
+        self.rpm_edit.blockSignals(True)
+        self.tpm_edit.blockSignals(True)
         # self.api_key_edit_for_test.blockSignals(True) # REMOVED
         # --- Clear Controls ---
         self.config_name_label.setText("<i>未选择配置</i>")
@@ -609,6 +631,8 @@ class LLMSettingsDialog(QDialog):
         self.temperature_edit.setText("0.7") # Reset to default
         self.max_tokens_edit.setText("2048") # Reset to default
         self.timeout_edit.setText("60") # Reset to default
+        self.rpm_edit.clear()
+        self.tpm_edit.clear()
         self._current_provider_type = None # Reset current provider
         self.logger.debug("Edit fields cleared and provider type reset.")
         # --- Unblock Signals ---
@@ -619,6 +643,8 @@ class LLMSettingsDialog(QDialog):
         self.temperature_edit.blockSignals(False)
         self.max_tokens_edit.blockSignals(False)
         self.timeout_edit.blockSignals(False)
+        self.rpm_edit.blockSignals(False)
+        self.tpm_edit.blockSignals(False)
         # self.api_key_edit_for_test.blockSignals(False) # REMOVED
 
     def _populate_gemini_models_combo(self):
@@ -60,6 +60,8 @@ class PromptManagerService(QObject):
             包含模板名称和内容的字典
         """
         self.templates_dict.clear()
+        # 重新加载时同时清除 PromptManager 的模板缓存，使外部修改的文件生效
+        self.prompt_manager.invalidate()
         
         # 获取提示词目录中的所有txt文件
         prompts_dir = self.prompt_manager.prompts_dir
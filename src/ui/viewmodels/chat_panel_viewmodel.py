@@ -70,6 +70,7 @@ class ChatPanelViewModel(QObject):
         self._use_news_context: bool = False
         self._is_busy: bool = False
         self._assistant_message_added: bool = False # <-- Initialize the flag
+        self._accumulated_raw_assistant_response: str = "" # 流式响应已收到的原始文本
 
         self._connect_signals()
         self.logger.info(f"--- ChatPanelViewModel Logger Test ({self.logger.name}) ---") 
@@ -249,15 +250,18 @@ class ChatPanelViewModel(QObject):
     # --- New Slots for LLMService Signals --- Added
     @pyqtSlot(str)
     def _on_chat_chunk(self, chunk: str):
-        """Handles receiving a chunk of the chat response. Now only marks stream as active."""
+        """Handles receiving a chunk (delta) of the chat response: appends it and emits the partial message."""
         if not self._assistant_message_added:
             self.logger.debug(f"First chunk received for a stream: {chunk[:50]}... Setting _assistant_message_added=True.")
             self._assistant_message_added = True
-        # No accumulation or signal emission here. UI will update on _on_chat_finish.
+        self._accumulated_raw_assistant_response += chunk
+        # 视图在 _assistant_message_added 为 True 时复用同一个气泡 (setHtml)，首个片段时新建气泡
+        partial_html = LLMResponseFormatter._format_content(self._accumulated_raw_assistant_response)
+        self.new_message_added.emit(ChatMessage(role="assistant", content=partial_html))
 
     @pyqtSlot(str)
     def _on_chat_finish(self, final_message: str):
-        """Handles the successful completion of the chat stream. Emits one new_message_added signal."""
+        """Handles the successful completion of the chat stream. Emits the final assistant message."""
         self.logger.info(f"_on_chat_finish received. Final raw message length: {len(final_message)}. Content snippet: '{final_message[:100]}...' ")
 
         if final_message: # Ensure there's content to process
@@ -267,22 +271,16 @@ class ChatPanelViewModel(QObject):
             assistant_message = ChatMessage(role="assistant", content=final_html_content)
             self._chat_history.append(assistant_message) # Add the complete message to history
 
+            # 流式过程中视图已有该气泡，此时仍处于流式状态，视图只更新气泡内容而不会新增
             self.logger.info(f"---> Emitting new_message_added from _on_chat_finish for assistant message: {assistant_message.content[:50]}...")
             self.new_message_added.emit(assistant_message) # Emit signal for the UI
         else:
             self.logger.warning("_on_chat_finish: final_message is empty. Nothing to add or emit.")
 
         self._assistant_message_added = False # Reset flag, stream is finished
+        self._accumulated_raw_assistant_response = ""
         self._set_busy(False) # Set busy to false
 
-        # Reset temporary raw accumulation if it was used elsewhere (though not in this new _on_chat_chunk)
-        if hasattr(self, '_raw_assistant_response'): # Should be _accumulated_raw_assistant_response if we were using it
-            self.logger.debug("Clearing _raw_assistant_response attribute if it exists.")
-            del self._raw_assistant_response
-        if hasattr(self, '_accumulated_raw_assistant_response'): # Clear the one we might have defined
-            self.logger.debug("Clearing _accumulated_raw_assistant_response attribute.")
-            self._accumulated_raw_assistant_response = ""
-
     @pyqtSlot(str)
     def _on_chat_error(self, error_html: str):
         """Handles errors received from the chat stream."""
@@ -290,9 +288,7 @@ class ChatPanelViewModel(QObject):
         # Errors are already formatted as HTML by LLMService/Formatter
         self.error_occurred.emit(error_html) # Emit the error signal for the view
         self._assistant_message_added = False # Reset flag
-        # Reset temporary raw accumulation if it exists
-        if hasattr(self, '_raw_assistant_response'):
-             del self._raw_assistant_response
+        self._accumulated_raw_assistant_response = ""
         self._set_busy(False) # Set busy to false
     # --- End New Slots ---
 
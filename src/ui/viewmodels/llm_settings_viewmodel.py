@@ -130,6 +130,8 @@ class LLMSettingsViewModel(QObject):
                 'temperature': 0.7,
                 'max_tokens': 2048,
                 'timeout': 60,
+                'rpm': 0,
+                'tpm': 0,
             }
             self.logger.debug(f"Adding new config '{name}' with default data: {default_new_config}")
             success = self._config_manager.add_or_update_config(name, default_new_config)
@@ -217,6 +219,10 @@ class LLMSettingsViewModel(QObject):
                 config_to_save['max_tokens'] = int(tokens_str) if tokens_str else original_tokens
                 timeout_str = str(config_to_save.get('timeout', original_timeout)).strip()
                 config_to_save['timeout'] = int(timeout_str) if timeout_str else original_timeout
+                # rpm / tpm 留空表示不限流
+                for limit_key in ('rpm', 'tpm'):
+                    limit_str = str(config_to_save.get(limit_key) or '').strip()
+                    config_to_save[limit_key] = int(limit_str) if limit_str else 0
 
                 self.logger.debug(f"Processed numeric and provider fields for saving: {config_to_save}")
 
@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional, Dict, Any # 确保导入 List, Optional
+from typing import List, Optional, Dict, Any, Tuple # 确保导入 List, Optional
 from PySide6.QtCore import QObject, Signal as pyqtSignal, Slot as pyqtSlot, Qt, QTimer # Use PySide6, alias Signal/Slot
 from datetime import datetime, timedelta, date, timezone # 导入 datetime, timedelta, date, timezone
 from PySide6.QtGui import QColor # For example color usage if needed
+import numpy as np
 
 # 导入模型和核心服务
 from src.models import NewsArticle
@@ -24,6 +25,11 @@ class NewsListViewModel(QObject):
     # 当已读状态需要更新时发射 (可以传递 link 或整个 article)
     read_status_changed = pyqtSignal(str, bool) # 发射新闻链接和状态
 
+    # 搜索用拼接串中的条目分隔符，正常文本不会包含
+    _SEARCH_SEPARATOR = "\x00"
+    # 候选条目占全量的比例低于该值时，逐条在候选各自的区间内查找，不再扫描整个拼接串
+    _SEARCH_SUBSET_RATIO = 0.25
+
     def __init__(self, app_service: AppService, parent: Optional[QObject] = None):
         """
         初始化 NewsListViewModel。
@@ -56,6 +62,18 @@ class NewsListViewModel(QObject):
         self._current_days_filter: Optional[int] = None # 默认不过滤天数
         self._start_date_filter: Optional[datetime] = None # 新增：开始日期过滤器
         self._end_date_filter: Optional[datetime] = None   # 新增：结束日期过滤器
+
+        # --- 过滤索引 (与 _all_news 平行的 NumPy 数组，按需重建) ---
+        self._indexed_news: Optional[List[NewsArticle]] = None # 索引对应的列表对象
+        self._indexed_count: int = 0
+        self._category_arr: np.ndarray = np.empty(0, dtype=object)
+        self._search_blobs: Dict[str, Tuple[str, np.ndarray]] = {} # 字段名 -> (小写文本拼接串, 各条起始偏移)
+        self._lowered_text_cache: Dict[Tuple[str, str], Tuple[str, str]] = {} # (字段, link) -> (原文, 小写文本)
+        self._news_by_link: Dict[str, NewsArticle] = {} # link -> 文章，供点击标记已读时 O(1) 查找
+        self._time_arr: np.ndarray = np.empty(0, dtype=np.float64) # UTC 时间戳，缺失为 NaN
+        self._time_order: np.ndarray = np.empty(0, dtype=np.intp) # 按时间升序的下标 (NaN 排在最后)
+        self._sorted_times: np.ndarray = np.empty(0, dtype=np.float64) # _time_arr[_time_order]
+        self._valid_time_count: int = 0 # 有有效发布时间的条目数
         self._connect_signals()
         self.logger.info("NewsListViewModel initialized.")
 
@@ -97,7 +115,7 @@ class NewsListViewModel(QObject):
     @pyqtSlot(str, str) # 第二个参数现在是字符串
     def search_news(self, term: str, field_description: str): # 修正类型提示和行尾冒号
         """搜索新闻"""
-        self.logger.debug(f"Received search request: term='{term}', field_description='{field_description}'")
+        self.logger.debug("Received search request: term='%s', field_description='%s'", term, field_description)
         self._current_search_term = term.lower()
 
         # 将描述性字符串映射到实际的字段列表 (修正缩进)
@@ -111,7 +129,7 @@ class NewsListViewModel(QObject):
             self.logger.warning(f"Unknown field description '{field_description}', defaulting to title and content.")
             self._current_search_fields = ["title", "content"] # 默认或错误处理
 
-        self.logger.debug(f"Searching news with term '{self._current_search_term}' in mapped fields {self._current_search_fields}") # 修正缩进
+        self.logger.debug("Searching news with term '%s' in mapped fields %s", self._current_search_term, self._current_search_fields) # 修正缩进
         self._apply_filters_and_sort()
         self.news_list_changed.emit()
 
@@ -162,13 +180,17 @@ class NewsListViewModel(QObject):
     @pyqtSlot(NewsArticle)
     def select_news(self, article: Optional[NewsArticle]):
         """处理新闻项的选择"""
-        self.logger.info(f"NewsListViewModel.select_news called with article: {article.title[:30] if article else 'None'}...")
+        # 标题切片只在对应级别开启时才执行
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("NewsListViewModel.select_news called with article: %s...", article.title[:30] if article else 'None')
         if article:
-            self.logger.debug(f"News selection changed in ViewModel: {article.title[:30]}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("News selection changed in ViewModel: %s", article.title[:30])
             # 通知 AppService 选中了新闻
             self._app_service.set_selected_news(article)
-            # 标记为已读
-            if not self.is_read(article.link): # 调用 is_read 方法判断 (内部会调用 history_service)
+            # 标记为已读：文章对象上的 is_read 在加载时已批量同步、标记后即置位，
+            # 已为 True 时无需再经 history_service 查询存储
+            if not article.is_read and not self.is_read(article.link): # 调用 is_read 方法判断 (内部会调用 history_service)
                 self.mark_as_read(article.link) # 使用 link 作为唯一标识符 (内部会调用 history_service)
         else:
             self._app_service.set_selected_news(None) # 清除选中
@@ -185,24 +207,14 @@ class NewsListViewModel(QObject):
         self._history_service.mark_as_read(link)
 
         # 2. 更新 ViewModel 内部缓存的状态以立即反映
-        item_found_in_all = False
-        for item in self._all_news:
-            if item.link == link:
-                item.is_read = True
-                item_found_in_all = True
-                self.logger.debug(f"Updated is_read=True for item in _all_news: {link}")
-                break # 假设 link 是唯一的
-
-        item_found_in_filtered = False
-        for item in self._filtered_news:
-            if item.link == link:
-                item.is_read = True
-                item_found_in_filtered = True
-                self.logger.debug(f"Updated is_read=True for item in _filtered_news: {link}")
-                break # 假设 link 是唯一的
-
-        if not item_found_in_all and not item_found_in_filtered:
-             self.logger.warning(f"Tried to mark item as read, but link not found in ViewModel caches: {link}")
+        #    _filtered_news 中的条目与 _all_news 是同一批对象，按 link 索引查到即可同时生效
+        self._ensure_filter_index()
+        item = self._news_by_link.get(link)
+        if item is not None:
+            item.is_read = True
+            self.logger.debug("Updated is_read=True for item in _all_news: %s", link)
+        else:
+            self.logger.warning("Tried to mark item as read, but link not found in ViewModel caches: %s", link)
 
         # 3. 发射信号通知 View 更新特定项的状态
         self.read_status_changed.emit(link, True)
@@ -216,168 +228,202 @@ class NewsListViewModel(QObject):
         return self._history_service.is_read(link)
 
     # --- 私有方法 ---
+    @staticmethod
+    def _to_utc_timestamp(value: Any) -> float:
+        """将 publish_time 转为 UTC 时间戳 (naive 视为 UTC)，ISO 字符串会先解析，无效值返回 NaN"""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return np.nan
+        if not isinstance(value, datetime):
+            return np.nan
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    def _ensure_filter_index(self):
+        """_all_news 变化后重建过滤用的平行数组，使过滤可以在 NumPy 中按列批量完成"""
+        if self._indexed_news is self._all_news and self._indexed_count == len(self._all_news):
+            return
+        news = self._all_news
+        count = len(news)
+        self._category_arr = np.array([n.category for n in news], dtype=object)
+        # 与原线性查找一致：link 重复时以首次出现的条目为准
+        news_by_link: Dict[str, NewsArticle] = {}
+        for n in news:
+            if n.link:
+                news_by_link.setdefault(n.link, n)
+        self._news_by_link = news_by_link
+        # 小写文本按 (字段, link) 跨重建复用，只有新增或内容变化的文章才重新 lower()
+        previous_lowered = self._lowered_text_cache
+        current_lowered: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._search_blobs = {field: self._build_search_blob(news, field, previous_lowered, current_lowered)
+                              for field in ("title", "content")}
+        self._lowered_text_cache = current_lowered
+        self._time_arr = np.fromiter((self._to_utc_timestamp(n.publish_time) for n in news),
+                                     dtype=np.float64, count=count)
+        # 时间有序视图：日期过滤用二分查找定位区间，O(log N + k) 而非全量比较
+        self._time_order = np.argsort(self._time_arr, kind='stable')
+        self._sorted_times = self._time_arr[self._time_order]
+        self._valid_time_count = int(np.count_nonzero(~np.isnan(self._time_arr)))
+        self._indexed_news = news
+        self._indexed_count = count
+        self.logger.debug("Filter index rebuilt for %d articles.", count)
+
+    def _build_search_blob(self, news: List[NewsArticle], field: str,
+                           previous_lowered: Dict[Tuple[str, str], Tuple[str, str]],
+                           current_lowered: Dict[Tuple[str, str], Tuple[str, str]]) -> Tuple[str, np.ndarray]:
+        """把某字段的小写文本用分隔符拼成一个长串，并记录每条的起始偏移 (末尾多一个哨兵偏移)"""
+        texts = []
+        for n in news:
+            value = getattr(n, field, None)
+            if value is None:
+                texts.append("")
+                continue
+            raw = str(value)
+            if not n.link:
+                texts.append(raw.lower())
+                continue
+            key = (field, n.link)
+            cached = previous_lowered.get(key)
+            # 原文未变 (通常是同一个字符串对象，比较直接命中身份判断) 时复用上次的小写结果
+            lowered = cached[1] if cached is not None and cached[0] == raw else raw.lower()
+            current_lowered[key] = (raw, lowered)
+            texts.append(lowered)
+        starts = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=len(texts)), out=starts[1:])
+        return self._SEARCH_SEPARATOR.join(texts), starts
+
+    def _search_field_hits(self, field: str, term: str, candidate_idx: Optional[np.ndarray] = None) -> np.ndarray:
+        """在拼接串上用 str.find 做 C 层子串扫描，返回命中条目的布尔掩码
+
+        给出 candidate_idx 时只在这些条目各自的区间内查找，返回的掩码与 candidate_idx 一一对应。
+        """
+        blob, starts = self._search_blobs[field]
+        hit = np.zeros(starts.size - 1 if candidate_idx is None else candidate_idx.size, dtype=bool)
+        if self._SEARCH_SEPARATOR in term: # 含分隔符的词可能跨条目匹配，视为无结果
+            return hit
+        if candidate_idx is not None:
+            find = blob.find
+            # 区间终点去掉条目末尾的分隔符；带边界的 find 不复制子串
+            for j, (lo, hi) in enumerate(zip(starts[candidate_idx].tolist(), (starts[candidate_idx + 1] - 1).tolist())):
+                hit[j] = find(term, lo, hi) != -1
+            return hit
+        pos = blob.find(term)
+        while pos != -1:
+            i = int(np.searchsorted(starts, pos, side='right')) - 1
+            hit[i] = True
+            # 同一条目只需命中一次，直接跳到下一条的起点继续查找
+            pos = blob.find(term, int(starts[i + 1]))
+        return hit
+
+    def _indices_in_time_range(self, start_ts: float, end_ts: Optional[float]) -> np.ndarray:
+        """返回发布时间落在 [start_ts, end_ts] 内的条目下标 (按原列表顺序)，end_ts 为 None 表示不设上限"""
+        valid_times = self._sorted_times[:self._valid_time_count]
+        lo = int(np.searchsorted(valid_times, start_ts, side='left'))
+        hi = self._valid_time_count if end_ts is None else int(np.searchsorted(valid_times, end_ts, side='right'))
+        return np.sort(self._time_order[lo:hi])
+
     def _apply_filters_and_sort(self):
         """应用当前的过滤器和排序规则"""
-        self.logger.info(f"_apply_filters_and_sort: Starting. Current category: '{self._current_category}', Search: '{self._current_search_term}', Days: {self._current_days_filter}, Start: {self._start_date_filter}, End: {self._end_date_filter}") # MODIFIED for more info
-        self.logger.info(f"_apply_filters_and_sort: Initial self._all_news count: {len(self._all_news)}.") # ADDED
+        self.logger.info("_apply_filters_and_sort: Starting. Current category: '%s', Search: '%s', Days: %s, Start: %s, End: %s",
+                         self._current_category, self._current_search_term, self._current_days_filter,
+                         self._start_date_filter, self._end_date_filter) # MODIFIED for more info
+        self.logger.info("_apply_filters_and_sort: Initial self._all_news count: %d.", len(self._all_news)) # ADDED
         
         # 从 self._all_news 的副本开始过滤，而不是从 AppService 获取或依赖参数
-        self.logger.debug(f"  Total articles for filtering (from self._all_news): {len(self._all_news)}")
+        self.logger.debug("  Total articles for filtering (from self._all_news): %d", len(self._all_news))
         if not self._all_news: # 如果 _all_news 本身是空的，则直接设置空结果并返回
             self.logger.info("_all_news is empty, no filtering to apply.")
             self._filtered_news = []
             return
 
-        filtered = list(self._all_news) # 使用 list(self._all_news) 创建副本
+        self._ensure_filter_index()
+
+        # 1. 按日期过滤：在时间有序数组上二分查找区间，只取区间内的下标作为候选
+        if self._current_days_filter is not None:
+            cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=self._current_days_filter)).timestamp()
+            candidate_idx = self._indices_in_time_range(cutoff_ts, None)
+            self.logger.debug("Filtered by last %s days: %d remaining", self._current_days_filter, candidate_idx.size)
+        # 1b. 按指定日期范围过滤 (如果设置了)
+        elif self._start_date_filter and self._end_date_filter:
+            # Start of the start day / end of the end day in UTC
+            start_ts = datetime.combine(self._start_date_filter, datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
+            end_ts = datetime.combine(self._end_date_filter, datetime.max.time()).replace(tzinfo=timezone.utc).timestamp()
+            candidate_idx = self._indices_in_time_range(start_ts, end_ts)
+            self.logger.debug("Filtered by date range %s to %s: %d remaining",
+                              self._start_date_filter, self._end_date_filter, candidate_idx.size)
+        else:
+            candidate_idx = np.arange(len(self._all_news))
 
-        # 1. 按分类过滤
-        if self._current_category != "所有":
-            self.logger.debug(f"Filtering by category '{self._current_category}'. News count before: {len(filtered)}")
-            filtered = [news for news in filtered if news.category == self._current_category]
-            self.logger.debug(f"News count after category filtering: {len(filtered)}")
-            if not filtered:
-                self.logger.warning(f"Category filter '{self._current_category}' resulted in an empty list.")
+        # 2. 按分类过滤 (只比较候选条目)
+        if self._current_category != "所有" and candidate_idx.size:
+            candidate_idx = candidate_idx[self._category_arr[candidate_idx] == self._current_category]
+            self.logger.debug("News count after category filtering '%s': %d", self._current_category, candidate_idx.size)
+            if not candidate_idx.size:
+                self.logger.warning("Category filter '%s' resulted in an empty list.", self._current_category)
 
-        # 2. 按搜索词过滤
-        if self._current_search_term:
+        # 3. 按搜索词过滤 (放在最后)：候选较少时只在候选条目内查找，否则一次扫描整个拼接串后再取候选
+        if self._current_search_term and candidate_idx.size:
             term = self._current_search_term
-            fields = self._current_search_fields
-            self.logger.debug(f"Applying search filter: term='{term}', fields={fields}. News count before: {len(filtered)}")
-            original_count_search = len(filtered)
-            new_filtered_search = []
-            for news in filtered: # 修正 for 循环语法
-                found = False
+            fields = [f for f in self._current_search_fields if f in self._search_blobs]
+            # 空白分隔的多个关键词按 AND 组合：每个词在任一字段命中即可，所有词都需命中
+            # 去重后按长度降序扫描：长词的快速查找跳跃更大、命中更少，能更早让结果为空而提前结束
+            tokens = sorted(dict.fromkeys(term.split()), key=len, reverse=True) or [term]
+            subset = candidate_idx if candidate_idx.size < len(self._all_news) * self._SEARCH_SUBSET_RATIO else None
+            mask_size = len(self._all_news) if subset is None else subset.size
+            hit = np.ones(mask_size, dtype=bool)
+            for token in tokens:
+                token_hit = np.zeros(mask_size, dtype=bool)
                 for field in fields:
-                    if hasattr(news, field):
-                        value = getattr(news, field)
-                        if value is not None:
-                            try:
-                                value_lower = str(value).lower() # 确保字符串转换和转小写
-                                self.logger.debug(f"  Checking article '{news.link[:30]}...' field '{field}': term='{term}' in value='{value_lower[:100]}...'?") # 记录比较细节
-                                if term in value_lower:
-                                    self.logger.debug(f"    Found term '{term}' in field '{field}' for article '{news.link[:30]}...'")
-                                    found = True
-                                    break # 在一个字段找到即可
-                            except Exception as e:
-                                self.logger.warning(f"  Error processing field '{field}' for article '{news.link[:30]}...': {e}")
-                if found:
-                    new_filtered_search.append(news)
-            filtered = new_filtered_search
-            self.logger.debug(f"News count after search filtering: {len(filtered)} (was {original_count_search})")
-
-        # 3. 按日期范围过滤 (新增)
-        if self._current_days_filter is not None:
-            self.logger.debug(f"Applying days filter: last {self._current_days_filter} days.")
-            # Use timezone-aware UTC time for comparison
-            now_utc = datetime.now(timezone.utc) # Use imported timezone class
-            cutoff_date = now_utc - timedelta(days=self._current_days_filter)
-            original_count = len(filtered)
-            # Refactor list comprehension to a standard loop for clarity and correct filtering
-            temp_filtered_days = []
-            for news_item in filtered: # Use a different loop variable name
-                if news_item.publish_time is not None and isinstance(news_item.publish_time, datetime):
-                    # Make publish_time timezone-aware (assume UTC if naive, convert otherwise)
-                    if news_item.publish_time.tzinfo is None:
-                        publish_time_aware = news_item.publish_time.replace(tzinfo=timezone.utc) # Use imported timezone
-                        # self.logger.warning(f"Naive datetime encountered for {news_item.link}. Assuming UTC.") # Optional: Log assumption
-                    else:
-                        publish_time_aware = news_item.publish_time.astimezone(timezone.utc) # Use imported timezone
-
-                    if publish_time_aware >= cutoff_date:
-                        temp_filtered_days.append(news_item) # Keep the item if date is within range
-                # else: Skip items without valid datetime
-            filtered = temp_filtered_days # Assign the newly filtered list back
-# Removed incorrect/redundant code block from previous diff attempts
-            # Removed stray closing bracket from previous list comprehension attempt
-            self.logger.debug(f"Filtered by date: {original_count} -> {len(filtered)}")
-
-
-        # 3b. 按指定日期范围过滤 (如果设置了)
-        elif self._start_date_filter and self._end_date_filter:
-            self.logger.debug(f"Applying date range filter: {self._start_date_filter.strftime('%Y-%m-%d')} to {self._end_date_filter.strftime('%Y-%m-%d')}")
-
-            # Convert start/end date (which are date objects) to UTC-aware datetime objects
-            # Start of the start day in UTC
-            start_dt_aware = datetime.combine(self._start_date_filter, datetime.min.time()).replace(tzinfo=timezone.utc)
-            # End of the end day in UTC
-            end_dt_aware = datetime.combine(self._end_date_filter, datetime.max.time()).replace(tzinfo=timezone.utc)
-
-            self.logger.debug(f"Aware date range: {start_dt_aware} to {end_dt_aware}") # Log aware range
-
-            original_count = len(filtered)
-            new_filtered = []
-            for news in filtered:
-                # self.logger.debug(f"Filtering news item: Link={news.link}, Publish Time={news.publish_time} (Type: {type(news.publish_time)}), Start Date={start_dt} (Type: {type(start_dt)}), End Date={end_dt} (Type: {type(end_dt)})")
-                if news.publish_time is not None and isinstance(news.publish_time, datetime):
-                    # Ensure news.publish_time is UTC-aware for comparison
-                    publish_time_aware = news.publish_time
-                    if publish_time_aware.tzinfo is None:
-                        # Assume naive times are UTC (or log a warning)
-                        publish_time_aware = publish_time_aware.replace(tzinfo=timezone.utc)
-                        # self.logger.warning(f"Naive datetime encountered for {news.link}. Assuming UTC for date range filter.")
-                    else:
-                        # Convert to UTC if it's aware but not UTC
-                        publish_time_aware = publish_time_aware.astimezone(timezone.utc)
-
-                    # Compare aware datetimes
-                    if start_dt_aware <= publish_time_aware <= end_dt_aware:
-                        new_filtered.append(news)
-                # else: Log skipped item?
-                #     self.logger.debug(f"Skipping item {news.link} due to invalid publish_time for date range filter.")
-
-            filtered = new_filtered
-            self.logger.debug(f"Filtered by specific date range: {original_count} -> {len(filtered)}")
-
-        self.logger.debug(f"Filters applied. Filtered news count: {len(filtered)}")
+                    token_hit |= self._search_field_hits(field, token, subset)
+                hit &= token_hit
+                if not hit.any():
+                    break
+            if subset is None:
+                hit = hit[candidate_idx]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Search '%s' in %s: %d of %d candidates matched", term, fields, int(hit.sum()), candidate_idx.size)
+            candidate_idx = candidate_idx[hit]
+
+        all_news = self._all_news
+        reverse_order = (self._sort_order == Qt.DescendingOrder)
+
+        # 4a. 按发布时间排序：直接对索引中的时间戳数组做稳定排序，缺失时间视为最早
+        if self._sort_column == 'publish_time':
+            keys = np.nan_to_num(self._time_arr[candidate_idx], nan=-np.inf)
+            order = np.argsort(-keys if reverse_order else keys, kind='stable')
+            self._filtered_news = [all_news[i] for i in candidate_idx[order]]
+            self.logger.debug("Sorted %d news by 'publish_time' %s.", len(self._filtered_news), 'descending' if reverse_order else 'ascending')
+            self.logger.info("_apply_filters_and_sort: Finished. Final self._filtered_news count: %d.", len(self._filtered_news))
+            return
+
+        filtered = [all_news[i] for i in candidate_idx]
+
+        self.logger.debug("Filters applied. Filtered news count: %d", len(filtered))
 
         # 4. 排序
-        reverse_order = (self._sort_order == Qt.DescendingOrder)
         try:
             def sort_key(article: NewsArticle):
                 value = getattr(article, self._sort_column, None)
 
-                if self._sort_column == 'publish_time':
-                    dt_value = None
-                    if value is None:
-                        # Use timezone-aware min datetime for consistent comparison
-                        return datetime.min.replace(tzinfo=timezone.utc)
-
-                    if isinstance(value, datetime):
-                        dt_value = value
-                    else: # Attempt to parse if not datetime
-                        try:
-                            # Try parsing ISO format first
-                            dt_value = datetime.fromisoformat(str(value))
-                        except (ValueError, TypeError):
-                            # Add fallback parsing if needed, or log warning
-                            self.logger.warning(f"Could not parse date string '{value}' for sorting, using min date.")
-                            # Use timezone-aware min datetime
-                            return datetime.min.replace(tzinfo=timezone.utc)
-
-                    # Ensure the datetime is timezone-aware (UTC)
-                    if dt_value.tzinfo is None:
-                        # Assume naive datetimes are UTC
-                        return dt_value.replace(tzinfo=timezone.utc)
-                    else:
-                        # Convert aware datetimes to UTC
-                        return dt_value.astimezone(timezone.utc)
-
-                # Handle non-datetime columns
-                elif value is None:
+                # Handle non-datetime columns (publish_time 已在上面按时间戳数组排序)
+                if value is None:
                     # Provide a default sort value for None in other columns (e.g., empty string)
                     return ""
                 else:
                     # Return original value for other types
                     return value
             filtered.sort(key=sort_key, reverse=reverse_order)
-            self.logger.debug(f"Sorted news by '{self._sort_column}' {'descending' if reverse_order else 'ascending'}.")
+            self.logger.debug("Sorted news by '%s' %s.", self._sort_column, 'descending' if reverse_order else 'ascending')
         except TypeError as e:
             self.logger.error(f"Sorting failed for column '{self._sort_column}'. Inconsistent data types might exist. Error: {e}", exc_info=True)
         except Exception as e:
             self.logger.error(f"Unexpected error during sorting: {e}", exc_info=True)
 
         self._filtered_news = filtered
-        self.logger.info(f"_apply_filters_and_sort: Finished. Final self._filtered_news count: {len(self._filtered_news)}.") # ADDED
+        self.logger.info("_apply_filters_and_sort: Finished. Final self._filtered_news count: %d.", len(self._filtered_news)) # ADDED
 
     # --- 信号处理槽 ---
     @pyqtSlot(str, bool)
@@ -6,6 +6,7 @@ import requests
 import json # Import json for JSONDecodeError handling
 from typing import Dict, Any, Optional, Callable, Iterator, List
 from src.llm.exception import LLMError
+from src.utils import json_utils
 import time # Added for sleep in retry
 
 logger = logging.getLogger('news_analyzer.utils.api_client')
@@ -13,9 +14,38 @@ logger = logging.getLogger('news_analyzer.utils.api_client')
 class ApiClient:
     """封装 HTTP 请求，支持流式和非流式 POST。"""
 
-    def __init__(self):
-        """Initialize the ApiClient with a logger."""
+    def __init__(self, pool_connections: int = 16, pool_maxsize: int = 64):
+        """Initialize the ApiClient with a logger and a pooled keep-alive session.
+
+        所有请求共用同一个 requests.Session，后续请求复用已建立的 TCP/TLS 连接。
+        重试仍由下面各方法自己的循环负责，adapter 不再额外重试。
+        """
         self.logger = logging.getLogger(__name__)
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections,
+                                                pool_maxsize=pool_maxsize)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def close(self):
+        """关闭连接池。"""
+        self._session.close()
+
+    @staticmethod
+    def _encode_json_body(json_payload: Dict[str, Any], headers: Dict[str, str]):
+        """将请求体一次性序列化为 UTF-8 JSON bytes (orjson 可用时使用 orjson)，并确保带有 JSON Content-Type。"""
+        body = json_utils.dumps_bytes(json_payload)
+        if not any(key.lower() == 'content-type' for key in headers):
+            headers = {**headers, 'Content-Type': 'application/json'}
+        return body, headers
+
+    def warm_up(self, url: str, timeout: int = 5):
+        """对 url 发送一次 HEAD 请求以提前建立 TCP/TLS 连接并放入连接池 (失败忽略)。"""
+        try:
+            self._session.head(url, timeout=timeout)
+            self.logger.debug(f"ApiClient: Warmed up connection to {url}")
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"ApiClient: Connection warm-up to {url} failed (ignored): {e}")
 
     def post(self, url: str, headers: Dict[str, str], json_payload: Dict[str, Any], timeout: int, fast_fail_on_status_codes: Optional[List[int]] = None) -> Dict[str, Any]:
         """
@@ -39,6 +69,8 @@ class ApiClient:
         self.logger.debug(f"  Received fast_fail_on_status_codes: {fast_fail_on_status_codes} (Type: {type(fast_fail_on_status_codes)})") # DEBUG LOGGING
 
         last_exception = None
+        # 请求体只序列化一次，重试时复用
+        body, json_headers = self._encode_json_body(json_payload, headers)
         # 重试逻辑现在更通用，特定于429的退避在内部处理
         max_retries = 3
         base_delay = 1  # seconds
@@ -46,10 +78,10 @@ class ApiClient:
         for attempt in range(max_retries + 1):
             try:
                 self.logger.debug(f"ApiClient: Sending POST to {url} (Attempt {attempt + 1}/{max_retries + 1})")
-                response = requests.post(
+                response = self._session.post(
                     url,
-                    headers=headers,
-                    json=json_payload,
+                    headers=json_headers,
+                    data=body,
                     timeout=timeout
                 )
                 self.logger.debug(f"ApiClient: Received status code {response.status_code} from {url}")
@@ -71,7 +103,7 @@ class ApiClient:
                 content_type = response.headers.get('content-type', 'N/A')
                 self.logger.debug(f"ApiClient: Response Content-Type: {content_type}")
                 self.logger.debug("ApiClient: Attempting to parse response as JSON...")
-                json_response = response.json()
+                json_response = json_utils.loads(response.content)
                 self.logger.info("ApiClient: Successfully parsed and returning JSON response.")
                 return json_response
             except requests.exceptions.Timeout as e:
@@ -145,7 +177,7 @@ class ApiClient:
         for attempt in range(max_retries + 1):
             try:
                 self.logger.debug(f"ApiClient: Sending GET to {url} (Attempt {attempt + 1}/{max_retries + 1})")
-                response = requests.get(
+                response = self._session.get(
                     url,
                     headers=headers,
                     params=params,
@@ -218,10 +250,11 @@ class ApiClient:
         # We will add fast-fail for the initial response check.
         try:
             self.logger.debug(f"ApiClient: Sending streaming POST to {url}")
-            response = requests.post(
+            body, json_headers = self._encode_json_body(json_payload, headers)
+            response = self._session.post(
                 url,
-                headers=headers,
-                json=json_payload,
+                headers=json_headers,
+                data=body,
                 stream=True,
                 timeout=timeout
             )
@@ -0,0 +1,34 @@
+# src/utils/json_utils.py
+"""
+JSON 解析的快速路径：安装了 orjson 时使用 orjson，否则回退到标准库 json。
+
+orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，调用方原有的异常处理无需修改。
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """解析 JSON (str 或 bytes)。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """序列化为 UTF-8 编码的 JSON bytes (非 ASCII 字符不转义，一次完成编码)。"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """键排序、紧凑的 UTF-8 JSON bytes：相同内容总得到逐字节相同的结果，用于计算缓存键。"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
@@ -0,0 +1,68 @@
+"""
+令牌桶限流器，用于在发送 LLM 请求前遵守 Provider 的 RPM / TPM 限制。
+"""
+import json
+import threading
+import time
+from typing import Any, Optional
+
+
+class TokenBucket:
+    """按每分钟速率补充的令牌桶 (线程安全)。
+
+    允许透支：令牌不足时先预留，返回需要等待的秒数，调用方睡眠后即可发送，
+    多个并发调用方因此按到达顺序依次排队，而不需要循环重试。
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """预留 amount 个令牌，返回发送前需要等待的秒数 (0 表示可立即发送)。"""
+        with self._lock:
+            now = time.monotonic()
+            self._level = min(self.capacity, self._level + (now - self._updated) * self.rate_per_second)
+            self._updated = now
+            self._level -= amount
+            if self._level >= 0:
+                return 0.0
+            return -self._level / self.rate_per_second
+
+
+class RateLimiter:
+    """组合请求数 (RPM) 与 token 数 (TPM) 两个令牌桶；未设置的维度不做限制。"""
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["RateLimiter"]:
+        """根据配置中的 rpm / tpm 键创建限流器，两者都未配置时返回 None。"""
+        rpm, tpm = config.get('rpm'), config.get('tpm')
+        if not rpm and not tpm:
+            return None
+        return cls(requests_per_minute=rpm, tokens_per_minute=tpm)
+
+    @staticmethod
+    def estimate_tokens(payload: Any) -> int:
+        """粗略估算请求 token 数：UTF-8 字节数 / 4 (中文约 0.75 token/字，英文约 0.25 token/字符)。"""
+        return max(1, len(json.dumps(payload, ensure_ascii=False).encode('utf-8')) // 4)
+
+    def _reserve(self, tokens: int) -> float:
+        wait = 0.0
+        if self._requests is not None:
+            wait = self._requests.reserve(1)
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.reserve(tokens))
+        return wait
+
+    def acquire(self, tokens: int = 1):
+        """阻塞直到允许发送一次消耗约 tokens 个 token 的请求。"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
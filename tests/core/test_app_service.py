@@ -92,4 +92,29 @@ def test_dependency_none_behavior():
     try:
         app_service._load_initial_news()
     except Exception as e:
-        pytest.fail(f"history_service 为 None 时抛异常: {e}") 
\ No newline at end of file
+        pytest.fail(f"history_service 为 None 时抛异常: {e}") 
+
+def test_parse_datetime_fast_paths(mock_dependencies):
+    """测试 ISO / RFC 822 快速路径解析结果统一为 UTC"""
+    from datetime import datetime, timezone
+    app_service = AppService(**mock_dependencies)
+    expected = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc)
+    assert app_service._parse_datetime("2024-05-01T08:30:00Z") == expected
+    assert app_service._parse_datetime("2024-05-01T16:30:00+08:00") == expected
+    assert app_service._parse_datetime("Wed, 01 May 2024 08:30:00 +0000") == expected
+    assert app_service._parse_datetime("") is None
+
+
+def test_parse_datetime_named_zone_not_read_as_us_zone(mock_dependencies):
+    """RSS pubDate 中的 "CST" 不走 RFC 822 快速路径 (否则会被当作美国中部时间 -06:00)，按本地时间处理"""
+    from datetime import datetime, timezone
+    app_service = AppService(**mock_dependencies)
+    cst_date = 'Mon, 01 Jan 2024 08:00:00 CST'
+    assert app_service._fast_parse_datetime_string(cst_date) is None
+    expected_local = datetime(2024, 1, 1, 8, 0, 0).astimezone(timezone.utc)
+    assert app_service._parse_datetime(cst_date) == expected_local
+
+    gmt_date = 'Mon, 01 Jan 2024 08:00:00 GMT'
+    assert app_service._fast_parse_datetime_string(gmt_date) is not None
+    assert app_service._parse_datetime(gmt_date) == datetime(2024, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    assert app_service._parse_datetime('Mon, 01 Jan 2024 08:00:00 +0800') == datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
@@ -23,6 +23,51 @@ def test_is_read_and_mark_as_read(service, mock_storage):
     mock_storage.add_read_item.assert_called_with('link1')
 
 
+def test_is_read_uses_in_memory_read_links(service, mock_storage):
+    """
+    测试已读链接首次查询时一次性加载，之后 is_read / get_read_links 不再访问存储。
+    """
+    mock_storage.get_all_read_links.return_value = {'link1'}
+    assert service.is_read('link1')
+    assert not service.is_read('link2')
+    service.mark_as_read('link2')
+    assert service.is_read('link2')
+    assert service.get_read_links(['link1', 'link2', 'link3']) == {'link1', 'link2'}
+    service.mark_as_unread('link1')
+    assert not service.is_read('link1')
+    mock_storage.get_all_read_links.assert_called_once()
+    mock_storage.is_item_read.assert_not_called()
+
+
+def test_mark_as_read_skips_already_read(service, mock_storage):
+    """
+    测试已读链接加载到内存后，重复标记已读不再写存储。
+    """
+    mock_storage.get_all_read_links.return_value = {'link1'}
+    assert service.is_read('link1')
+    service.mark_as_read('link1')
+    service.mark_as_read('link2')
+    service.mark_as_read('link2')
+    mock_storage.add_read_item.assert_called_once_with('link2')
+
+
+def test_read_links_not_cached_when_load_or_write_fails(service, mock_storage):
+    """
+    测试加载已读链接失败时不缓存空集合，写入失败时不更新内存中的已读集合。
+    """
+    mock_storage.get_all_read_links.return_value = None
+    mock_storage.is_item_read.return_value = True
+    assert service.is_read('link1')
+    assert service._read_links is None
+
+    mock_storage.get_all_read_links.return_value = {'link1'}
+    mock_storage.add_read_item.return_value = False
+    mock_storage.mark_item_as_unread.return_value = False
+    service.mark_as_read('link2')
+    service.mark_as_unread('link1')
+    assert service.get_read_links(['link1', 'link2']) == {'link1'}
+
+
 def test_mark_as_unread(service, mock_storage):
     """
     测试 mark_as_unread 能正确调用存储层。
@@ -180,4 +225,22 @@ def test_remove_history_item_storage_error(service, mock_storage, qtbot):
     mock_storage.delete_browsing_history_item.assert_called_once_with(history_id=456)
     assert not blocker.signal_triggered
     
-# Placeholder for other tests if needed 
\ No newline at end of file
+# Placeholder for other tests if needed 
+
+@patch('src.core.history_service.datetime')
+def test_add_history_item_dedupes_in_memory(mock_dt, service, mock_storage):
+    """60 秒内重复浏览同一文章时，只在首次查询存储，之后用内存中的最近浏览时间去重。"""
+    mock_dt.now.return_value = datetime(2023, 1, 1, 12, 0, 0)
+    mock_storage.get_latest_history_by_article_id.return_value = None
+    mock_storage.add_browsing_history.return_value = 1
+    article = MagicMock(id=7, link='http://example.com/a7')
+
+    service.add_history_item(article)
+    service.add_history_item(article)
+
+    mock_storage.get_latest_history_by_article_id.assert_called_once_with(7)
+    mock_storage.add_browsing_history.assert_called_once()
+
+    mock_dt.now.return_value = datetime(2023, 1, 1, 12, 5, 0)
+    service.add_history_item(article)
+    assert mock_storage.add_browsing_history.call_count == 2
@@ -191,6 +191,48 @@ def test_get_source_by_name(source_manager, mock_storage):
     assert notfound is None
 
 
+def test_source_lookup_follows_rename(source_manager, mock_storage):
+    """
+    测试重命名后按名称/ID 查找立即反映新名称，旧名称不再命中。
+    """
+    mock_storage.add_news_source.return_value = 42
+    source_manager.add_source(NewsSource(name='old_name', type='rss', url='http://rename.com', category='科技'))
+    assert source_manager.get_source_by_name('old_name') is not None
+
+    mock_storage.update_news_source.return_value = True
+    source_manager.update_source('old_name', {'name': 'new_name'})
+    assert source_manager.get_source_by_name('old_name') is None
+    assert source_manager.get_source_by_name('new_name').id == 42
+    assert source_manager.get_source_by_id(42).name == 'new_name'
+
+
+def test_sources_kept_sorted_on_add_and_rename(source_manager, mock_storage):
+    """
+    测试新增和重命名后 news_sources 仍按 (type, name) 有序。
+    """
+    mock_storage.add_news_source.side_effect = [50, 51, 52]
+    mock_storage.update_news_source.return_value = True
+    for name in ('b_src', 'c_src', 'a_src'):
+        source_manager.add_source(NewsSource(name=name, type='rss', url=f'http://{name}.com', category='科技'))
+    assert [s.name for s in source_manager.get_sources()] == ['a_src', 'b_src', 'c_src']
+
+    source_manager.update_source('a_src', {'name': 'd_src'})
+    assert [s.name for s in source_manager.get_sources()] == ['b_src', 'c_src', 'd_src']
+
+
+def test_category_name_map_invalidated_on_change(source_manager, mock_storage):
+    """
+    测试分类名映射被缓存，并在新增/更新源后失效重建。
+    """
+    mock_storage.add_news_source.return_value = 41
+    source_manager.add_source(NewsSource(name='cat_src', type='rss', url='http://cat.com', category='technology'))
+    first_map = source_manager.get_category_name_map()
+    assert 'cat_src' in first_map
+    assert source_manager.get_category_name_map() is first_map  # 命中缓存
+
+    source_manager.update_source('cat_src', {'category': 'finance'}, emit_signal=False)
+    assert source_manager.get_category_name_map() is not first_map
+
 def test_update_nonexistent_source(source_manager, mock_storage):
     """
     测试更新不存在的新闻源不抛异常，且不调用 storage.update_news_source。
@@ -270,3 +270,18 @@ class TestAppService:
         assert len(app_service_instance.all_news) == initial_all_news_count
         mock_news_updated_signal.emit.assert_not_called()
         mock_new_articles_summary_signal.emit.assert_not_called()
+
+    def test_is_cached_unchanged_detects_updated_fields(self, app_service_instance):
+        """已在缓存中的链接，标题/摘要/正文有变化时不能跳过保存"""
+        cached = NewsArticle(title="标题", link="link1", source_name="Test", content="正文", summary="摘要")
+        app_service_instance._set_news_cache([cached])
+        index = app_service_instance._get_cache_index()
+
+        same = NewsArticle(title="标题", link="link1", source_name="Test")
+        assert app_service_instance._is_cached_unchanged(same, index)
+        assert not app_service_instance._is_cached_unchanged(
+            NewsArticle(title="新标题", link="link1", source_name="Test"), index)
+        assert not app_service_instance._is_cached_unchanged(
+            NewsArticle(title="标题", link="link1", source_name="Test", summary="新摘要"), index)
+        assert not app_service_instance._is_cached_unchanged(
+            NewsArticle(title="标题", link="link2", source_name="Test"), index)
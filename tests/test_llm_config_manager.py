@@ -0,0 +1,32 @@
+import sys
+import os
+
+from PySide6.QtCore import QSettings
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from config.llm_config_manager import LLMConfigManager
+
+
+def _manager(tmp_path) -> LLMConfigManager:
+    manager = LLMConfigManager()
+    # 使用临时 ini 文件，避免读写用户真实的 QSettings
+    manager.settings = QSettings(str(tmp_path / "llm.ini"), QSettings.IniFormat)
+    return manager
+
+
+class TestLLMConfigManager:
+    def test_rate_limits_round_trip(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.add_or_update_config("limited", {'provider': 'openai', 'api_url': 'https://api.openai.com/v1/chat/completions',
+                                                 'model': 'gpt-4o-mini', 'rpm': 60, 'tpm': 90000})
+        config = manager.get_config("limited")
+        assert config['rpm'] == 60
+        assert config['tpm'] == 90000
+
+    def test_rate_limits_default_to_unlimited(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.add_or_update_config("plain", {'provider': 'openai', 'api_url': 'https://api.openai.com/v1/chat/completions',
+                                               'model': 'gpt-4o-mini'})
+        config = manager.get_config("plain")
+        assert not config['rpm'] and not config['tpm']
@@ -46,4 +46,101 @@ class TestLLMService:
     def test_close(self, client):
         """测试关闭资源功能"""
         # LLMService没有close方法，测试可以移除或修改
-        pass
\ No newline at end of file
+        pass
+
+    def test_analyze_news_skips_too_short_content(self, client):
+        """测试正文过短的新闻不会发送给 LLM，返回区别于分析结果的提示"""
+        client.provider = MagicMock()
+        with patch('llm.llm_service.LLMResponseFormatter.format_analysis_result') as mock_format:
+            result = client.analyze_news({'title': '标题', 'content': '', 'summary': '短摘要'})
+
+        assert "内容过短，无法分析。" in result
+        mock_format.assert_not_called()
+        client.api_client.post.assert_not_called()
+        client.prompt_manager.get_formatted_prompt.assert_not_called()
+
+    def test_analyze_news_min_chars_is_configurable(self, client):
+        """测试 min_analysis_chars 可调整 (0 表示不跳过)"""
+        client.provider = MagicMock()
+        client.min_analysis_chars = 0
+        with patch.object(client, '_prepare_messages_for_analysis', return_value=[{'role': 'user', 'content': 'x'}]) as mock_prepare, \
+             patch('llm.llm_service.LLMResponseFormatter.format_analysis_result', side_effect=lambda c, t: c):
+            client.provider.parse_response.return_value = "分析"
+            result = client.analyze_news({'title': '标题', 'content': '', 'summary': '短摘要'})
+
+        assert result == "分析"
+        mock_prepare.assert_called_once()
+
+    def test_connection_test_allows_keyless_generic_config(self, client):
+        """测试连接时未填写 API key 的兼容服务仍会发送测试请求，而初始化仍要求 key"""
+        client.api_client.post.return_value = {'choices': []}
+        config = {'name': 'local', 'provider': 'generic', 'api_url': 'http://localhost:8000/v1/chat/completions',
+                  'api_key': '', 'model': 'm'}
+
+        success, _ = client.test_connection_with_config(config)
+
+        assert success
+        client.api_client.post.assert_called_once()
+        assert client._build_provider(config, 'generic') is None
+
+    def test_connection_test_merges_azure_config(self, client):
+        """测试 azure 类型的测试连接会合并 azure_config 到 Provider 配置"""
+        config = {'name': 'az', 'provider': 'azure', 'api_url': 'https://x.openai.azure.com/chat/completions',
+                  'api_key': 'k', 'model': 'gpt', 'azure_config': {'api_version': '2024-02-01'}}
+
+        provider = client._build_provider(config, 'azure', connection_test=True)
+
+        assert provider._get_config_value('api_version') == '2024-02-01'
+        assert client._build_provider(config, 'azure') is None
+
+    def test_semantic_cache_scoped_and_cleared(self, client):
+        """测试语义缓存按模型区分，temperature > 0 时不使用，切换配置或修改模板后清空"""
+        from llm.semantic_cache import SemanticCache
+
+        cache = SemanticCache()
+        service = LLMService(config_manager=client.config_manager, prompt_manager=client.prompt_manager,
+                             api_client=client.api_client, semantic_cache=cache)
+        service.provider = MagicMock(model='m1')
+        service.provider.get_identifier.return_value = 'openai_compatible'
+        service.provider._get_config_value.return_value = 0
+        service.provider.parse_response.return_value = "分析"
+        news = {'title': '央行宣布下调存款准备金率', 'content': '央行今日宣布下调金融机构存款准备金率0.5个百分点' * 2}
+
+        with patch.object(service, '_prepare_messages_for_analysis', return_value=[{'role': 'user', 'content': 'x'}]) as mock_prepare, \
+             patch('llm.llm_service.LLMResponseFormatter.format_analysis_result', side_effect=lambda c, t: c):
+            service.analyze_news(news)
+            service.analyze_news(news)
+            assert mock_prepare.call_count == 1
+            service.provider.model = 'm2'
+            service.analyze_news(news)
+            assert mock_prepare.call_count == 2
+            service.provider._get_config_value.return_value = 0.7
+            service.analyze_news(news)
+            assert mock_prepare.call_count == 3
+            assert len(cache) == 2
+
+        listener = client.prompt_manager.add_change_listener.call_args[0][0]
+        listener('summary')
+        assert len(cache) == 0
+        cache.add('text', 'scope', '<p>结果</p>')
+        service.reload_active_config()
+        assert len(cache) == 0
+
+    def test_stream_chat_emits_chunks_then_finished(self, client):
+        """测试流式聊天：每个 data 行的增量通过 chat_chunk_received 发出，[DONE] 后发出 chat_finished"""
+        from llm.providers.openai import OpenAIProvider
+
+        client.provider = OpenAIProvider('key', 'https://example.com/v1/chat/completions', 'model')
+        client.api_client.stream_post.return_value = iter([
+            'data: {"choices":[{"delta":{"content":"你好"}}]}',
+            'data: [DONE]',
+        ])
+        events = []
+        client.chat_chunk_received.connect(lambda chunk: events.append(('chunk', chunk)))
+        client.chat_finished.connect(lambda text: events.append(('finished', text)))
+        client.chat_error.connect(lambda err: events.append(('error', err)))
+
+        client._stream_chat_response_thread_target([{'role': 'user', 'content': '你好'}])
+
+        client.api_client.stream_post.assert_called_once()
+        assert events == [('chunk', '你好'), ('finished', '你好')]
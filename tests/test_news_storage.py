@@ -73,6 +73,73 @@ class TestNewsStorage:
         assert "http://example.com/1" in links_in_results
         assert "http://example.com/2" in links_in_results
 
+    def test_iter_articles_batches_and_matches_get_all(self, storage):
+        """测试 iter_articles 分批读取的结果与 get_all_articles 一致，且可提前停止"""
+        for i in range(5):
+            storage.upsert_article({
+                "title": f"文章{i}", "link": f"http://example.com/it{i}",
+                "publish_time": f"2024-01-0{i + 1}T00:00:00", "retrieval_time": datetime.now().isoformat()
+            })
+
+        iterated = list(storage.iter_articles(batch_size=2))
+        assert [a["link"] for a in iterated] == [a["link"] for a in storage.get_all_articles()]
+
+        latest = storage.iter_articles(batch_size=2)
+        assert next(latest)["link"] == "http://example.com/it4"
+        latest.close()
+        assert len(storage.get_all_articles()) == 5
+
+    def test_add_browsing_history_requires_existing_article(self, storage):
+        """测试浏览历史只能关联已存在的文章 (由外键约束保证)"""
+        article_id = storage.upsert_article({
+            "title": "历史文章", "link": "http://example.com/h1",
+            "publish_time": datetime.now().isoformat(), "retrieval_time": datetime.now().isoformat()
+        })
+        assert storage.add_browsing_history(article_id) is not None
+        assert storage.add_browsing_history(article_id + 1000) is None
+        assert storage.get_latest_history_by_article_id(article_id) is not None
+
+    def test_existing_db_gets_history_composite_index(self, tmp_path):
+        """测试已存在的数据库在初始化时补建浏览历史复合索引，并删除旧的单列索引"""
+        first = NewsStorage(data_dir=str(tmp_path))
+        first.conn.execute("DROP INDEX idx_browsing_history_article_view_time")
+        first.conn.execute("CREATE INDEX idx_browsing_history_article_id ON browsing_history (article_id)")
+        first.conn.commit()
+        first.close()
+
+        reopened = NewsStorage(data_dir=str(tmp_path))
+        indexes = {row[0] for row in reopened.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'browsing_history'")}
+        reopened.close()
+        assert "idx_browsing_history_article_view_time" in indexes
+        assert "idx_browsing_history_article_id" not in indexes
+
+    def test_get_read_links(self, storage):
+        """测试批量查询已读链接"""
+        for i in range(3):
+            storage.upsert_article({
+                "title": f"文章{i}", "link": f"http://example.com/r{i}",
+                "publish_time": datetime.now().isoformat(), "retrieval_time": datetime.now().isoformat()
+            })
+        storage.add_read_item("http://example.com/r1")
+
+        links = ["http://example.com/r0", "http://example.com/r1", "http://example.com/missing", ""]
+        assert storage.get_read_links(links) == {"http://example.com/r1"}
+        assert storage.get_read_links([]) == set()
+
+    def test_read_status_survives_upsert(self, storage):
+        """测试重新 upsert 已读文章不会重置已读状态"""
+        article_data = {
+            "title": "已读文章", "link": "http://example.com/sticky",
+            "publish_time": datetime.now().isoformat(), "retrieval_time": datetime.now().isoformat()
+        }
+        storage.upsert_article(dict(article_data))
+        storage.add_read_item(article_data["link"])
+        storage.upsert_article(dict(article_data, title="已读文章(更新)"))
+
+        assert storage.is_item_read(article_data["link"])
+        assert storage.get_all_read_links() == {article_data["link"]}
+
     def test_close(self, storage):
         """测试关闭资源功能"""
         # 调用实际的 close 方法
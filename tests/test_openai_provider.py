@@ -0,0 +1,26 @@
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from llm.providers.openai import OpenAIProvider
+
+
+def _data(text: str, space: str = " ") -> str:
+    return f'data:{space}{{"choices":[{{"delta":{{"content":"{text}"}}}}]}}'
+
+
+class TestOpenAIStreamParsing:
+    def setup_method(self):
+        self.provider = OpenAIProvider('key', 'https://example.com/v1/chat/completions', 'model')
+
+    def test_single_line_bytes_and_str(self):
+        assert self.provider.process_stream_line(_data('你好').encode('utf-8')) == ('你好', False)
+        assert self.provider.process_stream_line(_data('hi', space='')) == ('hi', False)
+        assert self.provider.process_stream_line(b'data: [DONE]') == (None, True)
+        assert self.provider.process_stream_line(b': keep-alive') == (None, False)
+
+    def test_multiple_events_in_one_chunk(self):
+        chunk = f"{_data('a')}\r\n\r\n{_data('b', space='')}\n\n: ping\n\nevent: x\n{_data('c')}\n\ndata: [DONE]\n\n"
+        assert self.provider.process_stream_line(chunk.encode('utf-8')) == ('abc', True)
+        assert self.provider.process_stream_line(f"{_data('a')}\n\n{_data('b')}") == ('ab', False)
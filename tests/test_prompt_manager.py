@@ -0,0 +1,53 @@
+import sys
+import os
+import pytest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from llm.prompt_manager import PromptManager
+
+
+class TestPromptManagerTemplateCache:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        (tmp_path / 'prompts').mkdir()
+        (tmp_path / 'prompts' / 'summary.txt').write_text('摘要: {title}', encoding='utf-8')
+        return PromptManager(base_dir=str(tmp_path))
+
+    def test_template_is_read_once(self, manager):
+        assert manager.load_template('summary') == '摘要: {title}'
+        os.remove(os.path.join(manager.prompts_dir, 'summary.txt'))
+        assert manager.load_template('summary') == '摘要: {title}'
+
+    def test_templates_preloaded_at_init(self, manager):
+        os.remove(os.path.join(manager.prompts_dir, 'summary.txt'))
+        assert manager.load_template('summary') == '摘要: {title}'
+
+    def test_save_and_invalidate_refresh_cache(self, manager):
+        assert manager.load_template('missing') is None
+        assert manager.save_prompt_content('missing', '新模板')
+        assert manager.load_template('missing') == '新模板'
+
+        assert manager.load_template('summary') == '摘要: {title}'
+        with open(os.path.join(manager.prompts_dir, 'summary.txt'), 'w', encoding='utf-8') as f:
+            f.write('外部修改')
+        assert manager.load_template('summary') == '摘要: {title}'
+        manager.invalidate('summary.txt')
+        assert manager.load_template('summary') == '外部修改'
+
+    def test_change_listeners_notified_on_save(self, manager):
+        changed = []
+        manager.add_change_listener(changed.append)
+        assert manager.save_prompt_content('summary', '新摘要模板')
+        manager.invalidate()
+        assert changed == ['summary', None]
+
+
+class TestPromptManagerFormatting:
+    def test_fallback_keys_skip_missing_and_none(self, tmp_path):
+        manager = PromptManager(base_dir=str(tmp_path))
+        prompt = manager.get_formatted_prompt(None, {'title': '标题', 'content': None, 'summary': '摘要内容',
+                                                     'source': '来源', 'publish_time': None}, '未知类型')
+        assert '新闻来源: 来源' in prompt
+        assert '发布日期: 未知日期' in prompt
+        assert prompt.endswith('摘要内容')
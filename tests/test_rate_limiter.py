@@ -0,0 +1,27 @@
+import sys
+import os
+import pytest
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from utils.rate_limiter import TokenBucket, RateLimiter
+
+
+class TestRateLimiter:
+    def test_bucket_reserves_and_queues(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        # 第三个请求透支 1 个令牌，按 1 令牌/秒 需要约 1 秒
+        assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+        # 再下一个排在其后
+        assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_from_config(self):
+        assert RateLimiter.from_config({'name': 'x'}) is None
+        assert RateLimiter.from_config({'rpm': 30}) is not None
+
+    def test_estimate_tokens(self):
+        assert RateLimiter.estimate_tokens([]) == 1
+        messages = [{'role': 'user', 'content': '新闻' * 100}]
+        assert RateLimiter.estimate_tokens(messages) > 100
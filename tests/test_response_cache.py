@@ -0,0 +1,53 @@
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from llm.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_key_is_stable_and_payload_sensitive(self):
+        msgs = [{'role': 'user', 'content': '总结这篇新闻'}]
+        key = ResponseCache.make_key('openai_compatible', 'http://x', 'm', 0, 2048, msgs)
+        assert key == ResponseCache.make_key('openai_compatible', 'http://x', 'm', 0, 2048, list(msgs))
+        assert key != ResponseCache.make_key('openai_compatible', 'http://x', 'm2', 0, 2048, msgs)
+        assert key != ResponseCache.make_key('openai_compatible', 'http://x', 'm', 0, 256, msgs)
+        assert key != ResponseCache.make_key('openai_compatible', 'http://x', 'm', 0, 2048,
+                                             [{'role': 'user', 'content': '翻译这篇新闻'}])
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put('a', '1')
+        cache.put('b', '2')
+        assert cache.get('a') == '1'  # a 变为最近使用
+        cache.put('c', '3')
+        assert cache.get('b') is None
+        assert cache.get('a') == '1'
+        assert cache.get('c') == '3'
+
+    def test_temperature_gate(self):
+        assert ResponseCache().is_cacheable(0)
+        assert ResponseCache().is_cacheable(None)
+        assert not ResponseCache().is_cacheable(0.7)
+        assert ResponseCache(allow_nonzero_temperature=True).is_cacheable(0.7)
+
+    def test_sqlite_persistence(self, tmp_path):
+        db_path = str(tmp_path / 'llm_cache.db')
+        ResponseCache(db_path=db_path).put('k', '结果')
+        assert ResponseCache(db_path=db_path).get('k') == '结果'
+
+    def test_sqlite_keeps_only_latest_rows(self, tmp_path):
+        db_path = str(tmp_path / 'llm_cache.db')
+        cache = ResponseCache(db_path=db_path, max_db_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, key.upper())
+        reopened = ResponseCache(db_path=db_path)
+        assert reopened.get('a') is None
+        assert reopened.get('b') == 'B'
+        assert reopened.get('c') == 'C'
+
+    def test_key_ignores_extra_message_fields(self):
+        msgs = [{'role': 'user', 'content': '总结这篇新闻'}]
+        reordered = [{'content': '总结这篇新闻', 'role': 'user', 'timestamp': 123}]
+        assert ResponseCache.make_key('p', 'http://x', 'm', 0, None, msgs) == ResponseCache.make_key('p', 'http://x', 'm', 0, None, reordered)
@@ -0,0 +1,29 @@
+import sys
+import os
+import numpy as np
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from llm.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    def test_near_duplicate_hits_same_type_only(self):
+        cache = SemanticCache(threshold=0.9)
+        cache.add("央行宣布下调存款准备金率0.5个百分点\n央行今日宣布下调金融机构存款准备金率", '摘要', '<p>摘要结果</p>')
+
+        assert cache.lookup("央行宣布下调存款准备金率0.5个百分点\n央行今天宣布下调金融机构存款准备金率", '摘要') == '<p>摘要结果</p>'
+        assert cache.lookup("央行宣布下调存款准备金率0.5个百分点\n央行今天宣布下调金融机构存款准备金率", '深度分析') is None
+        assert cache.lookup("国足世界杯预选赛客场战平对手", '摘要') is None
+
+    def test_fifo_eviction(self):
+        vectors = {'a': [1.0, 0.0, 0.0], 'b': [0.0, 1.0, 0.0], 'c': [0.0, 0.0, 1.0]}
+        cache = SemanticCache(embedder=lambda text: np.array(vectors[text]), max_entries=2)
+        cache.add('a', '摘要', 'A')
+        cache.add('b', '摘要', 'B')
+        cache.add('c', '摘要', 'C')
+
+        assert len(cache) == 2
+        assert cache.lookup('a', '摘要') is None
+        assert cache.lookup('b', '摘要') == 'B'
+        assert cache.lookup('c', '摘要') == 'C'
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from PySide6.QtCore import Qt
+from datetime import datetime, timezone
 
 from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel
 from src.models import NewsItem
@@ -78,6 +79,26 @@ def test_search_news(mock_app_service, sample_news_list):
     vm.search_news("不存在", "标题和内容")
     assert len(vm.newsList) == 0, f"搜索'不存在'后列表应为空, 实际长度: {len(vm.newsList)}"
 
+    # 多个关键词按 AND 组合，可分别命中标题与内容
+    vm.search_news("新闻a 内容a", "标题和内容")
+    assert [n.link for n in vm.newsList] == ["a"]
+    vm.search_news("新闻a 内容b", "标题和内容")
+    assert len(vm.newsList) == 0
+
+
+
+def test_search_within_small_candidate_set(mock_app_service):
+    """测试候选很少时逐条在候选区间内查找，结果与全量扫描一致且不会跨条目命中"""
+    news = [NewsItem(title=f"标题{i}", link=str(i), source_name="源", content=f"内容{i}",
+                     category="科技" if i < 2 else "财经") for i in range(20)]
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._all_news = news
+    vm._current_category = "科技"
+    vm.search_news("标题1", "标题和内容")
+    assert [n.link for n in vm.newsList] == ["1"]
+    vm.search_news("0标题", "标题和内容") # 跨越条目边界的文本不算命中
+    assert vm.newsList == []
+
 
 def test_sort_news(mock_app_service, sample_news_list):
     """测试排序功能"""
@@ -93,6 +114,21 @@ def test_sort_news(mock_app_service, sample_news_list):
     assert titles_desc == sorted(titles, reverse=True)
 
 
+def test_sort_news_by_publish_time(mock_app_service):
+    """测试按发布时间排序：naive 视为 UTC，缺失发布时间的新闻排在最早"""
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._all_news = [
+        NewsItem(title="无时间", link="none", source_name="源", category="科技", publish_time=None),
+        NewsItem(title="旧", link="old", source_name="源", category="科技", publish_time=datetime(2024, 1, 1)),
+        NewsItem(title="新", link="new", source_name="源", category="科技",
+                 publish_time=datetime(2024, 1, 2, tzinfo=timezone.utc)),
+    ]
+    vm.sort_news("publish_time", Qt.DescendingOrder)
+    assert [n.link for n in vm.newsList] == ["new", "old", "none"]
+    vm.sort_news("publish_time", Qt.AscendingOrder)
+    assert [n.link for n in vm.newsList] == ["none", "old", "new"]
+
+
 def test_mark_as_read_and_is_read(mock_app_service, sample_news_list):
     """测试已读状态相关方法"""
     vm = NewsListViewModel(app_service=mock_app_service)
@@ -100,6 +136,8 @@ def test_mark_as_read_and_is_read(mock_app_service, sample_news_list):
     link = sample_news_list[0].link
     vm.mark_as_read(link)
     mock_app_service.history_service.mark_as_read.assert_called_with(link)
+    assert sample_news_list[0].is_read is True
+    assert sample_news_list[1].is_read is False
     # 测试 is_read 调用
     vm.is_read(link)
     mock_app_service.history_service.is_read.assert_called_with(link)
@@ -183,6 +221,26 @@ def test_history_service_none(sample_news_list):
         pytest.fail(f"history_service 为 None 时抛异常: {e}")
 
 
+def test_filter_by_days_uses_publish_time(mock_app_service):
+    """测试按天数过滤：无发布时间的新闻被排除，索引随 _all_news 替换而重建"""
+    from datetime import datetime, timedelta, timezone
+    now = datetime.now(timezone.utc)
+    news = [
+        NewsItem(title="新", link="n", source_name="源", category="科技", publish_time=now - timedelta(days=1)),
+        NewsItem(title="旧", link="o", source_name="源", category="科技", publish_time=now - timedelta(days=30)),
+        NewsItem(title="无时间", link="x", source_name="源", category="科技", publish_time=None),
+    ]
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._all_news = news
+    vm.filter_by_days(7)
+    assert [n.link for n in vm.newsList] == ["n"]
+
+    vm._all_news = news + [NewsItem(title="新2", link="n2", source_name="源", category="科技",
+                                    publish_time=(now - timedelta(hours=1)).replace(tzinfo=None))]
+    vm.filter_by_days(7)
+    assert sorted(n.link for n in vm.newsList) == ["n", "n2"]
+
+
 def is_read(self, link: str) -> bool:
     """检查新闻是否已读 (通过 HistoryService)"""
     if self._history_service is None: